@@ -105,8 +105,8 @@ class FastFlightsClient:
                 "Please try again tomorrow."
             )
 
+    @staticmethod
     def _build_query(
-        self,
         origin: str,
         destination: str,
         departure_date: str,
@@ -1003,7 +1003,8 @@ class SkiplaggedClient:
         )
         return result, pagination
 
-    def _normalize_hotel(self, data: dict[str, Any]) -> HotelSearchHotel | None:
+    @staticmethod
+    def _normalize_hotel(data: dict[str, Any]) -> HotelSearchHotel | None:
         """Normalize a single Skiplagged hotel dict to HotelSearchHotel."""
         price_data = data.get("price", {})
         price_amount_raw = price_data.get("amount")
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import JSON, Column, ForeignKey, Text
+from sqlalchemy import JSON, Column, ForeignKey, Index, Text
 from sqlalchemy.sql import func
 from sqlmodel import DateTime, Field, SQLModel
 
@@ -24,6 +24,11 @@ class Message(SQLModel, table=True):
     """
 
     __tablename__ = "messages"
+    # Serves the "first message of a role" lookups used for title generation
+    # (see app.services.conversation.fetch_title_context) as an index seek.
+    __table_args__ = (
+        Index("ix_messages_conv_role_created", "conversation_id", "role", "created_at"),
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     conversation_id: uuid.UUID = Field(
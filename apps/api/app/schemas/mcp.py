@@ -8,14 +8,18 @@ This module defines:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolResult:
     """Result returned from MCP tool execution.
 
+    Frozen so constant results can be built once and shared.
+
     Attributes:
         success: Whether the tool execution succeeded.
         data: The result data if successful, or None on failure.
@@ -363,8 +367,9 @@ SEARCH_HOTELS_TOOL = _make_tool(
 # Complete Tool Registry
 # =============================================================================
 
-# All available MCP tools in OpenAI function-calling format
-MCP_TOOLS: list[dict[str, Any]] = [
+# All available MCP tools in OpenAI function-calling format. Immutable so it can
+# be handed out directly instead of copied per request.
+MCP_TOOLS: tuple[dict[str, Any], ...] = (
     CREATE_TRIP_TOOL,
     LIST_TRIPS_TOOL,
     GET_TRIP_DETAILS_TOOL,
@@ -376,12 +381,12 @@ MCP_TOOLS: list[dict[str, Any]] = [
     DELETE_TRIP_TOOL,
     SEARCH_FLIGHTS_TOOL,
     SEARCH_HOTELS_TOOL,
-]
+)
 
-# Tool name to schema mapping for validation
-TOOL_SCHEMAS: dict[str, dict[str, Any]] = {
-    tool["function"]["name"]: tool["function"]["parameters"] for tool in MCP_TOOLS
-}
+# Tool name to schema mapping for validation (read-only view)
+TOOL_SCHEMAS: Mapping[str, dict[str, Any]] = MappingProxyType(
+    {tool["function"]["name"]: tool["function"]["parameters"] for tool in MCP_TOOLS}
+)
 
 
 def get_tool_schema(tool_name: str) -> dict[str, Any] | None:
@@ -396,10 +401,10 @@ def get_tool_schema(tool_name: str) -> dict[str, Any] | None:
     return TOOL_SCHEMAS.get(tool_name)
 
 
-def get_all_tools() -> list[dict[str, Any]]:
+def get_all_tools() -> tuple[dict[str, Any], ...]:
     """Get all available MCP tools in OpenAI format.
 
     Returns:
-        List of tool definitions.
+        Shared, immutable tuple of tool definitions.
     """
-    return MCP_TOOLS.copy()
+    return MCP_TOOLS
@@ -14,7 +14,7 @@ from __future__ import annotations
 import json
 import logging
 import uuid
-from collections import Counter
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any
 
 from app.clients.groq import (
@@ -40,9 +40,8 @@ from app.services.conversation import (
     ConversationService,
     conversation_service,
     enforce_conversation_limit,
+    fetch_title_context,
     generate_title,
-    get_first_exchange,
-    should_generate_title,
     update_conversation_title,
 )
 from app.services.mcp_router import MCPRouter, ToolResult, get_mcp_router
@@ -84,13 +83,19 @@ class ToolRetryTracker:
     This prevents the LLM from getting stuck in a loop calling the same tool.
     """
 
+    __slots__ = ("_counts", "_exceeded", "_max_retries")
+
     def __init__(self, max_retries: int = MAX_TOOL_RETRIES) -> None:
         """Initialize the tracker.
 
         Args:
             max_retries: Maximum times a tool can be called per turn.
         """
-        self._counts: Counter[str] = Counter()
+        # defaultdict so the first increment for a tool skips Counter's
+        # Python-level __missing__; reads use .get() so they never insert.
+        self._counts: defaultdict[str, int] = defaultdict(int)
+        # Tools at or over the limit, maintained as calls are recorded.
+        self._exceeded: set[str] = set()
         self._max_retries = max_retries
 
     def record_call(self, tool_name: str) -> None:
@@ -100,6 +105,8 @@ class ToolRetryTracker:
             tool_name: Name of the tool being called.
         """
         self._counts[tool_name] += 1
+        if self._counts[tool_name] >= self._max_retries:
+            self._exceeded.add(tool_name)
 
     def is_exceeded(self, tool_name: str) -> bool:
         """Check if tool has exceeded retry limit.
@@ -110,7 +117,7 @@ class ToolRetryTracker:
         Returns:
             True if tool has been called more than max_retries times.
         """
-        return self._counts[tool_name] >= self._max_retries
+        return self._max_retries <= 0 or tool_name in self._exceeded
 
     def get_count(self, tool_name: str) -> int:
         """Get current call count for a tool.
@@ -121,19 +128,20 @@ class ToolRetryTracker:
         Returns:
             Number of times the tool has been called.
         """
-        return self._counts[tool_name]
+        return self._counts.get(tool_name, 0)
 
     def get_exceeded_tools(self) -> list[str]:
         """Get list of tools that have exceeded their retry limit.
 
         Returns:
-            List of tool names that hit the limit.
+            List of tool names that hit the limit, in first-call order.
         """
-        return [name for name, count in self._counts.items() if count >= self._max_retries]
+        return [name for name in self._counts if name in self._exceeded]
 
     def reset(self) -> None:
         """Reset all counters."""
         self._counts.clear()
+        self._exceeded.clear()
 
 
 def _get_rate_limit_error_message(error: GroqRateLimitError) -> str:
@@ -859,12 +867,11 @@ class ChatService:
             db: Database session.
         """
         try:
-            if not await should_generate_title(conversation_id, db):
-                return
-
-            user_message, assistant_response = await get_first_exchange(
+            title, user_message, assistant_response = await fetch_title_context(
                 conversation_id, db
             )
+            if title is not None:
+                return
 
             if not user_message or not assistant_response:
                 logger.debug(
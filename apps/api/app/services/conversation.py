@@ -379,8 +379,9 @@ def _generate_fallback_title(user_message: str) -> str:
     Returns:
         A truncated version of the user message as the title.
     """
-    # Take first few words of the user message
-    words = user_message.split()[:6]
+    # Take first few words of the user message. The bounded split stops after
+    # the sixth word instead of tokenizing the whole (possibly long) message.
+    words = user_message.split(None, 6)[:6]
     title = " ".join(words)
     if len(title) > 50:
         title = title[:47] + "..."
@@ -412,84 +413,47 @@ async def update_conversation_title(
     return result.rowcount > 0
 
 
-async def should_generate_title(
+async def fetch_title_context(
     conversation_id: uuid.UUID,
     db: AsyncSession,
-) -> bool:
-    """Check if a conversation needs a title generated.
+) -> tuple[str | None, str | None, str | None]:
+    """Fetch everything title generation needs in a single query.
 
-    A title should be generated when:
-    - The conversation has no title (title is None)
-    - The conversation has at least 1 user message and 1 assistant message
+    Returns the current title alongside the first user message and first
+    assistant response, so the chat flow can decide whether to generate a
+    title and proceed without a second round trip.
 
     Args:
-        conversation_id: UUID of the conversation to check.
+        conversation_id: UUID of the conversation.
         db: Database session.
 
     Returns:
-        True if a title should be generated, False otherwise.
+        Tuple of (title, first_user_message, first_assistant_response).
+        All three are None if the conversation does not exist.
     """
-    # First check if conversation already has a title
-    conv_result = await db.execute(
-        select(Conversation.title).where(Conversation.id == conversation_id)
-    )
-    title = conv_result.scalar_one_or_none()
-    if title is not None:
-        return False
-
-    # Check message counts
-    user_count_result = await db.execute(
-        select(func.count())
-        .where(Message.conversation_id == conversation_id)
-        .where(Message.role == "user")
-    )
-    user_count = user_count_result.scalar_one()
-
-    assistant_count_result = await db.execute(
-        select(func.count())
-        .where(Message.conversation_id == conversation_id)
-        .where(Message.role == "assistant")
-    )
-    assistant_count = assistant_count_result.scalar_one()
-
-    return user_count >= 1 and assistant_count >= 1
-
-
-async def get_first_exchange(
-    conversation_id: uuid.UUID,
-    db: AsyncSession,
-) -> tuple[str | None, str | None]:
-    """Get the first user message and first assistant response.
 
-    Args:
-        conversation_id: UUID of the conversation.
-        db: Database session.
+    def first_content(role: str):
+        return (
+            select(Message.content)
+            .where(Message.conversation_id == Conversation.id)
+            .where(Message.role == role)
+            .order_by(Message.created_at.asc())
+            .limit(1)
+            .correlate(Conversation)
+            .scalar_subquery()
+        )
 
-    Returns:
-        Tuple of (first_user_message, first_assistant_response).
-        Either may be None if not found.
-    """
-    # Get first user message
-    user_result = await db.execute(
-        select(Message.content)
-        .where(Message.conversation_id == conversation_id)
-        .where(Message.role == "user")
-        .order_by(Message.created_at.asc())
-        .limit(1)
-    )
-    user_message = user_result.scalar_one_or_none()
-
-    # Get first assistant message
-    assistant_result = await db.execute(
-        select(Message.content)
-        .where(Message.conversation_id == conversation_id)
-        .where(Message.role == "assistant")
-        .order_by(Message.created_at.asc())
-        .limit(1)
+    result = await db.execute(
+        select(
+            Conversation.title,
+            first_content("user").label("user_message"),
+            first_content("assistant").label("assistant_response"),
+        ).where(Conversation.id == conversation_id)
     )
-    assistant_response = assistant_result.scalar_one_or_none()
-
-    return user_message, assistant_response
+    row = result.one_or_none()
+    if row is None:
+        return None, None, None
+    return row.title, row.user_message, row.assistant_response
 
 
 # =============================================================================
@@ -26,10 +26,12 @@ import logging
 import re
 import uuid
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Protocol, runtime_checkable
 
 from app.core.telemetry import langfuse_context, observe
-from app.schemas.mcp import ToolResult, get_tool_schema
+from app.schemas.mcp import TOOL_SCHEMAS, ToolResult
 from app.services.audit_log import audit_logger
 
 logger = logging.getLogger(__name__)
@@ -87,36 +89,65 @@ class ToolHandler(Protocol):
 # Type alias for simple function-based handlers
 ToolFunction = Callable[[dict[str, Any], str, Any], Awaitable[ToolResult]]
 
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
-def _check_type_match(value: Any, expected_type: str) -> bool:
-    """Check if a value matches the expected JSON schema type."""
-    if expected_type == "string":
-        return isinstance(value, str)
-    if expected_type == "integer":
-        return isinstance(value, int) and not isinstance(value, bool)
-    if expected_type == "number":
-        return isinstance(value, (int, float)) and not isinstance(value, bool)
-    if expected_type == "boolean":
-        return isinstance(value, bool)
-    if expected_type == "array":
-        return isinstance(value, list)
-    if expected_type == "object":
-        return isinstance(value, dict)
-    if expected_type == "null":
-        return value is None
-    return False
+# Shared result for tool arguments that are not a JSON object
+_NON_OBJECT_ARGS_RESULT = ToolResult(
+    success=False,
+    error="Tool arguments must be a JSON object",
+)
+
+# Compiled schema "pattern" regexes, keyed by pattern string
+_pattern_cache: dict[str, re.Pattern[str]] = {}
+
+
+def _compiled_pattern(pattern: str) -> re.Pattern[str]:
+    """Get the compiled regex for a schema pattern, compiling it once."""
+    compiled = _pattern_cache.get(pattern)
+    if compiled is None:
+        compiled = _pattern_cache[pattern] = re.compile(pattern)
+    return compiled
+
+
+# Key under which compiled property schemas carry their enum as a frozenset.
+# The original "enum" list is kept for error messages and the LLM-facing schema.
+_ENUM_SET_KEY = "_enum_set"
+
+# JSON schema type -> predicate for a value of that type. bool is a subclass of
+# int in Python, so the numeric checks exclude it explicitly.
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "array": lambda value: isinstance(value, list),
+    "object": lambda value: isinstance(value, dict),
+    "null": lambda value: value is None,
+}
+
+
+@lru_cache(maxsize=256)
+def _is_valid_uuid(value: str) -> bool:
+    """Check whether a string parses as a UUID.
+
+    Bounded cache: the same trip ids recur across tool calls and retries, but
+    values come from LLM output and must not grow memory without limit.
+    """
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
 
 
 def _validate_string_format(value: str, fmt: str, path: str) -> list[str]:
     """Validate string format constraints."""
     errors: list[str] = []
     if fmt == "uuid":
-        try:
-            uuid.UUID(value)
-        except ValueError:
+        if not _is_valid_uuid(value):
             errors.append(f"{path}: must be a valid UUID")
     elif fmt == "date":
-        if not re.match(r"^\d{4}-\d{2}-\d{2}$", value):
+        if not _DATE_RE.match(value):
             errors.append(f"{path}: must be a valid date (YYYY-MM-DD)")
     return errors
 
@@ -128,9 +159,9 @@ def _validate_string(value: str, schema: dict[str, Any], path: str) -> list[str]
         errors.append(f"{path}: length must be >= {schema['minLength']}")
     if "maxLength" in schema and len(value) > schema["maxLength"]:
         errors.append(f"{path}: length must be <= {schema['maxLength']}")
-    if "pattern" in schema and not re.match(schema["pattern"], value):
+    if "pattern" in schema and not _compiled_pattern(schema["pattern"]).match(value):
         errors.append(f"{path}: must match pattern {schema['pattern']}")
-    if "enum" in schema and value not in schema["enum"]:
+    if "enum" in schema and value not in schema.get(_ENUM_SET_KEY, schema["enum"]):
         errors.append(f"{path}: must be one of {schema['enum']}")
     if "format" in schema:
         errors.extend(_validate_string_format(value, schema["format"], path))
@@ -147,6 +178,29 @@ def _validate_number(value: int | float, schema: dict[str, Any], path: str) -> l
     return errors
 
 
+def _validate_array(value: list[Any], schema: dict[str, Any], path: str) -> list[str]:
+    """Validate each array item against the items schema."""
+    errors: list[str] = []
+    items_schema = schema.get("items", {})
+    for i, item in enumerate(value):
+        errors.extend(_validate_type(item, items_schema, f"{path}[{i}]"))
+    return errors
+
+
+def _no_constraints(value: Any, schema: dict[str, Any], path: str) -> list[str]:
+    """Types with no constraints beyond the type match itself."""
+    return []
+
+
+# JSON schema type -> validator for its type-specific constraints
+_TYPE_VALIDATORS: dict[str, Callable[[Any, dict[str, Any], str], list[str]]] = {
+    "string": _validate_string,
+    "integer": _validate_number,
+    "number": _validate_number,
+    "array": _validate_array,
+}
+
+
 def _validate_type(value: Any, schema: dict[str, Any], path: str) -> list[str]:
     """Validate a value against a JSON schema type.
 
@@ -162,23 +216,68 @@ def _validate_type(value: Any, schema: dict[str, Any], path: str) -> list[str]:
     if expected_type is None:
         return []
 
-    # Check type match
-    if not _check_type_match(value, expected_type):
+    # Check type match (unknown types never match)
+    type_check = _TYPE_CHECKS.get(expected_type)
+    if type_check is None or not type_check(value):
         return [f"{path}: expected {expected_type}, got {type(value).__name__}"]
 
-    # Type-specific validations
-    if expected_type == "string":
-        return _validate_string(value, schema, path)
-    if expected_type in ("integer", "number"):
-        return _validate_number(value, schema, path)
-    if expected_type == "array":
-        errors: list[str] = []
-        items_schema = schema.get("items", {})
-        for i, item in enumerate(value):
-            errors.extend(_validate_type(item, items_schema, f"{path}[{i}]"))
+    return _TYPE_VALIDATORS.get(expected_type, _no_constraints)(value, schema, path)
+
+
+def _compile_property(schema: dict[str, Any]) -> dict[str, Any]:
+    """Prepare a property schema for validation, adding an enum frozenset if needed."""
+    if "enum" not in schema:
+        return schema
+    return {**schema, _ENUM_SET_KEY: frozenset(schema["enum"])}
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledSchema:
+    """A tool's parameter schema, pre-digested for argument validation.
+
+    Built once per tool so the required list and property schemas are read as
+    attributes rather than re-derived from the nested schema dict on every call.
+    Properties with an enum are copied to also hold the values as a frozenset.
+    """
+
+    required: tuple[str, ...]
+    properties: dict[str, dict[str, Any]]
+
+    @classmethod
+    def from_schema(cls, schema: dict[str, Any]) -> CompiledSchema:
+        """Compile a tool's JSON parameter schema."""
+        return cls(
+            required=tuple(schema.get("required", [])),
+            properties={
+                name: _compile_property(prop) for name, prop in schema.get("properties", {}).items()
+            },
+        )
+
+    def validate(self, args: dict[str, Any]) -> list[str]:
+        """Validate arguments, returning error messages (empty if valid)."""
+        errors = [
+            f"Missing required parameter: {name}" for name in self.required if name not in args
+        ]
+        properties = self.properties
+        for param_name, param_value in args.items():
+            param_schema = properties.get(param_name)
+            if param_schema is None:
+                # Unknown parameters are ignored (not an error)
+                continue
+            errors.extend(_validate_type(param_value, param_schema, param_name))
         return errors
 
-    return []
+
+# Compiled schemas per tool, built once at import. A single probe of this dict
+# both answers "does the tool have a schema" and fetches its compiled form.
+_compiled_schemas: dict[str, CompiledSchema] = {
+    name: CompiledSchema.from_schema(schema) for name, schema in TOOL_SCHEMAS.items()
+}
+
+
+def _get_compiled_schema(tool_name: str) -> CompiledSchema | None:
+    """Get the compiled schema for a tool, or None if it has no schema."""
+    return _compiled_schemas.get(tool_name)
 
 
 def validate_tool_args(tool_name: str, args: dict[str, Any]) -> None:
@@ -192,29 +291,11 @@ def validate_tool_args(tool_name: str, args: dict[str, Any]) -> None:
         ToolNotFoundError: If the tool is not registered.
         ToolValidationError: If arguments fail validation.
     """
-    schema = get_tool_schema(tool_name)
-    if schema is None:
+    compiled = _get_compiled_schema(tool_name)
+    if compiled is None:
         raise ToolNotFoundError(tool_name)
 
-    errors: list[str] = []
-
-    # Check required parameters
-    required = schema.get("required", [])
-    properties = schema.get("properties", {})
-
-    for param_name in required:
-        if param_name not in args:
-            errors.append(f"Missing required parameter: {param_name}")
-
-    # Validate provided parameters
-    for param_name, param_value in args.items():
-        if param_name not in properties:
-            # Unknown parameters are ignored (not an error)
-            continue
-
-        param_schema = properties[param_name]
-        errors.extend(_validate_type(param_value, param_schema, param_name))
-
+    errors = compiled.validate(args)
     if errors:
         raise ToolValidationError(
             f"Invalid arguments for tool '{tool_name}'",
@@ -237,6 +318,8 @@ class MCPRouter:
         result = await router.execute("list_trips", {}, user_id="...")
     """
 
+    __slots__ = ("_tools",)
+
     def __init__(self) -> None:
         """Initialize the MCP router with an empty tool registry."""
         self._tools: dict[str, ToolHandler | ToolFunction] = {}
@@ -487,10 +570,7 @@ class MCPRouter:
             arguments = {}
 
         if not isinstance(arguments, dict):
-            return ToolResult(
-                success=False,
-                error="Tool arguments must be a JSON object",
-            )
+            return _NON_OBJECT_ARGS_RESULT
 
         return await self.execute(tool_name, arguments, user_id, db)
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 import logging
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -130,6 +131,9 @@ TRAVEL_KEYWORDS = frozenset(
     }
 )
 
+# Word tokenizer for keyword matching (equivalent to \b\w+\b)
+_WORD_RE = re.compile(r"\w+")
+
 # Patterns that strongly indicate non-travel requests
 NON_TRAVEL_PATTERNS = [
     # Database/system operations
@@ -153,11 +157,25 @@ NON_TRAVEL_PATTERNS = [
 # Compiled regex patterns for efficiency
 _NON_TRAVEL_COMPILED = [re.compile(pattern, re.IGNORECASE) for pattern in NON_TRAVEL_PATTERNS]
 
+# Simple greetings and acknowledgments, allowed even without travel keywords
+SIMPLE_QUERY_PATTERNS = [
+    r"^(hi|hello|hey|greetings|good\s+(morning|afternoon|evening))[\s!.,]*$",
+    r"^(thanks|thank\s+you|ok|okay|sure|yes|no|bye|goodbye)[\s!.,]*$",
+    r"^(help|what\s+can\s+you\s+do|how\s+do\s+you\s+work)[\s!?.,]*$",
+]
+
+# One anchored alternation over all simple-query patterns, matched in a single call
+_SIMPLE_QUERY_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in SIMPLE_QUERY_PATTERNS), re.IGNORECASE
+)
 
-@dataclass
+
+@dataclass(frozen=True)
 class QueryValidationResult:
     """Result of query validation.
 
+    Frozen so cached results can be shared between callers.
+
     Attributes:
         is_valid: Whether the query is within scope.
         reason: Explanation if query is not valid.
@@ -174,15 +192,13 @@ def _normalize_query(query: str) -> str:
     return query.lower().strip()
 
 
-def _contains_travel_keywords(query: str) -> tuple[bool, int]:
-    """Check if query contains travel-related keywords.
+def _contains_travel_keywords(normalized: str) -> tuple[bool, int]:
+    """Check if a normalized query contains travel-related keywords.
 
     Returns:
         Tuple of (has_keywords, keyword_count).
     """
-    normalized = _normalize_query(query)
-    words = set(re.findall(r"\b\w+\b", normalized))
-    matches = words & TRAVEL_KEYWORDS
+    matches = TRAVEL_KEYWORDS.intersection(_WORD_RE.findall(normalized))
     return len(matches) > 0, len(matches)
 
 
@@ -198,61 +214,51 @@ def _matches_non_travel_pattern(query: str) -> tuple[bool, str | None]:
     return False, None
 
 
-def _is_greeting_or_simple(query: str) -> bool:
-    """Check if query is a simple greeting or acknowledgment.
+def _is_greeting_or_simple(normalized: str) -> bool:
+    """Check if a normalized query is a simple greeting or acknowledgment.
 
     These should be allowed even without travel keywords.
     """
-    simple_patterns = [
-        r"^(hi|hello|hey|greetings|good\s+(morning|afternoon|evening))[\s!.,]*$",
-        r"^(thanks|thank\s+you|ok|okay|sure|yes|no|bye|goodbye)[\s!.,]*$",
-        r"^(help|what\s+can\s+you\s+do|how\s+do\s+you\s+work)[\s!?.,]*$",
-    ]
-    normalized = _normalize_query(query)
-    for pattern in simple_patterns:
-        if re.match(pattern, normalized, re.IGNORECASE):
-            return True
-    return False
+    return _SIMPLE_QUERY_RE.match(normalized) is not None
 
 
-def validate_query(query: str) -> QueryValidationResult:
-    """Validate if a query is within the travel assistant's scope.
+_EMPTY_RESULT = QueryValidationResult(
+    is_valid=False,
+    reason="Empty query provided.",
+    confidence=1.0,
+)
+_REJECTED_RESULT = QueryValidationResult(
+    is_valid=False,
+    reason="This request is outside my scope as a travel assistant.",
+    confidence=0.95,
+)
+_SIMPLE_RESULT = QueryValidationResult(is_valid=True, confidence=1.0)
+_SHORT_CONTEXTUAL_RESULT = QueryValidationResult(is_valid=True, confidence=0.5)
+_OFF_TOPIC_RESULT = QueryValidationResult(
+    is_valid=True,
+    reason="Query may be off-topic but allowing LLM to respond.",
+    confidence=0.3,
+)
 
-    Args:
-        query: The user's query text.
 
-    Returns:
-        QueryValidationResult indicating if the query is valid.
-    """
-    if not query or not query.strip():
-        return QueryValidationResult(
-            is_valid=False,
-            reason="Empty query provided.",
-            confidence=1.0,
-        )
+@lru_cache(maxsize=512)
+def _classify_query(normalized: str) -> tuple[QueryValidationResult, str | None]:
+    """Classify a normalized, non-empty query.
 
-    normalized = _normalize_query(query)
+    Pure and cached: greetings and short follow-ups repeat often. Logging is
+    left to validate_query so every rejected query is still logged.
 
+    Returns:
+        Tuple of (result, matched non-travel pattern or None).
+    """
     # Check for explicitly malicious/non-travel patterns first
     matches_non_travel, matched_pattern = _matches_non_travel_pattern(normalized)
     if matches_non_travel:
-        logger.warning(
-            "Query matched non-travel pattern: %s",
-            matched_pattern,
-            extra={"event": "query_validator.rejected"},
-        )
-        return QueryValidationResult(
-            is_valid=False,
-            reason="This request is outside my scope as a travel assistant.",
-            confidence=0.95,
-        )
+        return _REJECTED_RESULT, matched_pattern
 
     # Allow simple greetings and help requests
     if _is_greeting_or_simple(normalized):
-        return QueryValidationResult(
-            is_valid=True,
-            confidence=1.0,
-        )
+        return _SIMPLE_RESULT, None
 
     # Check for travel-related keywords
     has_travel_keywords, keyword_count = _contains_travel_keywords(normalized)
@@ -260,32 +266,46 @@ def validate_query(query: str) -> QueryValidationResult:
     if has_travel_keywords:
         # More keywords = higher confidence
         confidence = min(0.7 + (keyword_count * 0.1), 1.0)
-        return QueryValidationResult(
-            is_valid=True,
-            confidence=confidence,
-        )
+        return QueryValidationResult(is_valid=True, confidence=confidence), None
 
     # Short queries without travel keywords might still be contextual follow-ups
     # Allow them but with lower confidence
     if len(normalized.split()) <= 5:
-        return QueryValidationResult(
-            is_valid=True,
-            confidence=0.5,
-        )
+        return _SHORT_CONTEXTUAL_RESULT, None
 
     # Longer queries without any travel context are likely off-topic
     # But we'll still allow them and let the LLM handle the response
     # The system prompt will guide it to redirect non-travel queries
-    logger.info(
-        "Query has no travel keywords but allowing: %s",
-        query[:50],
-        extra={"event": "query_validator.allowed_no_keywords"},
-    )
-    return QueryValidationResult(
-        is_valid=True,
-        reason="Query may be off-topic but allowing LLM to respond.",
-        confidence=0.3,
-    )
+    return _OFF_TOPIC_RESULT, None
+
+
+def validate_query(query: str) -> QueryValidationResult:
+    """Validate if a query is within the travel assistant's scope.
+
+    Args:
+        query: The user's query text.
+
+    Returns:
+        QueryValidationResult indicating if the query is valid.
+    """
+    if not query or not query.strip():
+        return _EMPTY_RESULT
+
+    result, matched_pattern = _classify_query(_normalize_query(query))
+
+    if matched_pattern is not None:
+        logger.warning(
+            "Query matched non-travel pattern: %s",
+            matched_pattern,
+            extra={"event": "query_validator.rejected"},
+        )
+    elif result is _OFF_TOPIC_RESULT:
+        logger.info(
+            "Query has no travel keywords but allowing: %s",
+            query[:50],
+            extra={"event": "query_validator.allowed_no_keywords"},
+        )
+    return result
 
 
 def is_query_in_scope(query: str) -> bool:
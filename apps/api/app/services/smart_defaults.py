@@ -12,9 +12,11 @@ from __future__ import annotations
 import logging
 import re
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from sqlalchemy import Select
     from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
@@ -39,89 +41,96 @@ DURATION_PATTERNS = [
     (r"\bfortnight\b", 14),
 ]
 
+# Compiled once at import; matching is case-insensitive, so callers need not
+# lowercase the text first.
+_DURATION_COMPILED = [
+    (re.compile(pattern, re.IGNORECASE), fixed_days) for pattern, fixed_days in DURATION_PATTERNS
+]
+
 # Airport codes for major cities (sorted by airport importance)
 # This is a simplified mapping - in production, use an airport database
-CITY_AIRPORTS: dict[str, list[str]] = {
+# Tuples so the table can't be mutated through a returned value
+CITY_AIRPORTS: dict[str, tuple[str, ...]] = {
     # US Cities
-    "san francisco": ["SFO", "OAK", "SJC"],
-    "sf": ["SFO", "OAK", "SJC"],
-    "bay area": ["SFO", "OAK", "SJC"],
-    "oakland": ["OAK", "SFO", "SJC"],
-    "san jose": ["SJC", "SFO", "OAK"],
-    "los angeles": ["LAX", "BUR", "SNA", "ONT", "LGB"],
-    "la": ["LAX", "BUR", "SNA", "ONT", "LGB"],
-    "new york": ["JFK", "EWR", "LGA"],
-    "nyc": ["JFK", "EWR", "LGA"],
-    "new york city": ["JFK", "EWR", "LGA"],
-    "manhattan": ["JFK", "LGA", "EWR"],
-    "chicago": ["ORD", "MDW"],
-    "miami": ["MIA", "FLL"],
-    "boston": ["BOS"],
-    "seattle": ["SEA"],
-    "denver": ["DEN"],
-    "atlanta": ["ATL"],
-    "dallas": ["DFW", "DAL"],
-    "houston": ["IAH", "HOU"],
-    "phoenix": ["PHX"],
-    "las vegas": ["LAS"],
-    "vegas": ["LAS"],
-    "orlando": ["MCO", "SFB"],
-    "washington": ["DCA", "IAD", "BWI"],
-    "dc": ["DCA", "IAD", "BWI"],
-    "washington dc": ["DCA", "IAD", "BWI"],
-    "honolulu": ["HNL"],
-    "hawaii": ["HNL", "OGG", "LIH", "KOA"],
-    "maui": ["OGG"],
-    "kauai": ["LIH"],
-    "big island": ["KOA"],
-    "san diego": ["SAN"],
-    "austin": ["AUS"],
-    "portland": ["PDX"],
-    "minneapolis": ["MSP"],
-    "detroit": ["DTW"],
-    "philadelphia": ["PHL"],
-    "charlotte": ["CLT"],
-    "salt lake city": ["SLC"],
-    "tampa": ["TPA"],
-    "anchorage": ["ANC"],
-    "alaska": ["ANC", "FAI"],
+    "san francisco": ("SFO", "OAK", "SJC"),
+    "sf": ("SFO", "OAK", "SJC"),
+    "bay area": ("SFO", "OAK", "SJC"),
+    "oakland": ("OAK", "SFO", "SJC"),
+    "san jose": ("SJC", "SFO", "OAK"),
+    "los angeles": ("LAX", "BUR", "SNA", "ONT", "LGB"),
+    "la": ("LAX", "BUR", "SNA", "ONT", "LGB"),
+    "new york": ("JFK", "EWR", "LGA"),
+    "nyc": ("JFK", "EWR", "LGA"),
+    "new york city": ("JFK", "EWR", "LGA"),
+    "manhattan": ("JFK", "LGA", "EWR"),
+    "chicago": ("ORD", "MDW"),
+    "miami": ("MIA", "FLL"),
+    "boston": ("BOS",),
+    "seattle": ("SEA",),
+    "denver": ("DEN",),
+    "atlanta": ("ATL",),
+    "dallas": ("DFW", "DAL"),
+    "houston": ("IAH", "HOU"),
+    "phoenix": ("PHX",),
+    "las vegas": ("LAS",),
+    "vegas": ("LAS",),
+    "orlando": ("MCO", "SFB"),
+    "washington": ("DCA", "IAD", "BWI"),
+    "dc": ("DCA", "IAD", "BWI"),
+    "washington dc": ("DCA", "IAD", "BWI"),
+    "honolulu": ("HNL",),
+    "hawaii": ("HNL", "OGG", "LIH", "KOA"),
+    "maui": ("OGG",),
+    "kauai": ("LIH",),
+    "big island": ("KOA",),
+    "san diego": ("SAN",),
+    "austin": ("AUS",),
+    "portland": ("PDX",),
+    "minneapolis": ("MSP",),
+    "detroit": ("DTW",),
+    "philadelphia": ("PHL",),
+    "charlotte": ("CLT",),
+    "salt lake city": ("SLC",),
+    "tampa": ("TPA",),
+    "anchorage": ("ANC",),
+    "alaska": ("ANC", "FAI"),
     # International Cities
-    "london": ["LHR", "LGW", "STN"],
-    "paris": ["CDG", "ORY"],
-    "tokyo": ["NRT", "HND"],
-    "rome": ["FCO", "CIA"],
-    "amsterdam": ["AMS"],
-    "barcelona": ["BCN"],
-    "madrid": ["MAD"],
-    "dublin": ["DUB"],
-    "frankfurt": ["FRA"],
-    "munich": ["MUC"],
-    "zurich": ["ZRH"],
-    "geneva": ["GVA"],
-    "sydney": ["SYD"],
-    "melbourne": ["MEL"],
-    "auckland": ["AKL"],
-    "singapore": ["SIN"],
-    "hong kong": ["HKG"],
-    "bangkok": ["BKK"],
-    "dubai": ["DXB"],
-    "cancun": ["CUN"],
-    "mexico city": ["MEX"],
-    "toronto": ["YYZ"],
-    "vancouver": ["YVR"],
-    "montreal": ["YUL"],
-    "lisbon": ["LIS"],
-    "athens": ["ATH"],
-    "istanbul": ["IST"],
-    "cairo": ["CAI"],
-    "cape town": ["CPT"],
-    "rio de janeiro": ["GIG"],
-    "sao paulo": ["GRU"],
-    "buenos aires": ["EZE"],
-    "lima": ["LIM"],
-    "bogota": ["BOG"],
-    "reykjavik": ["KEF"],
-    "iceland": ["KEF"],
+    "london": ("LHR", "LGW", "STN"),
+    "paris": ("CDG", "ORY"),
+    "tokyo": ("NRT", "HND"),
+    "rome": ("FCO", "CIA"),
+    "amsterdam": ("AMS",),
+    "barcelona": ("BCN",),
+    "madrid": ("MAD",),
+    "dublin": ("DUB",),
+    "frankfurt": ("FRA",),
+    "munich": ("MUC",),
+    "zurich": ("ZRH",),
+    "geneva": ("GVA",),
+    "sydney": ("SYD",),
+    "melbourne": ("MEL",),
+    "auckland": ("AKL",),
+    "singapore": ("SIN",),
+    "hong kong": ("HKG",),
+    "bangkok": ("BKK",),
+    "dubai": ("DXB",),
+    "cancun": ("CUN",),
+    "mexico city": ("MEX",),
+    "toronto": ("YYZ",),
+    "vancouver": ("YVR",),
+    "montreal": ("YUL",),
+    "lisbon": ("LIS",),
+    "athens": ("ATH",),
+    "istanbul": ("IST",),
+    "cairo": ("CAI",),
+    "cape town": ("CPT",),
+    "rio de janeiro": ("GIG",),
+    "sao paulo": ("GRU",),
+    "buenos aires": ("EZE",),
+    "lima": ("LIM",),
+    "bogota": ("BOG",),
+    "reykjavik": ("KEF",),
+    "iceland": ("KEF",),
 }
 
 # Default threshold percentage (recommend 10% below current price)
@@ -148,6 +157,22 @@ def _calculate_days_from_match(match: re.Match, pattern: str, fixed_days: int |
     return num  # Days
 
 
+def _match_duration(text: str) -> tuple[int, str] | None:
+    """Find the first duration pattern in text that yields a day count.
+
+    Returns:
+        Tuple of (days, matched pattern), or None if no duration found.
+    """
+    for compiled, fixed_days in _DURATION_COMPILED:
+        match = compiled.search(text)
+        if not match:
+            continue
+        days = _calculate_days_from_match(match, compiled.pattern, fixed_days)
+        if days is not None:
+            return days, compiled.pattern
+    return None
+
+
 def infer_return_date(description: str, depart_date: date) -> date | None:
     """Infer return date from a natural language trip description.
 
@@ -170,34 +195,39 @@ def infer_return_date(description: str, depart_date: date) -> date | None:
         >>> infer_return_date("long weekend in Vegas", date(2026, 3, 15))
         datetime.date(2026, 3, 19)
     """
-    description_lower = description.lower()
-
-    for pattern, fixed_days in DURATION_PATTERNS:
-        match = re.search(pattern, description_lower, re.IGNORECASE)
-        if not match:
-            continue
-
-        days = _calculate_days_from_match(match, pattern, fixed_days)
-        if days is None:
-            continue
-
+    matched = _match_duration(description)
+    if matched is None:
         logger.debug(
-            "Inferred %d days from '%s' (matched pattern: %s)",
-            days,
+            "No duration pattern found in: '%s'",
             description,
-            pattern,
-            extra={
-                "event": "smart_defaults.return_date.inferred",
-                "count": days,
-            },
+            extra={"event": "smart_defaults.return_date.no_match"},
         )
-        return depart_date + timedelta(days=days)
+        return None
 
+    days, pattern = matched
     logger.debug(
-        "No duration pattern found in: '%s'",
+        "Inferred %d days from '%s' (matched pattern: %s)",
+        days,
         description,
-        extra={"event": "smart_defaults.return_date.no_match"},
+        pattern,
+        extra={
+            "event": "smart_defaults.return_date.inferred",
+            "count": days,
+        },
     )
+    return depart_date + timedelta(days=days)
+
+
+@lru_cache(maxsize=256)
+def _partial_match_city(normalized: str) -> str | None:
+    """Find the first city whose name contains, or is contained in, the query.
+
+    Cached because the scan walks the whole table for misses, and the same few
+    city names recur across a conversation.
+    """
+    for city in CITY_AIRPORTS:
+        if normalized in city or city in normalized:
+            return city
     return None
 
 
@@ -224,12 +254,12 @@ def suggest_airports(city_name: str) -> list[str]:
 
     # Direct match
     if normalized in CITY_AIRPORTS:
-        return CITY_AIRPORTS[normalized].copy()
+        return list(CITY_AIRPORTS[normalized])
 
     # Partial match (city name contains the query)
-    for city, airports in CITY_AIRPORTS.items():
-        if normalized in city or city in normalized:
-            return airports.copy()
+    city = _partial_match_city(normalized)
+    if city is not None:
+        return list(CITY_AIRPORTS[city])
 
     logger.debug(
         "No airports found for city: '%s'",
@@ -269,8 +299,9 @@ def recommend_threshold(current_price: float, percentage: float | None = None) -
     # Calculate discounted price
     discounted = current_price * (1 - percentage)
 
-    # Round to nearest $10
-    rounded = round(discounted / 10) * 10
+    # Round to nearest $10 (ties to even, as round() does). Rounding to -1
+    # digits directly skips the divide and multiply by 10.
+    rounded = round(discounted, -1)
 
     logger.debug(
         "Recommend threshold: $%.2f -> $%.2f (%.0f%% below, rounded)",
@@ -287,6 +318,24 @@ def recommend_threshold(current_price: float, percentage: float | None = None) -
     return float(rounded)
 
 
+@lru_cache(maxsize=1)
+def _default_adults_stmt() -> Select:
+    """Build the most-recent-trip adults query once, with the user id as a bind param.
+
+    Built lazily so importing this module doesn't pull in the ORM models.
+    """
+    from sqlalchemy import bindparam, select
+
+    from app.models.trip import Trip
+
+    return (
+        select(Trip.adults)
+        .where(Trip.user_id == bindparam("user_id"))
+        .order_by(Trip.created_at.desc())
+        .limit(1)
+    )
+
+
 async def get_default_adults(user_id: str, db: AsyncSession) -> int:
     """Get default number of adults from user's most recent trip.
 
@@ -302,10 +351,6 @@ async def get_default_adults(user_id: str, db: AsyncSession) -> int:
     """
     from uuid import UUID
 
-    from sqlalchemy import select
-
-    from app.models.trip import Trip
-
     try:
         user_uuid = UUID(user_id)
     except ValueError:
@@ -317,9 +362,7 @@ async def get_default_adults(user_id: str, db: AsyncSession) -> int:
         return DEFAULT_ADULTS
 
     # Get most recent trip for this user
-    result = await db.execute(
-        select(Trip.adults).where(Trip.user_id == user_uuid).order_by(Trip.created_at.desc()).limit(1)
-    )
+    result = await db.execute(_default_adults_stmt(), {"user_id": user_uuid})
     row = result.scalars().first()
 
     if row is not None:
@@ -365,17 +408,8 @@ def parse_trip_duration_text(text: str) -> int | None:
         >>> parse_trip_duration_text("no duration here")
         None
     """
-    text_lower = text.lower()
-
-    for pattern, fixed_days in DURATION_PATTERNS:
-        match = re.search(pattern, text_lower, re.IGNORECASE)
-        if not match:
-            continue
-        days = _calculate_days_from_match(match, pattern, fixed_days)
-        if days is not None:
-            return days
-
-    return None
+    matched = _match_duration(text)
+    return matched[0] if matched is not None else None
 
 
 class SmartDefaults:
@@ -385,6 +419,8 @@ class SmartDefaults:
     injection and testing.
     """
 
+    __slots__ = ("_db",)
+
     def __init__(self, db: AsyncSession | None = None) -> None:
         """Initialize with optional database session.
 
@@ -393,15 +429,18 @@ class SmartDefaults:
         """
         self._db = db
 
-    def infer_return_date(self, description: str, depart_date: date) -> date | None:
+    @staticmethod
+    def infer_return_date(description: str, depart_date: date) -> date | None:
         """Infer return date from description. See module-level function."""
         return infer_return_date(description, depart_date)
 
-    def suggest_airports(self, city_name: str) -> list[str]:
+    @staticmethod
+    def suggest_airports(city_name: str) -> list[str]:
         """Suggest airports for city. See module-level function."""
         return suggest_airports(city_name)
 
-    def recommend_threshold(self, current_price: float, percentage: float | None = None) -> float:
+    @staticmethod
+    def recommend_threshold(current_price: float, percentage: float | None = None) -> float:
         """Recommend threshold price. See module-level function."""
         return recommend_threshold(current_price, percentage)
 
@@ -411,6 +450,7 @@ class SmartDefaults:
             return DEFAULT_ADULTS
         return await get_default_adults(user_id, self._db)
 
-    def parse_duration(self, text: str) -> int | None:
+    @staticmethod
+    def parse_duration(text: str) -> int | None:
         """Parse duration from text. See module-level parse_trip_duration_text."""
         return parse_trip_duration_text(text)
@@ -0,0 +1,33 @@
+"""Add a composite (conversation_id, role, created_at) index on messages.
+
+Title generation looks up the first user and the first assistant message of a
+conversation (``fetch_title_context``). With only the
+single-column ``conversation_id`` and ``created_at`` indexes, each lookup reads
+every message in the conversation and sorts them; the composite index turns it
+into an ordered seek that stops at the first row.
+
+Revision ID: 014_messages_conv_role_idx
+Revises: 013_enum_cols_to_varchar
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "014_messages_conv_role_idx"
+down_revision: str | None = "013_enum_cols_to_varchar"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_messages_conv_role_created",
+        "messages",
+        ["conversation_id", "role", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_messages_conv_role_created", table_name="messages")
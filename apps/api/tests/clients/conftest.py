@@ -0,0 +1,34 @@
+"""Shared fixtures for the external API client tests."""
+
+import socket
+
+import pytest
+
+_INET_FAMILIES = (socket.AF_INET, socket.AF_INET6)
+
+
+@pytest.fixture(autouse=True)
+def _no_network(monkeypatch):
+    """Fail fast if a client test reaches for a real host.
+
+    Every HTTP call in these tests is patched; a missed patch should error
+    immediately rather than hang until the upstream API times out. Only
+    INET connects are blocked so the event loop's local socketpair still works.
+    """
+    real_connect = socket.socket.connect
+    real_connect_ex = socket.socket.connect_ex
+
+    def _guard(sock, address):
+        if sock.family in _INET_FAMILIES:
+            raise RuntimeError(f"Network access blocked in client tests: {address!r}")
+
+    def guarded_connect(sock, address):
+        _guard(sock, address)
+        return real_connect(sock, address)
+
+    def guarded_connect_ex(sock, address):
+        _guard(sock, address)
+        return real_connect_ex(sock, address)
+
+    monkeypatch.setattr(socket.socket, "connect", guarded_connect)
+    monkeypatch.setattr(socket.socket, "connect_ex", guarded_connect_ex)
@@ -0,0 +1,41 @@
+"""Shared stand-ins for the client tests: httpx fakes, sleep and budget stubs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class FakeResponse:
+    payload: dict
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> dict:
+        return self.payload
+
+
+class NoopAsyncClient:
+    """Accepts any constructor arguments and works as ``async with`` target.
+
+    Subclasses add the request methods the client under test calls.
+    """
+
+    def __init__(self, *_args, **_kwargs) -> None:
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        return None
+
+
+async def no_sleep(_delay: float) -> None:
+    """Stands in for asyncio.sleep so retry backoff doesn't wait."""
+
+
+async def over_budget(*_args, **_kwargs) -> tuple[bool, int]:
+    """Stands in for incr_and_check_global_budget with the ceiling already hit."""
+    return False, 50_001
@@ -4,45 +4,36 @@ import pytest
 from app.clients import axiom_query as aq
 from app.clients.axiom_query import query_count
 
+from tests.clients.http_fakes import FakeResponse, NoopAsyncClient
 
-class _FakeResponse:
-    def __init__(self, payload: dict) -> None:
-        self._payload = payload
 
-    def raise_for_status(self) -> None:
-        return None
-
-    def json(self) -> dict:
-        return self._payload
-
-
-class _FakeAsyncClient:
+class _FakeAsyncClient(NoopAsyncClient):
     payload: dict = {"tables": [{"columns": [[7]]}]}
 
-    def __init__(self, *_args, **_kwargs) -> None:
-        pass
+    async def post(self, _url, json, headers):
+        return FakeResponse(_FakeAsyncClient.payload)
 
-    async def __aenter__(self):
-        return self
 
-    async def __aexit__(self, *_exc):
-        return None
+@pytest.fixture
+def set_settings(monkeypatch):
+    """Override several Axiom settings in one call."""
 
-    async def post(self, _url, json, headers):
-        return _FakeResponse(_FakeAsyncClient.payload)
+    def _apply(**overrides) -> None:
+        for name, value in overrides.items():
+            monkeypatch.setattr(aq.settings, name, value)
+
+    return _apply
 
 
 @pytest.mark.asyncio
-async def test_query_count_disabled_returns_none(monkeypatch):
-    monkeypatch.setattr(aq.settings, "axiom_query_token", "")
+async def test_query_count_disabled_returns_none(set_settings):
+    set_settings(axiom_query_token="")
     assert await query_count("['ds'] | count") is None
 
 
 @pytest.mark.asyncio
-async def test_query_count_parses_tabular(monkeypatch):
-    monkeypatch.setattr(aq.settings, "axiom_query_token", "tok")
-    monkeypatch.setattr(aq.settings, "axiom_org_id", "org")
-    monkeypatch.setattr(aq.settings, "axiom_dataset", "ds")
+async def test_query_count_parses_tabular(monkeypatch, set_settings):
+    set_settings(axiom_query_token="tok", axiom_org_id="org", axiom_dataset="ds")
     monkeypatch.setattr(aq.httpx, "AsyncClient", _FakeAsyncClient)
 
     assert await query_count("['ds'] | count") == 7
@@ -56,10 +47,8 @@ async def test_query_count_parses_tabular(monkeypatch):
         {"tables": [{"columns": [["not-a-number"]]}]},  # non-numeric cell
     ],
 )
-async def test_query_count_unexpected_shape_returns_none(monkeypatch, payload):
-    monkeypatch.setattr(aq.settings, "axiom_query_token", "tok")
-    monkeypatch.setattr(aq.settings, "axiom_org_id", "org")
-    monkeypatch.setattr(aq.settings, "axiom_dataset", "ds")
+async def test_query_count_unexpected_shape_returns_none(monkeypatch, set_settings, payload):
+    set_settings(axiom_query_token="tok", axiom_org_id="org", axiom_dataset="ds")
     monkeypatch.setattr(_FakeAsyncClient, "payload", payload)
     monkeypatch.setattr(aq.httpx, "AsyncClient", _FakeAsyncClient)
 
@@ -5,35 +5,17 @@ import pytest
 from app.clients import email as email_module
 from app.clients.email import EmailConfigError, EmailSendError, ResendClient
 
+from tests.clients.http_fakes import FakeResponse, NoopAsyncClient
 
-class _FakeResponse:
-    def __init__(self, payload: dict) -> None:
-        self._payload = payload
 
-    def raise_for_status(self) -> None:
-        return None
-
-    def json(self) -> dict:
-        return self._payload
-
-
-class _FakeAsyncClient:
+class _FakeAsyncClient(NoopAsyncClient):
     """Stands in for httpx.AsyncClient; records the POST it receives."""
 
     last_call: dict = {}
 
-    def __init__(self, *_args, **_kwargs) -> None:
-        pass
-
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, *_exc):
-        return None
-
     async def post(self, url, json, headers):
         _FakeAsyncClient.last_call = {"url": url, "json": json, "headers": headers}
-        return _FakeResponse({"id": "email-123"})
+        return FakeResponse({"id": "email-123"})
 
 
 @pytest.mark.asyncio
@@ -11,8 +11,11 @@ from app.clients.fast_flights import (
     FastFlightsTransientError,
     _apply_sort,
 )
+from app.core.errors import GlobalBudgetExceeded
+from app.schemas.flight_search import FlightSearchFlight
 
 from tests.clients.ff_fixtures import error_page_html, itin_array, page_html, seg_array
+from tests.clients.http_fakes import over_budget
 
 
 def _client() -> FastFlightsClient:
@@ -62,7 +65,7 @@ RETURN_PAGE = page_html(best=[
 
 class TestQueryConstruction:
     def test_one_way_query(self):
-        query = _client()._build_query("sfo", "lax", "2026-09-15", None, 1, None, None)
+        query = FastFlightsClient._build_query("sfo", "lax", "2026-09-15", None, 1, None, None)
         assert query.get_trip_type() == "one-way"
         assert query.get_seat_type() == "economy"
         assert len(query.flight_data) == 1
@@ -72,7 +75,7 @@ class TestQueryConstruction:
         assert leg.to_airport.airport == "LAX"
 
     def test_round_trip_query_reverses_second_leg(self):
-        query = _client()._build_query(
+        query = FastFlightsClient._build_query(
             "SFO", "CDG", "2026-09-15", "2026-09-22", 2, "none", "business"
         )
         assert query.get_trip_type() == "round-trip"
@@ -88,13 +91,13 @@ class TestQueryConstruction:
         assert inbound.max_stops == 0
 
     def test_max_stops_one_and_many(self):
-        query = _client()._build_query("SFO", "LAX", "2026-09-15", None, 1, "one", None)
+        query = FastFlightsClient._build_query("SFO", "LAX", "2026-09-15", None, 1, "one", None)
         assert query.flight_data[0].max_stops == 1
-        query = _client()._build_query("SFO", "LAX", "2026-09-15", None, 1, "many", None)
+        query = FastFlightsClient._build_query("SFO", "LAX", "2026-09-15", None, 1, "many", None)
         assert not query.flight_data[0].HasField("max_stops")
 
     def test_unknown_cabin_defaults_to_economy(self):
-        query = _client()._build_query("SFO", "LAX", "2026-09-15", None, 1, None, "suite")
+        query = FastFlightsClient._build_query("SFO", "LAX", "2026-09-15", None, 1, None, "suite")
         assert query.get_seat_type() == "economy"
 
 
@@ -260,11 +263,9 @@ class TestSearchFlights:
 
     @pytest.mark.asyncio
     async def test_global_budget_exceeded_propagates(self):
-        from app.core.errors import GlobalBudgetExceeded
-
         with patch(
             "app.clients.fast_flights.incr_and_check_global_budget",
-            new=AsyncMock(return_value=(False, 50_001)),
+            new=over_budget,
         ):
             with pytest.raises(GlobalBudgetExceeded):
                 await _client().search_flights("SFO", "LAX", "2026-09-15")
@@ -383,8 +384,6 @@ class TestReturnOptions:
 
     @pytest.mark.asyncio
     async def test_budget_breaker_on_return_query_propagates(self):
-        from app.core.errors import GlobalBudgetExceeded
-
         outbound_page = page_html(best=[_as_direct(1585)])
         budget = AsyncMock(side_effect=[(True, 1), (False, 50_001)])
         client = _client()
@@ -400,8 +399,6 @@ class TestReturnOptions:
 
 class TestHelpers:
     def test_apply_sort_value_keeps_order_and_duration_sorts(self):
-        from app.schemas.flight_search import FlightSearchFlight
-
         def flight(duration):
             return FlightSearchFlight(
                 departure_airport="SFO",
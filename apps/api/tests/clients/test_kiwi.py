@@ -17,8 +17,12 @@ from app.clients.kiwi import (
     KiwiTransientError,
     _apply_max_stops,
     _apply_sort,
+    _flight_fingerprint,
     _to_kiwi_date,
 )
+from app.core.errors import GlobalBudgetExceeded
+
+from tests.clients.http_fakes import no_sleep, over_budget
 
 
 def _make_sse_response(data: dict, status_code: int = 200, headers: dict | None = None) -> httpx.Response:
@@ -267,7 +271,7 @@ class TestKiwiFlightSearch:
         mock_post = AsyncMock(side_effect=[_search_response([ua]), _search_response([as_])])
         patcher = _patched_client(mock_post)
         try:
-            with patch("app.clients.kiwi.asyncio.sleep", AsyncMock()):
+            with patch("app.clients.kiwi.asyncio.sleep", no_sleep):
                 result = await client.search_flights_all("SFO", "RDM", "2026-08-22")
         finally:
             patcher.stop()
@@ -287,7 +291,7 @@ class TestKiwiFlightSearch:
         )
         patcher = _patched_client(mock_post)
         try:
-            with patch("app.clients.kiwi.asyncio.sleep", AsyncMock()):
+            with patch("app.clients.kiwi.asyncio.sleep", no_sleep):
                 result = await client.search_flights_all("SFO", "RDM", "2026-08-22")
         finally:
             patcher.stop()
@@ -324,7 +328,7 @@ class TestKiwiFlightSearch:
         mock_post = AsyncMock(side_effect=[empty, full])
         patcher = _patched_client(mock_post)
         try:
-            with patch("app.clients.kiwi.asyncio.sleep", AsyncMock()):
+            with patch("app.clients.kiwi.asyncio.sleep", no_sleep):
                 result = await client.search_flights_all("SFO", "RDM", "2026-08-22")
         finally:
             patcher.stop()
@@ -338,7 +342,7 @@ class TestKiwiFlightSearch:
         mock_post = AsyncMock(return_value=_search_response([]))
         patcher = _patched_client(mock_post)
         try:
-            with patch("app.clients.kiwi.asyncio.sleep", AsyncMock()):
+            with patch("app.clients.kiwi.asyncio.sleep", no_sleep):
                 result = await client.search_flights_all("SFO", "RDM", "2026-08-22")
         finally:
             patcher.stop()
@@ -359,16 +363,12 @@ class TestKiwiFlightSearch:
 
 class TestFlightFingerprint:
     def test_fingerprints_segments_across_both_legs(self):
-        from app.clients.kiwi import _flight_fingerprint
-
         flight = KiwiClient._normalize_itinerary(_itinerary(), "USD")
         fp = _flight_fingerprint(flight)
         assert "outbound:AS-AS3361@2026-08-22T16:28:00" in fp
         assert "inbound:AS-AS3360@" in fp
 
     def test_falls_back_to_endpoints_without_segments(self):
-        from app.clients.kiwi import _flight_fingerprint
-
         flight = KiwiClient._normalize_itinerary(
             {"price": 100, "outbound": {"from": "SFO", "to": "RDM", "departureTime": "2026-08-22T10:00:00"}},
             "USD",
@@ -452,7 +452,7 @@ class TestKiwiTransportErrors:
         )
         patcher = _patched_client(mock_post)
         try:
-            with patch("app.clients.kiwi.asyncio.sleep", AsyncMock()):
+            with patch("app.clients.kiwi.asyncio.sleep", no_sleep):
                 result = await client._call_mcp("search-flight", {})
         finally:
             patcher.stop()
@@ -465,7 +465,7 @@ class TestKiwiTransportErrors:
         mock_post = AsyncMock(return_value=httpx.Response(502, text="bad gateway"))
         patcher = _patched_client(mock_post)
         try:
-            with patch("app.clients.kiwi.asyncio.sleep", AsyncMock()):
+            with patch("app.clients.kiwi.asyncio.sleep", no_sleep):
                 with pytest.raises(KiwiTransientError):
                     await client._call_mcp("search-flight", {})
         finally:
@@ -511,7 +511,7 @@ class TestKiwiTransportErrors:
         mock_post = AsyncMock(return_value=_make_sse_response(data))
         patcher = _patched_client(mock_post)
         try:
-            with patch("app.clients.kiwi.asyncio.sleep", AsyncMock()):
+            with patch("app.clients.kiwi.asyncio.sleep", no_sleep):
                 with pytest.raises(KiwiRateLimitError):
                     await client._call_mcp("search-flight", {})
         finally:
@@ -548,7 +548,7 @@ class TestKiwiTransportErrors:
         mock_post = AsyncMock(return_value=_make_sse_response(data))
         patcher = _patched_client(mock_post)
         try:
-            with patch("app.clients.kiwi.asyncio.sleep", AsyncMock()):
+            with patch("app.clients.kiwi.asyncio.sleep", no_sleep):
                 with pytest.raises(KiwiRateLimitError):
                     await client._call_mcp("search-flight", {})
         finally:
@@ -615,12 +615,10 @@ class TestKiwiTransportErrors:
 
     @pytest.mark.anyio
     async def test_global_budget_exceeded_propagates(self):
-        from app.core.errors import GlobalBudgetExceeded
-
         client = KiwiClient()
         with patch(
             "app.clients.kiwi.incr_and_check_global_budget",
-            AsyncMock(return_value=(False, 50001)),
+            over_budget,
         ):
             with pytest.raises(GlobalBudgetExceeded):
                 await client._call_mcp("search-flight", {})
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import json
+from contextlib import contextmanager
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import app.clients.skiplagged as sk_module
 import httpx
 import pytest
 from app.clients.skiplagged import (
@@ -14,6 +16,21 @@ from app.clients.skiplagged import (
     SkiplaggedRateLimitError,
     SkiplaggedRequestError,
 )
+from app.core.errors import GlobalBudgetExceeded
+
+from tests.clients.http_fakes import no_sleep, over_budget
+
+# Built once and shared: the client only reads pages, never mutates them.
+_EMPTY_FLIGHTS_PAGE = {
+    "flights": [],
+    "pagination": {
+        "totalAvailable": 0,
+        "currentlyShowing": 0,
+        "offset": 0,
+        "limit": 75,
+        "hasMoreResults": False,
+    },
+}
 
 
 def _make_sse_response(data: dict, status_code: int = 200, session_id: str = "test-session") -> httpx.Response:
@@ -109,14 +126,33 @@ def _hotels_response(num_hotels: int = 2, has_more: bool = False) -> httpx.Respo
     })
 
 
+@contextmanager
+def _patched_httpx(mock_post):
+    """Patch httpx.AsyncClient in the skiplagged module so POSTs go to mock_post."""
+    with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
+        MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
+        MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        yield MockClient
+
+
+@pytest.fixture
+def client() -> SkiplaggedClient:
+    """A client with an MCP session already established.
+
+    Function-scoped: tests drive the session state (e.g. a 400 resets it).
+    """
+    client = SkiplaggedClient()
+    client._initialized = True
+    client._session_id = "test-session"
+    return client
+
+
 class TestSkiplaggedClientInit:
     @pytest.mark.anyio
     async def test_initialize_captures_session_id(self):
         client = SkiplaggedClient()
         mock_post = AsyncMock(return_value=_init_response())
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             await client._ensure_initialized()
         assert client._session_id == "test-session"
         assert client._initialized is True
@@ -125,23 +161,16 @@ class TestSkiplaggedClientInit:
     async def test_connection_error_on_timeout(self):
         client = SkiplaggedClient()
         mock_post = AsyncMock(side_effect=httpx.TimeoutException("timeout"))
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             with pytest.raises(SkiplaggedConnectionError):
                 await client._ensure_initialized()
 
 
 class TestSkiplaggedFlightSearch:
     @pytest.mark.anyio
-    async def test_search_flights_success(self):
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
+    async def test_search_flights_success(self, client):
         mock_post = AsyncMock(return_value=_flights_response(3))
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             result = await client.search_flights("SFO", "CDG", "2026-06-15")
         assert result.success is True
         assert len(result.flights) == 3
@@ -150,67 +179,32 @@ class TestSkiplaggedFlightSearch:
         assert result.flights[0].price_amount == Decimal("1200")
 
     @pytest.mark.anyio
-    async def test_search_flights_parses_flight_numbers(self):
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
+    async def test_search_flights_parses_flight_numbers(self, client):
         mock_post = AsyncMock(return_value=_flights_response(1))
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             result = await client.search_flights("SFO", "CDG", "2026-06-15")
         flight = result.flights[0]
         assert flight.carrier_code == "AF"
         # Flight number parsed from id "SFO-CDG-2026-06-15-trip=AF80"
 
     @pytest.mark.anyio
-    async def test_search_flights_empty_results(self):
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
+    async def test_search_flights_empty_results(self, client):
         mock_post = AsyncMock(return_value=_flights_response(0))
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             result = await client.search_flights("SFO", "CDG", "2026-06-15")
         assert result.success is True
         assert result.flights == []
         assert result.total_results == 0
 
     @pytest.mark.anyio
-    async def test_search_flights_always_excludes_hidden_city(self):
+    async def test_search_flights_always_excludes_hidden_city(self, client):
         """includeHiddenCity must be False on every flight search call."""
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         with patch.object(client, "_call_mcp", new_callable=AsyncMock) as mock_call:
-            mock_call.return_value = {
-                "flights": [],
-                "pagination": {
-                    "totalAvailable": 0,
-                    "currentlyShowing": 0,
-                    "offset": 0,
-                    "limit": 75,
-                    "hasMoreResults": False,
-                },
-            }
+            mock_call.return_value = _EMPTY_FLIGHTS_PAGE
             await client.search_flights("SFO", "ORD", "2026-06-20")
         _tool, params = mock_call.call_args.args
         assert params.get("includeHiddenCity") is False
 
-    @staticmethod
-    def _empty_page() -> dict:
-        return {
-            "flights": [],
-            "pagination": {
-                "totalAvailable": 0,
-                "currentlyShowing": 0,
-                "offset": 0,
-                "limit": 75,
-                "hasMoreResults": False,
-            },
-        }
-
     @pytest.mark.anyio
     @pytest.mark.parametrize(
         ("cabin", "expected"),
@@ -221,54 +215,42 @@ class TestSkiplaggedFlightSearch:
             ("first", "first"),
         ],
     )
-    async def test_cabin_maps_onto_skiplagged_fare_class(self, cabin, expected):
+    async def test_cabin_maps_onto_skiplagged_fare_class(self, client, cabin, expected):
         """Skiplagged filters by cabin via `fareClass` — only premium economy is respelled.
 
         This client sent no cabin at all until 2026-08-06, so every search
         silently took the API's `economy` default; a first-class trip was
         tracked at economy prices with nothing to show for it.
         """
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         with patch.object(client, "_call_mcp", new_callable=AsyncMock) as mock_call:
-            mock_call.return_value = self._empty_page()
+            mock_call.return_value = _EMPTY_FLIGHTS_PAGE
             await client.search_flights("SFO", "JFK", "2026-09-15", cabin=cabin)
         _tool, params = mock_call.call_args.args
         assert params["fareClass"] == expected
 
     @pytest.mark.anyio
-    async def test_no_cabin_sends_no_fare_class(self):
+    async def test_no_cabin_sends_no_fare_class(self, client):
         """Absent a preference, let the API pick its own default rather than guessing."""
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         with patch.object(client, "_call_mcp", new_callable=AsyncMock) as mock_call:
-            mock_call.return_value = self._empty_page()
+            mock_call.return_value = _EMPTY_FLIGHTS_PAGE
             await client.search_flights("SFO", "JFK", "2026-09-15")
         _tool, params = mock_call.call_args.args
         assert "fareClass" not in params
 
     @pytest.mark.anyio
-    async def test_unknown_cabin_is_dropped_not_forwarded(self):
+    async def test_unknown_cabin_is_dropped_not_forwarded(self, client):
         """The tool rejects values outside its enum, so never pass one through."""
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         with patch.object(client, "_call_mcp", new_callable=AsyncMock) as mock_call:
-            mock_call.return_value = self._empty_page()
+            mock_call.return_value = _EMPTY_FLIGHTS_PAGE
             await client.search_flights("SFO", "JFK", "2026-09-15", cabin="sleeper-pod")
         _tool, params = mock_call.call_args.args
         assert "fareClass" not in params
 
     @pytest.mark.anyio
-    async def test_tracking_path_forwards_cabin_on_every_page(self):
+    async def test_tracking_path_forwards_cabin_on_every_page(self, client):
         """The worker's multi-page sweep must not lose the cabin after page 1."""
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         with patch.object(client, "_call_mcp", new_callable=AsyncMock) as mock_call:
-            mock_call.return_value = self._empty_page()
+            mock_call.return_value = _EMPTY_FLIGHTS_PAGE
             await client.search_flights_all(
                 "SFO", "JFK", "2026-09-15", cabin="business", max_pages=2
             )
@@ -276,33 +258,18 @@ class TestSkiplaggedFlightSearch:
             assert call.args[1]["fareClass"] == "business"
 
     @pytest.mark.anyio
-    async def test_search_flights_all_always_excludes_hidden_city(self):
+    async def test_search_flights_all_always_excludes_hidden_city(self, client):
         """includeHiddenCity must be False on every paginated call too."""
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         with patch.object(client, "_call_mcp", new_callable=AsyncMock) as mock_call:
-            mock_call.return_value = {
-                "flights": [],
-                "pagination": {
-                    "totalAvailable": 0,
-                    "currentlyShowing": 0,
-                    "offset": 0,
-                    "limit": 75,
-                    "hasMoreResults": False,
-                },
-            }
+            mock_call.return_value = _EMPTY_FLIGHTS_PAGE
             await client.search_flights_all("SFO", "ORD", "2026-06-20")
         for call in mock_call.call_args_list:
             _tool, params = call.args
             assert params.get("includeHiddenCity") is False
 
     @pytest.mark.anyio
-    async def test_search_flights_unexpected_exception_returns_error_result(self):
+    async def test_search_flights_unexpected_exception_returns_error_result(self, client):
         """Non-MCP exceptions in _search_flights_page produce a failed result."""
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         with patch.object(
             client, "_call_mcp", side_effect=RuntimeError("network gone")
         ):
@@ -323,14 +290,9 @@ class TestSkiplaggedFlightSearch:
 
 class TestSkiplaggedHotelSearch:
     @pytest.mark.anyio
-    async def test_search_hotels_success(self):
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
+    async def test_search_hotels_success(self, client):
         mock_post = AsyncMock(return_value=_hotels_response(2))
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             result = await client.search_hotels("Paris", "2026-06-15", "2026-06-18")
         assert result.success is True
         assert len(result.hotels) == 2
@@ -338,11 +300,8 @@ class TestSkiplaggedHotelSearch:
         assert result.hotels[0].price_per_night == Decimal("100.0")
 
     @pytest.mark.anyio
-    async def test_search_hotels_unexpected_exception_returns_error_result(self):
+    async def test_search_hotels_unexpected_exception_returns_error_result(self, client):
         """Non-MCP exceptions in _search_hotels_page produce a failed result."""
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         with patch.object(
             client, "_call_mcp", side_effect=RuntimeError("boom")
         ):
@@ -359,31 +318,21 @@ class TestSkiplaggedHotelSearch:
 
 class TestSkiplaggedPagination:
     @pytest.mark.anyio
-    async def test_search_flights_all_follows_pages(self):
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
+    async def test_search_flights_all_follows_pages(self, client):
         # Page 1: has more. Page 2: no more.
         responses = [_flights_response(3, has_more=True), _flights_response(2, has_more=False)]
         mock_post = AsyncMock(side_effect=responses)
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             result = await client.search_flights_all("SFO", "CDG", "2026-06-15", max_pages=4)
         assert result.success is True
         assert len(result.flights) == 5  # 3 + 2
 
     @pytest.mark.anyio
-    async def test_search_flights_all_respects_max_pages(self):
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
+    async def test_search_flights_all_respects_max_pages(self, client):
         # All pages have more, but we cap at 2
         responses = [_flights_response(3, has_more=True), _flights_response(3, has_more=True)]
         mock_post = AsyncMock(side_effect=responses)
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             result = await client.search_flights_all("SFO", "CDG", "2026-06-15", max_pages=2)
         assert len(result.flights) == 6  # 3 + 3, stopped at max_pages
 
@@ -396,23 +345,16 @@ class TestSkiplaggedErrorHandling:
         client._session_id = "old-session"
         error_response = httpx.Response(400, text="Bad Request", headers={"content-type": "text/plain"})
         mock_post = AsyncMock(return_value=error_response)
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             with pytest.raises(SkiplaggedRequestError):
                 await client.search_flights("SFO", "CDG", "2026-06-15")
         assert client._initialized is False
         assert client._session_id is None
 
     @pytest.mark.anyio
-    async def test_connection_error_on_network_failure(self):
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
+    async def test_connection_error_on_network_failure(self, client):
         mock_post = AsyncMock(side_effect=httpx.ConnectError("connection refused"))
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             with pytest.raises(SkiplaggedConnectionError):
                 await client.search_flights("SFO", "CDG", "2026-06-15")
 
@@ -457,18 +399,13 @@ def _tool_rate_limit_error() -> httpx.Response:
 
 class TestSkiplaggedRateLimit:
     @pytest.mark.anyio
-    async def test_http_429_raises_rate_limit_after_retries(self):
+    async def test_http_429_raises_rate_limit_after_retries(self, client):
         """A persistent HTTP 429 retries the bounded number of times, then raises."""
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         mock_post = AsyncMock(return_value=_http_429())
         with (
-            patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient,
+            _patched_httpx(mock_post),
             patch("app.clients.skiplagged.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
         ):
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
             with pytest.raises(SkiplaggedRateLimitError):
                 await client.search_flights("SFO", "CDG", "2026-06-15")
         # 1 initial attempt + MAX_TRANSIENT_RETRIES (2) = 3 posts, 2 backoff sleeps.
@@ -476,68 +413,48 @@ class TestSkiplaggedRateLimit:
         assert mock_sleep.await_count == 2
 
     @pytest.mark.anyio
-    async def test_in_payload_429_message_classified_as_rate_limit(self):
+    async def test_in_payload_429_message_classified_as_rate_limit(self, client):
         """An upstream 429 surfaced inside the JSON-RPC error message is a rate limit."""
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         mock_post = AsyncMock(return_value=_payload_rate_limit_error())
         with (
-            patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient,
-            patch("app.clients.skiplagged.asyncio.sleep", new_callable=AsyncMock),
+            _patched_httpx(mock_post),
+            patch("app.clients.skiplagged.asyncio.sleep", no_sleep),
         ):
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
             with pytest.raises(SkiplaggedRateLimitError):
                 await client.search_flights("SFO", "CDG", "2026-06-15")
 
     @pytest.mark.anyio
-    async def test_tool_iserror_429_classified_as_rate_limit(self):
+    async def test_tool_iserror_429_classified_as_rate_limit(self, client):
         """An upstream 429 surfaced as an isError tool result is a rate limit."""
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         mock_post = AsyncMock(return_value=_tool_rate_limit_error())
         with (
-            patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient,
-            patch("app.clients.skiplagged.asyncio.sleep", new_callable=AsyncMock),
+            _patched_httpx(mock_post),
+            patch("app.clients.skiplagged.asyncio.sleep", no_sleep),
         ):
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
             with pytest.raises(SkiplaggedRateLimitError):
                 await client.search_flights("SFO", "CDG", "2026-06-15")
 
     @pytest.mark.anyio
-    async def test_recovers_after_transient_429(self):
+    async def test_recovers_after_transient_429(self, client):
         """A 429 followed by a good response should retry and succeed."""
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         mock_post = AsyncMock(side_effect=[_http_429(), _flights_response(2)])
         with (
-            patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient,
-            patch("app.clients.skiplagged.asyncio.sleep", new_callable=AsyncMock),
+            _patched_httpx(mock_post),
+            patch("app.clients.skiplagged.asyncio.sleep", no_sleep),
         ):
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
             result = await client.search_flights("SFO", "CDG", "2026-06-15")
         assert result.success is True
         assert len(result.flights) == 2
         assert mock_post.await_count == 2
 
     @pytest.mark.anyio
-    async def test_long_retry_after_fails_fast_without_retrying(self):
+    async def test_long_retry_after_fails_fast_without_retrying(self, client):
         """A Retry-After longer than the local cap should not block; fail immediately."""
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         mock_post = AsyncMock(return_value=_http_429(retry_after="60"))
         with (
-            patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient,
+            _patched_httpx(mock_post),
             patch("app.clients.skiplagged.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
         ):
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
             with pytest.raises(SkiplaggedRateLimitError) as exc_info:
                 await client.search_flights("SFO", "CDG", "2026-06-15")
         assert exc_info.value.retry_after == 60.0
@@ -591,15 +508,10 @@ def _hotel_details_response() -> httpx.Response:
 
 class TestSkiplaggedHotelPagination:
     @pytest.mark.anyio
-    async def test_search_hotels_all_follows_pages(self):
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
+    async def test_search_hotels_all_follows_pages(self, client):
         responses = [_hotels_response(2, has_more=True), _hotels_response(1, has_more=False)]
         mock_post = AsyncMock(side_effect=responses)
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             result = await client.search_hotels_all(
                 "Paris", "2026-06-15", "2026-06-18", max_pages=4,
             )
@@ -607,15 +519,10 @@ class TestSkiplaggedHotelPagination:
         assert len(result.hotels) == 3
 
     @pytest.mark.anyio
-    async def test_search_hotels_all_respects_max_pages(self):
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
+    async def test_search_hotels_all_respects_max_pages(self, client):
         responses = [_hotels_response(2, has_more=True), _hotels_response(2, has_more=True)]
         mock_post = AsyncMock(side_effect=responses)
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             result = await client.search_hotels_all(
                 "Paris", "2026-06-15", "2026-06-18", max_pages=2,
             )
@@ -624,14 +531,9 @@ class TestSkiplaggedHotelPagination:
 
 class TestSkiplaggedHotelDetails:
     @pytest.mark.anyio
-    async def test_get_hotel_details_success(self):
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
+    async def test_get_hotel_details_success(self, client):
         mock_post = AsyncMock(return_value=_hotel_details_response())
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             detail = await client.get_hotel_details(
                 "hotel_1001", "2026-06-15", "2026-06-18",
             )
@@ -641,15 +543,10 @@ class TestSkiplaggedHotelDetails:
         assert detail.rooms[0].title == "Deluxe King"
 
     @pytest.mark.anyio
-    async def test_get_hotel_details_handles_string_id(self):
+    async def test_get_hotel_details_handles_string_id(self, client):
         """Hotel IDs from search results may be 'hotel_123' format."""
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         mock_post = AsyncMock(return_value=_hotel_details_response())
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             # Pass with prefix
             detail = await client.get_hotel_details(
                 "hotel_1001", "2026-06-15", "2026-06-18",
@@ -659,38 +556,27 @@ class TestSkiplaggedHotelDetails:
 
 class TestSkiplaggedSseParsing:
     @pytest.mark.anyio
-    async def test_sse_with_json_rpc_error_raises(self):
+    async def test_sse_with_json_rpc_error_raises(self, client):
         """JSON-RPC errors in SSE response should raise SkiplaggedRequestError."""
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         error_response = _make_sse_response({
             "jsonrpc": "2.0",
             "id": 2,
             "error": {"code": -32603, "message": "Internal error"},
         })
         mock_post = AsyncMock(return_value=error_response)
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             with pytest.raises(SkiplaggedRequestError, match="Internal error"):
                 await client.search_flights("SFO", "CDG", "2026-06-15")
 
     @pytest.mark.anyio
-    async def test_plain_json_response_is_parsed(self):
+    async def test_plain_json_response_is_parsed(self, client):
         """Non-SSE JSON responses should be parsed directly."""
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         data = {
             "jsonrpc": "2.0",
             "id": 2,
             "result": {
                 "content": [{"type": "text", "text": "ok"}],
-                "structuredContent": {"flights": [], "pagination": {
-                    "totalAvailable": 0, "currentlyShowing": 0,
-                    "offset": 0, "limit": 75, "hasMoreResults": False,
-                }},
+                "structuredContent": _EMPTY_FLIGHTS_PAGE,
             },
         }
         json_response = httpx.Response(
@@ -699,62 +585,38 @@ class TestSkiplaggedSseParsing:
             headers={"content-type": "application/json", "mcp-session-id": "test-session"},
         )
         mock_post = AsyncMock(return_value=json_response)
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             result = await client.search_flights("SFO", "CDG", "2026-06-15")
         assert result.success is True
         assert result.flights == []
 
     @pytest.mark.anyio
-    async def test_invalid_json_response_raises(self):
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
+    async def test_invalid_json_response_raises(self, client):
         bad_response = httpx.Response(
             status_code=200,
             text="not json at all",
             headers={"content-type": "application/json", "mcp-session-id": "test-session"},
         )
         mock_post = AsyncMock(return_value=bad_response)
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             with pytest.raises(SkiplaggedRequestError):
                 await client.search_flights("SFO", "CDG", "2026-06-15")
 
     @pytest.mark.anyio
-    async def test_http_error_raises_connection_error(self):
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
+    async def test_http_error_raises_connection_error(self, client):
         mock_post = AsyncMock(side_effect=httpx.HTTPError("generic http error"))
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             with pytest.raises(SkiplaggedConnectionError):
                 await client.search_flights("SFO", "CDG", "2026-06-15")
 
     @pytest.mark.anyio
-    async def test_sse_skips_invalid_json_lines(self):
+    async def test_sse_skips_invalid_json_lines(self, client):
         """Malformed `data:` lines in SSE are skipped; later valid ones win."""
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         valid_payload = {
             "jsonrpc": "2.0",
             "id": 2,
             "result": {
-                "structuredContent": {
-                    "flights": [],
-                    "pagination": {
-                        "totalAvailable": 0,
-                        "currentlyShowing": 0,
-                        "offset": 0,
-                        "limit": 75,
-                        "hasMoreResults": False,
-                    },
-                },
+                "structuredContent": _EMPTY_FLIGHTS_PAGE,
             },
         }
         sse_text = (
@@ -767,29 +629,14 @@ class TestSkiplaggedSseParsing:
             headers={"content-type": "text/event-stream", "mcp-session-id": "test-session"},
         )
         mock_post = AsyncMock(return_value=sse_response)
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             result = await client.search_flights("SFO", "CDG", "2026-06-15")
         assert result.success is True
         assert result.flights == []
 
     @pytest.mark.anyio
-    async def test_extract_result_falls_back_to_text_content(self):
+    async def test_extract_result_falls_back_to_text_content(self, client):
         """When `structuredContent` is absent, parse JSON from `content[].text`."""
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
-        embedded = {
-            "flights": [],
-            "pagination": {
-                "totalAvailable": 0,
-                "currentlyShowing": 0,
-                "offset": 0,
-                "limit": 75,
-                "hasMoreResults": False,
-            },
-        }
         payload = {
             "jsonrpc": "2.0",
             "id": 2,
@@ -798,7 +645,7 @@ class TestSkiplaggedSseParsing:
                 "content": [
                     {"type": "image", "data": "ignored"},
                     {"type": "text", "text": "{ not valid json"},
-                    {"type": "text", "text": json.dumps(embedded)},
+                    {"type": "text", "text": json.dumps(_EMPTY_FLIGHTS_PAGE)},
                 ],
             },
         }
@@ -808,9 +655,7 @@ class TestSkiplaggedSseParsing:
             headers={"content-type": "application/json", "mcp-session-id": "test-session"},
         )
         mock_post = AsyncMock(return_value=json_response)
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             result = await client.search_flights("SFO", "CDG", "2026-06-15")
         # The valid JSON in content[1].text was returned, so we get an empty (but successful) result
         assert result.success is True
@@ -819,9 +664,7 @@ class TestSkiplaggedSseParsing:
 
 class TestSkiplaggedGlobalBudget:
     @pytest.mark.anyio
-    async def test_call_mcp_increments_budget_and_proceeds(self, monkeypatch):
-        import app.clients.skiplagged as sk_module
-
+    async def test_call_mcp_increments_budget_and_proceeds(self, client, monkeypatch):
         recorded = {}
 
         async def fake_incr(metric, amount, limit, **kwargs):
@@ -831,36 +674,25 @@ class TestSkiplaggedGlobalBudget:
 
         monkeypatch.setattr(sk_module, "incr_and_check_global_budget", fake_incr)
 
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
         mock_post = AsyncMock(return_value=_flights_response(1))
-        with patch("app.clients.skiplagged.httpx.AsyncClient") as MockClient:
-            MockClient.return_value.__aenter__ = AsyncMock(return_value=MagicMock(post=mock_post))
-            MockClient.return_value.__aexit__ = AsyncMock(return_value=False)
+        with _patched_httpx(mock_post):
             result = await client.search_flights("SFO", "CDG", "2026-06-15")
 
         assert result.success is True
         assert recorded == {"metric": "skiplagged_calls", "amount": 1}
 
     @pytest.mark.anyio
-    async def test_call_mcp_raises_when_over_budget_before_sending(self, monkeypatch):
-        import app.clients.skiplagged as sk_module
-        from app.core.errors import GlobalBudgetExceeded
-
-        async def over_budget(metric, amount, limit, **kwargs):
-            return False, limit + amount
-
+    async def test_call_mcp_raises_when_over_budget_before_sending(self, client, monkeypatch):
         monkeypatch.setattr(sk_module, "incr_and_check_global_budget", over_budget)
 
-        client = SkiplaggedClient()
-        client._initialized = True
-        client._session_id = "test-session"
+        sent = []
+
+        async def send(*args, **kwargs):
+            sent.append(args)
 
-        send = AsyncMock()
         monkeypatch.setattr(client, "_send_request", send)
 
         with pytest.raises(GlobalBudgetExceeded):
             await client._call_mcp("sk_flights_search", {"origin": "SFO"})
 
-        send.assert_not_called()
+        assert sent == []
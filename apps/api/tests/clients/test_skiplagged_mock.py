@@ -2,49 +2,80 @@
 
 from __future__ import annotations
 
+import random
+
+import app.clients.skiplagged_mock as mock_module
+import pytest
 from app.clients.skiplagged_mock import (
     mock_flight_search,
     mock_hotel_details,
     mock_hotel_search,
 )
 
+FLIGHT_FIELDS = ["id", "airlines", "departure", "arrival", "price"]
+HOTEL_FIELDS = ["id", "name", "price", "rating", "amenities"]
+ROOM_FIELDS = ["title", "pricePerNightInDollars", "totalPriceInDollars", "currency", "bookingLink"]
 
-class TestMockFlightSearch:
-    def test_returns_skiplagged_shape(self):
-        response = mock_flight_search(
-            origin="SFO",
-            destination="CDG",
-            departure_date="2026-06-15",
-        )
-        assert isinstance(response, dict)
-        assert "flights" in response
-        assert isinstance(response["flights"], list)
-        assert len(response["flights"]) > 0
+RNG_SEED = 1234
 
-    def test_flights_have_required_fields(self):
-        response = mock_flight_search(
-            origin="SFO",
-            destination="CDG",
-            departure_date="2026-06-15",
-        )
-        flight = response["flights"][0]
-        assert "id" in flight
-        assert "airlines" in flight
-        assert "departure" in flight
-        assert "arrival" in flight
-        assert "price" in flight
-        assert "amount" in flight["price"]
-        assert "currency" in flight["price"]
-
-    def test_id_format_is_parseable(self):
+
+@pytest.fixture(scope="module", autouse=True)
+def _seeded_rng():
+    """Swap the module's SystemRandom (which ignores seeding) for a seeded one.
+
+    Module-scoped so the shared responses below are generated under it too.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(mock_module, "_rng", random.Random(RNG_SEED))
+        yield
+
+
+def _reseed() -> None:
+    mock_module._rng.seed(RNG_SEED)
+
+
+# Each default response is built once per module and shared by the structural
+# checks below, none of which depend on the generators' random jitter.
+@pytest.fixture(scope="module")
+def flight_response():
+    return mock_flight_search(origin="SFO", destination="CDG", departure_date="2026-06-15")
+
+
+@pytest.fixture(scope="module")
+def hotel_response():
+    return mock_hotel_search(city="PAR", checkin="2026-06-15", checkout="2026-06-18")
+
+
+@pytest.fixture(scope="module")
+def hotel_detail():
+    return mock_hotel_details(hotel_id=1001, checkin="2026-06-15", checkout="2026-06-18")
+
+
+class TestMockFlightSearch:
+    def test_returns_skiplagged_shape(self, flight_response):
+        assert isinstance(flight_response, dict)
+        assert isinstance(flight_response["flights"], list)
+        assert len(flight_response["flights"]) > 0
+
+    @pytest.mark.fast
+    @pytest.mark.parametrize("field", FLIGHT_FIELDS)
+    def test_flights_have_required_fields(self, flight_response, field):
+        assert field in flight_response["flights"][0]
+
+    def test_price_has_amount_and_currency(self, flight_response):
+        price = flight_response["flights"][0]["price"]
+        assert "amount" in price
+        assert "currency" in price
+
+    def test_id_format_is_parseable(self, flight_response):
         """Flight IDs should match Skiplagged 'trip=XX\\d+' format so parser works."""
-        response = mock_flight_search(
-            origin="SFO",
-            destination="CDG",
-            departure_date="2026-06-15",
-        )
-        flight = response["flights"][0]
-        assert "trip=" in flight["id"]
+        assert "trip=" in flight_response["flights"][0]["id"]
+
+    def test_pagination_metadata(self, flight_response):
+        if "pagination" in flight_response:
+            pagination = flight_response["pagination"]
+            assert "totalAvailable" in pagination
+            assert "hasMoreResults" in pagination
 
     def test_round_trip_includes_return(self):
         response = mock_flight_search(
@@ -66,94 +97,68 @@ class TestMockFlightSearch:
         )
         assert len(response["flights"]) <= 3
 
-    def test_pagination_metadata(self):
-        response = mock_flight_search(
-            origin="SFO",
-            destination="CDG",
-            departure_date="2026-06-15",
+    def test_price_scales_exactly_with_adults(self):
+        _reseed()
+        one = mock_flight_search(origin="SFO", destination="CDG", departure_date="2026-06-15")
+        _reseed()
+        three = mock_flight_search(
+            origin="SFO", destination="CDG", departure_date="2026-06-15", adults=3
         )
-        if "pagination" in response:
-            pagination = response["pagination"]
-            assert "totalAvailable" in pagination
-            assert "hasMoreResults" in pagination
+        assert [f["price"]["amount"] for f in three["flights"]] == [
+            round(f["price"]["amount"] * 3, 2) for f in one["flights"]
+        ]
 
 
 class TestMockHotelSearch:
-    def test_returns_skiplagged_shape(self):
-        response = mock_hotel_search(
-            city="PAR",
-            checkin="2026-06-15",
-            checkout="2026-06-18",
-        )
-        assert isinstance(response, dict)
-        assert "results" in response
-        assert isinstance(response["results"], list)
-
-    def test_hotels_have_required_fields(self):
-        response = mock_hotel_search(
-            city="PAR",
-            checkin="2026-06-15",
-            checkout="2026-06-18",
-        )
-        hotel = response["results"][0]
-        assert "id" in hotel
-        assert "name" in hotel
-        assert "price" in hotel
-        assert "amount" in hotel["price"]
-        assert "rating" in hotel
-        assert "amenities" in hotel
-
-    def test_varied_star_ratings(self):
-        response = mock_hotel_search(
-            city="PAR",
-            checkin="2026-06-15",
-            checkout="2026-06-18",
-        )
-        stars = {h["rating"]["stars"] for h in response["results"] if h.get("rating")}
+    def test_returns_skiplagged_shape(self, hotel_response):
+        assert isinstance(hotel_response, dict)
+        assert isinstance(hotel_response["results"], list)
+
+    @pytest.mark.fast
+    @pytest.mark.parametrize("field", HOTEL_FIELDS)
+    def test_hotels_have_required_fields(self, hotel_response, field):
+        assert field in hotel_response["results"][0]
+
+    def test_price_has_amount(self, hotel_response):
+        assert "amount" in hotel_response["results"][0]["price"]
+
+    def test_varied_star_ratings(self, hotel_response):
+        stars = {h["rating"]["stars"] for h in hotel_response["results"] if h.get("rating")}
         assert len(stars) > 1  # should have variety
 
+    def test_same_seed_same_response(self):
+        _reseed()
+        first = mock_hotel_search(city="PAR", checkin="2026-06-15", checkout="2026-06-18")
+        _reseed()
+        assert mock_hotel_search(city="PAR", checkin="2026-06-15", checkout="2026-06-18") == first
+
+    def test_price_scales_exactly_with_rooms(self):
+        _reseed()
+        one = mock_hotel_search(city="PAR", checkin="2026-06-15", checkout="2026-06-18")
+        _reseed()
+        two = mock_hotel_search(city="PAR", checkin="2026-06-15", checkout="2026-06-18", rooms=2)
+        assert [h["price"]["amount"] for h in two["results"]] == [
+            round(h["price"]["amount"] * 2, 2) for h in one["results"]
+        ]
+
 
 class TestMockHotelDetails:
-    def test_returns_hotel_detail(self):
-        detail = mock_hotel_details(
-            hotel_id=1001,
-            checkin="2026-06-15",
-            checkout="2026-06-18",
-        )
-        assert isinstance(detail, dict)
-        assert "hotelId" in detail
-        assert "rooms" in detail
-        assert len(detail["rooms"]) > 0
-
-    def test_rooms_have_required_fields(self):
-        detail = mock_hotel_details(
-            hotel_id=1001,
-            checkin="2026-06-15",
-            checkout="2026-06-18",
-        )
-        room = detail["rooms"][0]
-        assert "title" in room
-        assert "pricePerNightInDollars" in room
-        assert "totalPriceInDollars" in room
-        assert "currency" in room
-        assert "bookingLink" in room
-
-    def test_varied_room_types(self):
-        detail = mock_hotel_details(
-            hotel_id=1001,
-            checkin="2026-06-15",
-            checkout="2026-06-18",
-        )
-        titles = {r["title"] for r in detail["rooms"]}
+    def test_returns_hotel_detail(self, hotel_detail):
+        assert isinstance(hotel_detail, dict)
+        assert "hotelId" in hotel_detail
+        assert len(hotel_detail["rooms"]) > 0
+
+    @pytest.mark.fast
+    @pytest.mark.parametrize("field", ROOM_FIELDS)
+    def test_rooms_have_required_fields(self, hotel_detail, field):
+        assert field in hotel_detail["rooms"][0]
+
+    def test_varied_room_types(self, hotel_detail):
+        titles = {r["title"] for r in hotel_detail["rooms"]}
         assert len(titles) >= 2  # multiple room types
 
-    def test_location_coordinates(self):
-        detail = mock_hotel_details(
-            hotel_id=1001,
-            checkin="2026-06-15",
-            checkout="2026-06-18",
-        )
-        if "location" in detail:
-            location = detail["location"]
+    def test_location_coordinates(self, hotel_detail):
+        if "location" in hotel_detail:
+            location = hotel_detail["location"]
             assert "lat" in location
             assert "lng" in location
@@ -16,23 +16,59 @@ import pytest_asyncio  # noqa: E402
 from app.core.constants import CookieNames, HeaderNames  # noqa: E402
 from app.db.deps import get_db  # noqa: E402
 from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
 from sqlalchemy.pool import NullPool  # noqa: E402
 from sqlmodel import SQLModel  # noqa: E402
 
 
+def pytest_addoption(parser):
+    """Register the --fast smoke-run option."""
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="Run only the first case of each parametrized test marked `fast`.",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """With --fast, deselect all but the first case of each `fast` test."""
+    if not config.getoption("--fast"):
+        return
+
+    seen: set[str] = set()
+    selected = []
+    deselected = []
+    for item in items:
+        if item.get_closest_marker("fast") is None or not hasattr(item, "callspec"):
+            selected.append(item)
+            continue
+        base_id = item.nodeid.split("[", 1)[0]
+        if base_id in seen:
+            deselected.append(item)
+        else:
+            seen.add(base_id)
+            selected.append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
 @pytest.fixture(scope="session")
 def anyio_backend():
     """Use asyncio for async tests."""
     return "asyncio"
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="session")
 async def test_engine():
-    """Create a test database engine for each test.
+    """Create the test database engine and schema once per test session.
 
-    Uses a unique database file per test to avoid race conditions
-    when tests run in parallel.
+    Each test gets isolation from ``test_session``, which rolls back everything
+    it wrote. The file name is unique per session so parallel runs don't
+    collide.
     """
     # Import all models so SQLAlchemy registers them with metadata
     from app.models import (
@@ -62,7 +98,7 @@ async def test_engine():
         DeviceToken,
     )
 
-    # Use unique file per test to avoid race conditions in parallel execution
+    # Use unique file per session to avoid race conditions in parallel execution
     test_db_file = os.path.join(tempfile.gettempdir(), f"test_vacation_tracker_{uuid.uuid4().hex}.db")
     test_database_url = f"sqlite+aiosqlite:///{test_db_file}"
 
@@ -72,6 +108,17 @@ async def test_engine():
         poolclass=NullPool,
     )
 
+    # pysqlite/aiosqlite emit their own BEGIN lazily, which breaks SAVEPOINT
+    # handling; hand transaction control to SQLAlchemy so the rollback-based
+    # test_session below works (SQLAlchemy's documented SQLite recipe).
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
@@ -79,7 +126,7 @@ async def test_engine():
 
     await engine.dispose()
 
-    # Clean up test DB after test
+    # Clean up test DB after the session
     if os.path.exists(test_db_file):
         try:
             os.remove(test_db_file)
@@ -89,16 +136,26 @@ async def test_engine():
 
 @pytest_asyncio.fixture(scope="function")
 async def test_session(test_engine):
-    """Create a test database session for each test."""
-    async_session = async_sessionmaker(
-        bind=test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+    """Create a test database session for each test.
 
-    async with async_session() as session:
-        yield session
-        await session.rollback()  # Rollback any uncommitted changes
+    The session runs inside one outer transaction that is rolled back on
+    teardown. ``commit()`` inside a test (or the code under test) only releases
+    a SAVEPOINT, so data stays visible to the session without paying for a
+    durable commit.
+    """
+    async with test_engine.connect() as connection:
+        outer = await connection.begin()
+        async_session = async_sessionmaker(
+            bind=connection,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+
+        async with async_session() as session:
+            yield session
+
+        await outer.rollback()
 
 
 @pytest.fixture(autouse=True)
@@ -336,7 +336,6 @@ class TestChatServiceIntegration:
         )
         test_session.add(user)
         await test_session.flush()
-        await test_session.refresh(user)
         return user
 
     @pytest.mark.anyio
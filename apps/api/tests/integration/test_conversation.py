@@ -30,7 +30,6 @@ async def test_user(test_session):
     )
     test_session.add(user)
     await test_session.flush()
-    await test_session.refresh(user)
     return user
 
 
@@ -379,7 +379,6 @@ class TestMCPRouterWithRealTools:
         )
         test_session.add(user)
         await test_session.flush()
-        await test_session.refresh(user)
         return test_session, user
 
     @pytest.mark.anyio
@@ -434,17 +433,12 @@ class TestMCPRouterWithRealTools:
         """Test that tools only see data for the requesting user."""
         db, user1 = db_with_user
 
-        # Create another user
+        # Create another user, and trips for both users, in a single flush
         user2 = User(
             google_sub="mcp_dispatch_test_user_2",
             email="mcp_test2@example.com",
             name="MCP Test User 2",
         )
-        db.add(user2)
-        await db.flush()
-        await db.refresh(user2)
-
-        # Create trips for both users
         trip1 = Trip(
             user_id=user1.id,
             name="User1 Trip",
@@ -461,7 +455,7 @@ class TestMCPRouterWithRealTools:
             depart_date=date(2026, 6, 1),
             return_date=date(2026, 6, 5),
         )
-        db.add_all([trip1, trip2])
+        db.add_all([user2, trip1, trip2])
         await db.flush()
 
         # Handler that respects user_id
@@ -34,7 +34,6 @@ async def limit_test_user(test_session: AsyncSession) -> User:
     )
     test_session.add(user)
     await test_session.flush()
-    await test_session.refresh(user)
     return user
 
 
@@ -150,7 +149,6 @@ class TestCountUserConversations:
         )
         test_session.add(user2)
         await test_session.flush()
-        await test_session.refresh(user2)
 
         # Create conversations for user 1
         for i in range(3):
@@ -295,7 +293,6 @@ class TestDeleteOldestConversations:
         )
         test_session.add(user2)
         await test_session.flush()
-        await test_session.refresh(user2)
 
         # Create conversations for user 1
         for i in range(3):
@@ -3,8 +3,7 @@
 Coverage targets:
 - generate_title: LLM-based title generation
 - update_conversation_title: Database title update
-- should_generate_title: Title generation conditions
-- get_first_exchange: Fetching first user/assistant messages
+- fetch_title_context: Title + first exchange in one query
 - _generate_fallback_title: Fallback title generation
 - ChatService._maybe_generate_title: Integration with chat flow
 """
@@ -22,9 +21,8 @@ from app.models.conversation import Conversation
 from app.models.message import Message
 from app.services.conversation import (
     _generate_fallback_title,
+    fetch_title_context,
     generate_title,
-    get_first_exchange,
-    should_generate_title,
     update_conversation_title,
 )
 
@@ -67,6 +65,24 @@ def make_message(
     )
 
 
+async def add_exchange(
+    session: AsyncSession,
+    conversation_id: uuid.UUID,
+    user_content: str,
+    assistant_content: str,
+) -> None:
+    """Insert a user/assistant message pair and commit once."""
+    session.add_all(
+        [
+            make_message(conversation_id, role="user", content=user_content),
+            make_message(
+                conversation_id, role="assistant", content=assistant_content
+            ),
+        ]
+    )
+    await session.commit()
+
+
 # =============================================================================
 # generate_title Tests
 # =============================================================================
@@ -254,7 +270,6 @@ class TestUpdateConversationTitle:
         conv = make_conversation()
         test_session.add(conv)
         await test_session.commit()
-        await test_session.refresh(conv)
 
         # Update the title
         result = await update_conversation_title(
@@ -265,8 +280,7 @@ class TestUpdateConversationTitle:
 
         assert result is True
 
-        # Verify the title was updated
-        await test_session.refresh(conv)
+        # The ORM update synchronizes the in-session instance, no refresh needed
         assert conv.title == "My New Title"
 
     @pytest.mark.asyncio
@@ -284,157 +298,80 @@ class TestUpdateConversationTitle:
 
 
 # =============================================================================
-# should_generate_title Tests
+# fetch_title_context Tests
 # =============================================================================
 
 
-class TestShouldGenerateTitle:
-    """Tests for the should_generate_title function."""
+class TestFetchTitleContext:
+    """Tests for the fetch_title_context function."""
 
     @pytest.mark.asyncio
-    async def test_returns_true_when_no_title_and_has_exchange(
-        self, test_session: AsyncSession
-    ):
-        """Test returns True when conversation has no title and has messages."""
+    async def test_returns_title_and_first_exchange(self, test_session: AsyncSession):
+        """Test that the title and first user/assistant messages are returned."""
         conv = make_conversation(title=None)
         test_session.add(conv)
         await test_session.flush()
 
-        # Add user and assistant messages
-        user_msg = make_message(conv.id, role="user", content="Hello")
-        assistant_msg = make_message(conv.id, role="assistant", content="Hi!")
-        test_session.add(user_msg)
-        test_session.add(assistant_msg)
-        await test_session.commit()
-
-        result = await should_generate_title(conv.id, test_session)
-        assert result is True
-
-    @pytest.mark.asyncio
-    async def test_returns_false_when_has_title(self, test_session: AsyncSession):
-        """Test returns False when conversation already has a title."""
-        conv = make_conversation(title="Existing Title")
-        test_session.add(conv)
-        await test_session.flush()
-
-        # Add messages
-        user_msg = make_message(conv.id, role="user", content="Hello")
-        assistant_msg = make_message(conv.id, role="assistant", content="Hi!")
-        test_session.add(user_msg)
-        test_session.add(assistant_msg)
+        test_session.add_all(
+            [
+                make_message(conv.id, role="user", content="First user"),
+                make_message(conv.id, role="assistant", content="First assistant"),
+                make_message(conv.id, role="user", content="Second user"),
+            ]
+        )
         await test_session.commit()
 
-        result = await should_generate_title(conv.id, test_session)
-        assert result is False
-
-    @pytest.mark.asyncio
-    async def test_returns_false_when_no_user_message(
-        self, test_session: AsyncSession
-    ):
-        """Test returns False when no user message exists."""
-        conv = make_conversation(title=None)
-        test_session.add(conv)
-        await test_session.flush()
-
-        # Only add assistant message
-        assistant_msg = make_message(conv.id, role="assistant", content="Hi!")
-        test_session.add(assistant_msg)
-        await test_session.commit()
+        title, user_content, assistant_content = await fetch_title_context(
+            conv.id, test_session
+        )
 
-        result = await should_generate_title(conv.id, test_session)
-        assert result is False
+        assert title is None
+        assert user_content == "First user"
+        assert assistant_content == "First assistant"
 
     @pytest.mark.asyncio
-    async def test_returns_false_when_no_assistant_message(
+    async def test_returns_partial_when_only_user_message(
         self, test_session: AsyncSession
     ):
-        """Test returns False when no assistant message exists."""
+        """Test returns the user message but None for assistant when only user exists."""
         conv = make_conversation(title=None)
         test_session.add(conv)
         await test_session.flush()
 
-        # Only add user message
-        user_msg = make_message(conv.id, role="user", content="Hello")
-        test_session.add(user_msg)
+        test_session.add(make_message(conv.id, role="user", content="User message"))
         await test_session.commit()
 
-        result = await should_generate_title(conv.id, test_session)
-        assert result is False
-
-
-# =============================================================================
-# get_first_exchange Tests
-# =============================================================================
-
-
-class TestGetFirstExchange:
-    """Tests for the get_first_exchange function."""
-
-    @pytest.mark.asyncio
-    async def test_returns_first_user_and_assistant_messages(
-        self, test_session: AsyncSession
-    ):
-        """Test that first user and assistant messages are returned."""
-        conv = make_conversation()
-        test_session.add(conv)
-        await test_session.flush()
-
-        # Add messages in order
-        user_msg1 = make_message(conv.id, role="user", content="First user")
-        user_msg2 = make_message(conv.id, role="user", content="Second user")
-        assistant_msg1 = make_message(
-            conv.id, role="assistant", content="First assistant"
-        )
-        assistant_msg2 = make_message(
-            conv.id, role="assistant", content="Second assistant"
-        )
-
-        test_session.add(user_msg1)
-        test_session.add(assistant_msg1)
-        test_session.add(user_msg2)
-        test_session.add(assistant_msg2)
-        await test_session.commit()
-
-        user_content, assistant_content = await get_first_exchange(
+        title, user_content, assistant_content = await fetch_title_context(
             conv.id, test_session
         )
 
-        assert user_content == "First user"
-        assert assistant_content == "First assistant"
+        assert title is None
+        assert user_content == "User message"
+        assert assistant_content is None
 
     @pytest.mark.asyncio
-    async def test_returns_none_when_no_messages(self, test_session: AsyncSession):
-        """Test that None is returned when no messages exist."""
-        conv = make_conversation()
+    async def test_returns_existing_title(self, test_session: AsyncSession):
+        """Test that an existing title is returned alongside missing messages."""
+        conv = make_conversation(title="Existing Title")
         test_session.add(conv)
         await test_session.commit()
 
-        user_content, assistant_content = await get_first_exchange(
+        title, user_content, assistant_content = await fetch_title_context(
             conv.id, test_session
         )
 
+        assert title == "Existing Title"
         assert user_content is None
         assert assistant_content is None
 
     @pytest.mark.asyncio
-    async def test_returns_partial_when_only_user_message(
+    async def test_returns_nones_for_nonexistent_conversation(
         self, test_session: AsyncSession
     ):
-        """Test returns user message but None for assistant when only user exists."""
-        conv = make_conversation()
-        test_session.add(conv)
-        await test_session.flush()
-
-        user_msg = make_message(conv.id, role="user", content="User message")
-        test_session.add(user_msg)
-        await test_session.commit()
-
-        user_content, assistant_content = await get_first_exchange(
-            conv.id, test_session
-        )
+        """Test that a missing conversation yields all None."""
+        result = await fetch_title_context(uuid.uuid4(), test_session)
 
-        assert user_content == "User message"
-        assert assistant_content is None
+        assert result == (None, None, None)
 
 
 # =============================================================================
@@ -458,13 +395,9 @@ class TestMaybeGenerateTitle:
         await test_session.flush()
 
         # Add required messages
-        user_msg = make_message(conv.id, role="user", content="Plan Hawaii trip")
-        assistant_msg = make_message(
-            conv.id, role="assistant", content="I can help with that!"
+        await add_exchange(
+            test_session, conv.id, "Plan Hawaii trip", "I can help with that!"
         )
-        test_session.add(user_msg)
-        test_session.add(assistant_msg)
-        await test_session.commit()
 
         # Mock the generate_title function
         with patch(
@@ -475,8 +408,7 @@ class TestMaybeGenerateTitle:
             service = ChatService()
             await service._maybe_generate_title(conv.id, test_session)
 
-        # Verify title was updated
-        await test_session.refresh(conv)
+        # Verify title was updated on the in-session instance
         assert conv.title == "Hawaii Trip Planning"
 
     @pytest.mark.asyncio
@@ -490,11 +422,7 @@ class TestMaybeGenerateTitle:
         await test_session.flush()
 
         # Add messages
-        user_msg = make_message(conv.id, role="user", content="Test")
-        assistant_msg = make_message(conv.id, role="assistant", content="Response")
-        test_session.add(user_msg)
-        test_session.add(assistant_msg)
-        await test_session.commit()
+        await add_exchange(test_session, conv.id, "Test", "Response")
 
         with patch(
             "app.services.chat.generate_title",
@@ -521,11 +449,7 @@ class TestMaybeGenerateTitle:
         await test_session.flush()
 
         # Add messages
-        user_msg = make_message(conv.id, role="user", content="Test")
-        assistant_msg = make_message(conv.id, role="assistant", content="Response")
-        test_session.add(user_msg)
-        test_session.add(assistant_msg)
-        await test_session.commit()
+        await add_exchange(test_session, conv.id, "Test", "Response")
 
         # Mock generate_title to raise an error
         with patch(
@@ -540,3 +464,25 @@ class TestMaybeGenerateTitle:
         # Title should remain None
         await test_session.refresh(conv)
         assert conv.title is None
+
+    @pytest.mark.asyncio
+    async def test_skips_when_exchange_incomplete(self):
+        """Test that a missing assistant response skips title generation."""
+        from app.services.chat import ChatService
+
+        with (
+            patch(
+                "app.services.chat.fetch_title_context",
+                new_callable=AsyncMock,
+                return_value=(None, "Plan Hawaii trip", None),
+            ) as mock_fetch,
+            patch(
+                "app.services.chat.generate_title",
+                new_callable=AsyncMock,
+            ) as mock_generate,
+        ):
+            service = ChatService()
+            await service._maybe_generate_title(uuid.uuid4(), MagicMock())
+
+        mock_fetch.assert_awaited_once()
+        mock_generate.assert_not_called()
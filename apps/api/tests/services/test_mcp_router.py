@@ -8,6 +8,7 @@ Coverage targets:
 
 from __future__ import annotations
 
+import dataclasses
 import json
 import uuid
 from typing import Any
@@ -36,12 +37,24 @@ from app.services.mcp_router import (
     ToolExecutionError,
     ToolNotFoundError,
     ToolValidationError,
+    _compiled_pattern,
+    _get_compiled_schema,
+    _is_valid_uuid,
     _validate_type,
     get_mcp_router,
     reset_mcp_router,
     validate_tool_args,
 )
 
+VALID_TRIP_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+# Prebuilt tool-call argument payloads (what the LLM sends as JSON strings)
+GET_TRIP_DETAILS_JSON = '{"trip_id": "550e8400-e29b-41d4-a716-446655440000"}'
+CREATE_TRIP_JSON = (
+    '{"name": "Hawaii Spring 2026", "origin_airport": "SFO", "destination_code": "HNL", '
+    '"depart_date": "2026-03-15", "return_date": "2026-03-22"}'
+)
+
 # =============================================================================
 # ToolResult Tests
 # =============================================================================
@@ -97,6 +110,12 @@ class TestToolResult:
         assert d["data"] == {"details": "extra info"}
         assert d["error"] == "Partial failure"
 
+    def test_is_frozen(self):
+        """Test results are immutable so constant results can be shared."""
+        result = ToolResult(success=True)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.success = False  # type: ignore[misc]
+
 
 # =============================================================================
 # ToolCall Tests
@@ -125,12 +144,11 @@ class TestToolCall:
 
     def test_tool_call_with_arguments(self):
         """Test ToolCall with JSON arguments."""
-        args = json.dumps({"trip_id": "550e8400-e29b-41d4-a716-446655440000"})
-        func = ToolCallFunction(name="get_trip_details", arguments=args)
+        func = ToolCallFunction(name="get_trip_details", arguments=GET_TRIP_DETAILS_JSON)
         call = ToolCall(id="call_xyz", type="function", function=func)
 
         parsed = json.loads(call.function.arguments)
-        assert parsed["trip_id"] == "550e8400-e29b-41d4-a716-446655440000"
+        assert parsed["trip_id"] == VALID_TRIP_ID
 
 
 # =============================================================================
@@ -138,23 +156,37 @@ class TestToolCall:
 # =============================================================================
 
 
+def _has_function_structure(tool: dict[str, Any]) -> bool:
+    """Check a tool definition has the required OpenAI function structure."""
+    function = tool.get("function")
+    return (
+        tool.get("type") == "function"
+        and isinstance(function, dict)
+        and {"name", "description", "parameters"} <= function.keys()
+        and function["parameters"].get("type") == "object"
+    )
+
+
+# Tools that fail the structure check, computed once at import (names where
+# available, so a failure points at the offending tool)
+MALFORMED_TOOLS = [
+    tool.get("function", {}).get("name", repr(tool))
+    for tool in MCP_TOOLS
+    if not _has_function_structure(tool)
+]
+
+
 class TestToolSchemas:
     """Tests for tool schema definitions."""
 
-    def test_mcp_tools_is_list(self):
-        """Test MCP_TOOLS is a list of tool definitions."""
-        assert isinstance(MCP_TOOLS, list)
+    def test_mcp_tools_is_tuple(self):
+        """Test MCP_TOOLS is a tuple of tool definitions."""
+        assert isinstance(MCP_TOOLS, tuple)
         assert len(MCP_TOOLS) == 11  # 11 tools defined
 
     def test_all_tools_have_required_structure(self):
         """Test all tools have the required OpenAI function structure."""
-        for tool in MCP_TOOLS:
-            assert tool["type"] == "function"
-            assert "function" in tool
-            assert "name" in tool["function"]
-            assert "description" in tool["function"]
-            assert "parameters" in tool["function"]
-            assert tool["function"]["parameters"]["type"] == "object"
+        assert MALFORMED_TOOLS == []
 
     def test_tool_schemas_dict(self):
         """Test TOOL_SCHEMAS maps tool names to parameter schemas."""
@@ -180,281 +212,203 @@ class TestToolSchemas:
         schema = get_tool_schema("nonexistent_tool")
         assert schema is None
 
-    def test_get_all_tools_returns_copy(self):
-        """Test get_all_tools returns a copy of the tools list."""
-        tools1 = get_all_tools()
-        tools2 = get_all_tools()
-
-        assert tools1 is not tools2
-        assert tools1 == tools2
-
-    def test_create_trip_tool_schema(self):
-        """Test create_trip tool schema details."""
-        schema = CREATE_TRIP_TOOL["function"]
-
-        assert schema["name"] == "create_trip"
-        assert "vacation price tracking" in schema["description"].lower()
-
+    def test_get_all_tools_returns_shared_tuple(self):
+        """Test get_all_tools hands out the immutable registry without copying."""
+        tools = get_all_tools()
+
+        assert tools is MCP_TOOLS
+        assert isinstance(tools, tuple)
+
+    def test_tool_schemas_is_read_only(self):
+        """Test TOOL_SCHEMAS cannot be mutated by callers."""
+        with pytest.raises(TypeError):
+            TOOL_SCHEMAS["new_tool"] = {}  # type: ignore[index]
+
+        # Callers that need a mutable list still get a fresh one.
+        tools = list(get_all_tools())
+        tools.append({})
+        assert len(MCP_TOOLS) == 11
+
+    # Integer-typed optional params (adults/rooms/limit/offset) are intentionally
+    # omitted from the search tools because Llama-3.3 sometimes emits them as
+    # strings, which Groq's strict tool validation rejects. Defaults are applied
+    # in the wrappers.
+    @pytest.mark.fast
+    @pytest.mark.parametrize(
+        ("tool", "name", "required", "properties", "formats"),
+        [
+            pytest.param(
+                CREATE_TRIP_TOOL,
+                "create_trip",
+                # No required params - elicitation handles missing fields
+                set(),
+                {
+                    "name",
+                    "origin_airport",
+                    "destination_code",
+                    "depart_date",
+                    "return_date",
+                    "adults",
+                },
+                {},
+                id="create_trip",
+            ),
+            pytest.param(LIST_TRIPS_TOOL, "list_trips", set(), set(), {}, id="list_trips"),
+            pytest.param(
+                GET_TRIP_DETAILS_TOOL,
+                "get_trip_details",
+                {"trip_id"},
+                {"trip_id"},
+                {"trip_id": "uuid"},
+                id="get_trip_details",
+            ),
+            pytest.param(
+                SET_NOTIFICATION_TOOL,
+                "set_notification",
+                {"trip_id", "threshold_value"},
+                {"trip_id", "threshold_value", "threshold_type"},
+                {"trip_id": "uuid"},
+                id="set_notification",
+            ),
+            pytest.param(
+                PAUSE_TRIP_TOOL, "pause_trip", {"trip_id"}, {"trip_id"}, {}, id="pause_trip"
+            ),
+            pytest.param(
+                RESUME_TRIP_TOOL, "resume_trip", {"trip_id"}, {"trip_id"}, {}, id="resume_trip"
+            ),
+            pytest.param(
+                REFRESH_ALL_TRIP_PRICES_TOOL,
+                "refresh_all_trip_prices",
+                set(),
+                set(),
+                {},
+                id="refresh_all_trip_prices",
+            ),
+            pytest.param(
+                SEARCH_FLIGHTS_TOOL,
+                "search_flights",
+                {"origin", "destination", "departure_date"},
+                {"origin", "destination", "departure_date", "return_date", "max_stops", "sort"},
+                {"departure_date": "date"},
+                id="search_flights",
+            ),
+            pytest.param(
+                SEARCH_HOTELS_TOOL,
+                "search_hotels",
+                {"city", "checkin", "checkout"},
+                {"city", "checkin", "checkout", "sort"},
+                {"checkin": "date"},
+                id="search_hotels",
+            ),
+        ],
+    )
+    def test_tool_schema(self, tool, name, required, properties, formats):
+        """Test each tool's name, required params, properties, and formats."""
+        schema = tool["function"]
         params = schema["parameters"]
-        # No required params - elicitation handles missing fields
-        assert params["required"] == []
-        # But all properties should still be defined
-        assert "name" in params["properties"]
-        assert "origin_airport" in params["properties"]
-        assert "destination_code" in params["properties"]
-        assert "depart_date" in params["properties"]
-        assert "return_date" in params["properties"]
-        assert "adults" in params["properties"]
 
-        # Description should mention elicitation behavior
-        assert "only pass fields" in schema["description"].lower()
-
-    def test_list_trips_tool_schema(self):
-        """Test list_trips tool schema."""
-        schema = LIST_TRIPS_TOOL["function"]
+        assert schema["name"] == name
+        assert set(params["required"]) == required
+        assert properties <= params["properties"].keys()
+        for param_name, fmt in formats.items():
+            assert params["properties"][param_name]["format"] == fmt
 
-        assert schema["name"] == "list_trips"
-        assert len(schema["parameters"]["required"]) == 0
-        assert len(schema["parameters"]["properties"]) == 0
+    def test_create_trip_tool_description(self):
+        """Test create_trip description covers tracking and elicitation behavior."""
+        description = CREATE_TRIP_TOOL["function"]["description"].lower()
 
-    def test_get_trip_details_tool_schema(self):
-        """Test get_trip_details tool schema."""
-        schema = GET_TRIP_DETAILS_TOOL["function"]
+        assert "vacation price tracking" in description
+        # Description should mention elicitation behavior
+        assert "only pass fields" in description
 
-        assert schema["name"] == "get_trip_details"
-        assert "trip_id" in schema["parameters"]["required"]
-        assert schema["parameters"]["properties"]["trip_id"]["format"] == "uuid"
+    def test_list_trips_tool_has_no_properties(self):
+        """Test list_trips takes no parameters at all."""
+        assert len(LIST_TRIPS_TOOL["function"]["parameters"]["properties"]) == 0
 
-    def test_set_notification_tool_schema(self):
-        """Test set_notification tool schema."""
-        schema = SET_NOTIFICATION_TOOL["function"]
+    def test_set_notification_threshold_type_enum(self):
+        """Test set_notification threshold_type enum values."""
+        properties = SET_NOTIFICATION_TOOL["function"]["parameters"]["properties"]
 
-        assert schema["name"] == "set_notification"
-        assert "trip_id" in schema["parameters"]["required"]
-        assert "threshold_value" in schema["parameters"]["required"]
-        assert schema["parameters"]["properties"]["threshold_type"]["enum"] == [
+        assert properties["threshold_type"]["enum"] == [
             "trip_total",
             "flight_total",
             "hotel_total",
         ]
 
-    def test_pause_trip_tool_schema(self):
-        """Test pause_trip tool schema."""
-        schema = PAUSE_TRIP_TOOL["function"]
 
-        assert schema["name"] == "pause_trip"
-        assert schema["parameters"]["required"] == ["trip_id"]
-
-    def test_resume_trip_tool_schema(self):
-        """Test resume_trip tool schema."""
-        schema = RESUME_TRIP_TOOL["function"]
-
-        assert schema["name"] == "resume_trip"
-        assert schema["parameters"]["required"] == ["trip_id"]
+# =============================================================================
+# Validation Function Tests
+# =============================================================================
 
-    def test_refresh_all_trip_prices_tool_schema(self):
-        """Test refresh_all_trip_prices tool schema."""
-        schema = REFRESH_ALL_TRIP_PRICES_TOOL["function"]
 
-        assert schema["name"] == "refresh_all_trip_prices"
-        assert len(schema["parameters"]["required"]) == 0
+_UUID_SCHEMA = {"type": "string", "format": "uuid"}
+_DATE_SCHEMA = {"type": "string", "format": "date"}
+_PATTERN_SCHEMA = {"type": "string", "pattern": "^[A-Z]{3}$"}
+_ENUM_SCHEMA = {"type": "string", "enum": ["a", "b", "c"]}
+_STRING_ARRAY_SCHEMA = {"type": "array", "items": {"type": "string"}}
+
+# (value, schema, expected error fragments) - an empty tuple means valid.
+VALIDATE_TYPE_CASES = [
+    pytest.param("hello", {"type": "string"}, (), id="string-valid"),
+    pytest.param(123, {"type": "string"}, ("expected string",), id="string-wrong-type"),
+    pytest.param("ab", {"type": "string", "minLength": 3}, ("length must be >= 3",), id="string-min-length"),
+    pytest.param("toolong", {"type": "string", "maxLength": 5}, ("length must be <= 5",), id="string-max-length"),
+    pytest.param("ABC", _PATTERN_SCHEMA, (), id="string-pattern-match"),
+    pytest.param("abc", _PATTERN_SCHEMA, ("must match pattern",), id="string-pattern-mismatch"),
+    pytest.param("a", _ENUM_SCHEMA, (), id="string-enum-member"),
+    pytest.param("d", _ENUM_SCHEMA, ("must be one of",), id="string-enum-non-member"),
+    pytest.param(VALID_TRIP_ID, _UUID_SCHEMA, (), id="string-uuid-valid"),
+    pytest.param("not-a-uuid", _UUID_SCHEMA, ("must be a valid UUID",), id="string-uuid-invalid"),
+    pytest.param("2026-03-15", _DATE_SCHEMA, (), id="string-date-valid"),
+    pytest.param("15-03-2026", _DATE_SCHEMA, ("must be a valid date",), id="string-date-invalid"),
+    pytest.param(42, {"type": "integer"}, (), id="integer-valid"),
+    # In Python, bool is subclass of int, but we should reject it
+    pytest.param(True, {"type": "integer"}, ("expected integer",), id="integer-rejects-bool"),
+    pytest.param(0, {"type": "integer", "minimum": 1}, ("must be >= 1",), id="integer-minimum"),
+    pytest.param(10, {"type": "integer", "maximum": 9}, ("must be <= 9",), id="integer-maximum"),
+    pytest.param(3.14, {"type": "number"}, (), id="number-float"),
+    pytest.param(42, {"type": "number"}, (), id="number-int"),
+    pytest.param(False, {"type": "number"}, ("expected number",), id="number-rejects-bool"),
+    pytest.param(True, {"type": "boolean"}, (), id="boolean-true"),
+    pytest.param(False, {"type": "boolean"}, (), id="boolean-false"),
+    pytest.param(1, {"type": "boolean"}, ("expected boolean",), id="boolean-wrong-type"),
+    pytest.param(["a", "b"], {"type": "array"}, (), id="array-valid"),
+    pytest.param(["a", "b"], _STRING_ARRAY_SCHEMA, (), id="array-items-valid"),
+    pytest.param(["a", 1], _STRING_ARRAY_SCHEMA, ("field[1]",), id="array-items-invalid"),
+    pytest.param({"key": "value"}, {"type": "object"}, (), id="object-valid"),
+    pytest.param(None, {"type": "null"}, (), id="null-valid"),
+    pytest.param("anything", {}, (), id="no-type-in-schema"),
+]
 
-    def test_search_flights_tool_schema(self):
-        """Test search_flights tool schema.
 
-        Integer-typed optional params (adults/limit/offset) are intentionally
-        omitted because Llama-3.3 sometimes emits them as strings, which Groq's
-        strict tool validation rejects. Defaults are applied in the wrapper.
-        """
-        schema = SEARCH_FLIGHTS_TOOL["function"]
+class TestValidateType:
+    """Tests for the _validate_type helper function."""
 
-        assert schema["name"] == "search_flights"
-        assert set(schema["parameters"]["required"]) == {
-            "origin",
-            "destination",
-            "departure_date",
-        }
-        assert "origin" in schema["parameters"]["properties"]
-        assert "destination" in schema["parameters"]["properties"]
-        assert "departure_date" in schema["parameters"]["properties"]
-        assert "return_date" in schema["parameters"]["properties"]
-        assert "max_stops" in schema["parameters"]["properties"]
-        assert "sort" in schema["parameters"]["properties"]
-        assert schema["parameters"]["properties"]["departure_date"]["format"] == "date"
-
-    def test_search_hotels_tool_schema(self):
-        """Test search_hotels tool schema.
-
-        Integer-typed optional params (adults/rooms/limit/offset) are intentionally
-        omitted because Llama-3.3 sometimes emits them as strings, which Groq's
-        strict tool validation rejects. Defaults are applied in the wrapper.
-        """
-        schema = SEARCH_HOTELS_TOOL["function"]
-
-        assert schema["name"] == "search_hotels"
-        assert set(schema["parameters"]["required"]) == {"city", "checkin", "checkout"}
-        assert "city" in schema["parameters"]["properties"]
-        assert "checkin" in schema["parameters"]["properties"]
-        assert "checkout" in schema["parameters"]["properties"]
-        assert "sort" in schema["parameters"]["properties"]
-        assert schema["parameters"]["properties"]["checkin"]["format"] == "date"
+    @pytest.mark.fast
+    @pytest.mark.parametrize(("value", "schema", "expected_fragments"), VALIDATE_TYPE_CASES)
+    def test_validate_type(self, value, schema, expected_fragments):
+        """Test _validate_type reports exactly the expected errors, in order."""
+        errors = _validate_type(value, schema, "field")
 
+        assert len(errors) == len(expected_fragments)
+        for fragment, error in zip(expected_fragments, errors, strict=True):
+            assert fragment in error
 
-# =============================================================================
-# Validation Function Tests
-# =============================================================================
+    def test_pattern_is_compiled_once(self):
+        """Test schema patterns are compiled once and reused."""
+        assert _compiled_pattern("^[A-Z]{3}$") is _compiled_pattern("^[A-Z]{3}$")
 
+    def test_uuid_validity_is_cached(self):
+        """Test repeated UUID checks hit the cache instead of re-parsing."""
+        _is_valid_uuid.cache_clear()
 
-class TestValidateType:
-    """Tests for the _validate_type helper function."""
+        assert _is_valid_uuid(VALID_TRIP_ID) is True
+        assert _is_valid_uuid(VALID_TRIP_ID) is True
+        assert _is_valid_uuid("not-a-uuid") is False
 
-    def test_validate_string_valid(self):
-        """Test valid string validation."""
-        errors = _validate_type("hello", {"type": "string"}, "field")
-        assert errors == []
-
-    def test_validate_string_invalid_type(self):
-        """Test string validation with wrong type."""
-        errors = _validate_type(123, {"type": "string"}, "field")
-        assert len(errors) == 1
-        assert "expected string" in errors[0]
-
-    def test_validate_string_min_length(self):
-        """Test string minLength validation."""
-        schema = {"type": "string", "minLength": 3}
-        errors = _validate_type("ab", schema, "field")
-        assert len(errors) == 1
-        assert "length must be >= 3" in errors[0]
-
-    def test_validate_string_max_length(self):
-        """Test string maxLength validation."""
-        schema = {"type": "string", "maxLength": 5}
-        errors = _validate_type("toolong", schema, "field")
-        assert len(errors) == 1
-        assert "length must be <= 5" in errors[0]
-
-    def test_validate_string_pattern(self):
-        """Test string pattern validation."""
-        schema = {"type": "string", "pattern": "^[A-Z]{3}$"}
-        errors = _validate_type("ABC", schema, "field")
-        assert errors == []
-
-        errors = _validate_type("abc", schema, "field")
-        assert len(errors) == 1
-        assert "must match pattern" in errors[0]
-
-    def test_validate_string_enum(self):
-        """Test string enum validation."""
-        schema = {"type": "string", "enum": ["a", "b", "c"]}
-        errors = _validate_type("a", schema, "field")
-        assert errors == []
-
-        errors = _validate_type("d", schema, "field")
-        assert len(errors) == 1
-        assert "must be one of" in errors[0]
-
-    def test_validate_string_format_uuid(self):
-        """Test string format uuid validation."""
-        schema = {"type": "string", "format": "uuid"}
-        valid_uuid = "550e8400-e29b-41d4-a716-446655440000"
-        errors = _validate_type(valid_uuid, schema, "field")
-        assert errors == []
-
-        errors = _validate_type("not-a-uuid", schema, "field")
-        assert len(errors) == 1
-        assert "must be a valid UUID" in errors[0]
-
-    def test_validate_string_format_date(self):
-        """Test string format date validation."""
-        schema = {"type": "string", "format": "date"}
-        errors = _validate_type("2026-03-15", schema, "field")
-        assert errors == []
-
-        errors = _validate_type("15-03-2026", schema, "field")
-        assert len(errors) == 1
-        assert "must be a valid date" in errors[0]
-
-    def test_validate_integer_valid(self):
-        """Test valid integer validation."""
-        errors = _validate_type(42, {"type": "integer"}, "field")
-        assert errors == []
-
-    def test_validate_integer_rejects_bool(self):
-        """Test integer validation rejects booleans."""
-        # In Python, bool is subclass of int, but we should reject it
-        errors = _validate_type(True, {"type": "integer"}, "field")
-        assert len(errors) == 1
-
-    def test_validate_integer_minimum(self):
-        """Test integer minimum validation."""
-        schema = {"type": "integer", "minimum": 1}
-        errors = _validate_type(0, schema, "field")
-        assert len(errors) == 1
-        assert "must be >= 1" in errors[0]
-
-    def test_validate_integer_maximum(self):
-        """Test integer maximum validation."""
-        schema = {"type": "integer", "maximum": 9}
-        errors = _validate_type(10, schema, "field")
-        assert len(errors) == 1
-        assert "must be <= 9" in errors[0]
-
-    def test_validate_number_valid(self):
-        """Test valid number validation."""
-        errors = _validate_type(3.14, {"type": "number"}, "field")
-        assert errors == []
-
-        errors = _validate_type(42, {"type": "number"}, "field")
-        assert errors == []
-
-    def test_validate_number_rejects_bool(self):
-        """Test number validation rejects booleans."""
-        errors = _validate_type(False, {"type": "number"}, "field")
-        assert len(errors) == 1
-
-    def test_validate_boolean_valid(self):
-        """Test valid boolean validation."""
-        errors = _validate_type(True, {"type": "boolean"}, "field")
-        assert errors == []
-
-        errors = _validate_type(False, {"type": "boolean"}, "field")
-        assert errors == []
-
-    def test_validate_boolean_invalid(self):
-        """Test boolean validation with wrong type."""
-        errors = _validate_type(1, {"type": "boolean"}, "field")
-        assert len(errors) == 1
-        assert "expected boolean" in errors[0]
-
-    def test_validate_array_valid(self):
-        """Test valid array validation."""
-        errors = _validate_type(["a", "b"], {"type": "array"}, "field")
-        assert errors == []
-
-    def test_validate_array_items(self):
-        """Test array items validation."""
-        schema = {"type": "array", "items": {"type": "string"}}
-        errors = _validate_type(["a", "b"], schema, "field")
-        assert errors == []
-
-        errors = _validate_type(["a", 1], schema, "field")
-        assert len(errors) == 1
-        assert "field[1]" in errors[0]
-
-    def test_validate_object_valid(self):
-        """Test valid object validation."""
-        errors = _validate_type({"key": "value"}, {"type": "object"}, "field")
-        assert errors == []
-
-    def test_validate_null_valid(self):
-        """Test null type validation."""
-        errors = _validate_type(None, {"type": "null"}, "field")
-        assert errors == []
-
-    def test_validate_no_type_in_schema(self):
-        """Test validation with no type in schema (passes)."""
-        errors = _validate_type("anything", {}, "field")
-        assert errors == []
+        info = _is_valid_uuid.cache_info()
+        assert info.hits == 1
+        assert info.misses == 2
 
 
 class TestValidateToolArgs:
@@ -495,7 +449,7 @@ class TestValidateToolArgs:
 
     def test_validate_get_trip_details_valid_uuid(self):
         """Test get_trip_details with valid UUID."""
-        args = {"trip_id": "550e8400-e29b-41d4-a716-446655440000"}
+        args = {"trip_id": VALID_TRIP_ID}
         validate_tool_args("get_trip_details", args)  # Should not raise
 
     def test_validate_get_trip_details_invalid_uuid(self):
@@ -504,12 +458,12 @@ class TestValidateToolArgs:
         with pytest.raises(ToolValidationError) as exc_info:
             validate_tool_args("get_trip_details", args)
 
-        assert "must be a valid UUID" in str(exc_info.value.details)
+        assert any("must be a valid UUID" in e for e in exc_info.value.details["errors"])
 
     def test_validate_set_notification_valid(self):
         """Test set_notification with valid args."""
         args = {
-            "trip_id": "550e8400-e29b-41d4-a716-446655440000",
+            "trip_id": VALID_TRIP_ID,
             "threshold_value": 500.00,
             "threshold_type": "trip_total",
         }
@@ -518,14 +472,14 @@ class TestValidateToolArgs:
     def test_validate_set_notification_invalid_type(self):
         """Test set_notification with invalid threshold_type."""
         args = {
-            "trip_id": "550e8400-e29b-41d4-a716-446655440000",
+            "trip_id": VALID_TRIP_ID,
             "threshold_value": 500.00,
             "threshold_type": "invalid_type",
         }
         with pytest.raises(ToolValidationError) as exc_info:
             validate_tool_args("set_notification", args)
 
-        assert "must be one of" in str(exc_info.value.details)
+        assert any("must be one of" in e for e in exc_info.value.details["errors"])
 
     def test_validate_unknown_tool(self):
         """Test validation with unknown tool name."""
@@ -537,7 +491,7 @@ class TestValidateToolArgs:
     def test_validate_ignores_unknown_parameters(self):
         """Test validation ignores parameters not in schema."""
         args = {
-            "trip_id": "550e8400-e29b-41d4-a716-446655440000",
+            "trip_id": VALID_TRIP_ID,
             "unknown_param": "ignored",
         }
         validate_tool_args("get_trip_details", args)  # Should not raise
@@ -559,17 +513,56 @@ class TestValidateToolArgs:
         }
         validate_tool_args("create_trip", args)  # Should not raise (no range validation)
 
+    def test_compiled_schema_is_reused(self):
+        """Test the compiled schema for a tool is built once and reused."""
+        compiled = _get_compiled_schema("set_notification")
+
+        assert compiled is _get_compiled_schema("set_notification")
+        assert compiled.required == ("trip_id", "threshold_value")
+        assert set(compiled.properties) == {"trip_id", "threshold_value", "threshold_type"}
+
+    def test_compiled_schema_unknown_tool(self):
+        """Test no schema is compiled for a tool without a schema."""
+        assert _get_compiled_schema("unknown_tool") is None
+
+    def test_compiled_schema_enum_uses_frozenset(self):
+        """Test compiled enum properties get a frozenset without touching TOOL_SCHEMAS."""
+        compiled = _get_compiled_schema("set_notification")
+        threshold_type = compiled.properties["threshold_type"]
+
+        assert threshold_type["_enum_set"] == frozenset({"trip_total", "flight_total", "hotel_total"})
+        assert threshold_type["enum"] == ["trip_total", "flight_total", "hotel_total"]
+        assert "_enum_set" not in TOOL_SCHEMAS["set_notification"]["properties"]["threshold_type"]
+
 
 # =============================================================================
 # MCPRouter Tests
 # =============================================================================
 
 
+_DEFAULT_RESULT = ToolResult(success=True, data={"mock": "data"})
+
+
+async def _ok_handler(args: dict[str, Any], user_id: str, db: Any = None) -> ToolResult:
+    """Function handler for tests that only need some tool registered."""
+    return _DEFAULT_RESULT
+
+
+async def _echo_handler(args: dict[str, Any], user_id: str, db: Any = None) -> ToolResult:
+    """Function handler that echoes back the user and arguments it was called with."""
+    return ToolResult(success=True, data={"user": user_id, "args": args})
+
+
+async def _failing_handler(args: dict[str, Any], user_id: str, db: Any = None) -> ToolResult:
+    """Function handler that always raises."""
+    raise ValueError("Something went wrong")
+
+
 class MockToolHandler:
-    """Mock tool handler for testing."""
+    """Mock tool handler for tests that inspect calls."""
 
     def __init__(self, result: ToolResult | None = None):
-        self.result = result or ToolResult(success=True, data={"mock": "data"})
+        self.result = result or _DEFAULT_RESULT
         self.call_count = 0
         self.last_args: dict[str, Any] = {}
         self.last_user_id: str = ""
@@ -582,17 +575,21 @@ class MockToolHandler:
         return self.result
 
 
+@pytest.fixture
+def router():
+    """Create a fresh MCPRouter for each test."""
+    return MCPRouter()
+
+
 class TestMCPRouter:
     """Tests for MCPRouter class."""
 
-    def test_router_initialization(self):
+    def test_router_initialization(self, router):
         """Test router initializes with empty registry."""
-        router = MCPRouter()
         assert router.get_registered_tools() == []
 
-    def test_register_class_handler(self):
+    def test_register_class_handler(self, router):
         """Test registering a class-based handler."""
-        router = MCPRouter()
         handler = MockToolHandler()
 
         router.register("test_tool", handler)
@@ -600,52 +597,39 @@ class TestMCPRouter:
         assert router.is_registered("test_tool")
         assert "test_tool" in router.get_registered_tools()
 
-    def test_register_function_handler(self):
+    def test_register_function_handler(self, router):
         """Test registering a function-based handler."""
-        router = MCPRouter()
-
-        async def handler(args: dict[str, Any], user_id: str, db: Any = None) -> ToolResult:
-            return ToolResult(success=True, data={"function": "handler"})
-
-        router.register("func_tool", handler)
+        router.register("func_tool", _echo_handler)
 
         assert router.is_registered("func_tool")
 
-    def test_unregister_existing(self):
+    def test_unregister_existing(self, router):
         """Test unregistering an existing tool."""
-        router = MCPRouter()
-        router.register("test", MockToolHandler())
+        router.register("test", _ok_handler)
 
         result = router.unregister("test")
 
         assert result is True
         assert not router.is_registered("test")
 
-    def test_unregister_nonexistent(self):
+    def test_unregister_nonexistent(self, router):
         """Test unregistering a non-existent tool."""
-        router = MCPRouter()
-
         result = router.unregister("nonexistent")
 
         assert result is False
 
-    def test_is_registered_true(self):
+    def test_is_registered_true(self, router):
         """Test is_registered returns True for registered tool."""
-        router = MCPRouter()
-        router.register("test", MockToolHandler())
+        router.register("test", _ok_handler)
 
         assert router.is_registered("test") is True
 
-    def test_is_registered_false(self):
+    def test_is_registered_false(self, router):
         """Test is_registered returns False for unregistered tool."""
-        router = MCPRouter()
-
         assert router.is_registered("test") is False
 
-    @pytest.mark.asyncio
-    async def test_execute_class_handler(self):
+    async def test_execute_class_handler(self, router):
         """Test executing a class-based handler."""
-        router = MCPRouter()
         handler = MockToolHandler(ToolResult(success=True, data={"id": "123"}))
         router.register("list_trips", handler)
 
@@ -656,15 +640,9 @@ class TestMCPRouter:
         assert handler.call_count == 1
         assert handler.last_user_id == "user-123"
 
-    @pytest.mark.asyncio
-    async def test_execute_function_handler(self):
+    async def test_execute_function_handler(self, router):
         """Test executing a function-based handler."""
-        router = MCPRouter()
-
-        async def handler(args: dict[str, Any], user_id: str, db: Any = None) -> ToolResult:
-            return ToolResult(success=True, data={"user": user_id, "args": args})
-
-        router.register("list_trips", handler)
+        router.register("list_trips", _echo_handler)
 
         result = await router.execute("list_trips", {"key": "value"}, "user-456")
 
@@ -672,21 +650,16 @@ class TestMCPRouter:
         assert result.data["user"] == "user-456"
         assert result.data["args"] == {"key": "value"}
 
-    @pytest.mark.asyncio
-    async def test_execute_unregistered_tool(self):
+    async def test_execute_unregistered_tool(self, router):
         """Test executing an unregistered tool."""
-        router = MCPRouter()
-
         result = await router.execute("unknown_tool", {}, "user-123")
 
         assert result.success is False
         assert "Tool not found" in result.error
 
-    @pytest.mark.asyncio
-    async def test_execute_with_validation_failure(self):
+    async def test_execute_with_validation_failure(self, router):
         """Test execute with validation failure."""
-        router = MCPRouter()
-        router.register("get_trip_details", MockToolHandler())
+        router.register("get_trip_details", _ok_handler)
 
         result = await router.execute(
             "get_trip_details",
@@ -697,10 +670,8 @@ class TestMCPRouter:
         assert result.success is False
         assert "Invalid arguments" in result.error
 
-    @pytest.mark.asyncio
-    async def test_execute_skip_validation(self):
+    async def test_execute_skip_validation(self, router):
         """Test execute with skip_validation flag."""
-        router = MCPRouter()
         handler = MockToolHandler()
         router.register("get_trip_details", handler)
 
@@ -714,15 +685,9 @@ class TestMCPRouter:
         assert result.success is True
         assert handler.call_count == 1
 
-    @pytest.mark.asyncio
-    async def test_execute_handler_exception(self):
+    async def test_execute_handler_exception(self, router):
         """Test execute handles handler exceptions."""
-        router = MCPRouter()
-
-        async def failing_handler(args: dict[str, Any], user_id: str, db: Any = None) -> ToolResult:
-            raise ValueError("Something went wrong")
-
-        router.register("list_trips", failing_handler)
+        router.register("list_trips", _failing_handler)
 
         result = await router.execute("list_trips", {}, "user-123")
 
@@ -730,10 +695,8 @@ class TestMCPRouter:
         assert "Tool execution failed" in result.error
         assert "Something went wrong" in result.error
 
-    @pytest.mark.asyncio
-    async def test_execute_tool_without_schema(self):
+    async def test_execute_tool_without_schema(self, router):
         """Test execute tool registered but without schema definition."""
-        router = MCPRouter()
         handler = MockToolHandler()
         router.register("custom_tool", handler)  # Not in TOOL_SCHEMAS
 
@@ -743,10 +706,8 @@ class TestMCPRouter:
         assert result.success is True
         assert handler.call_count == 1
 
-    @pytest.mark.asyncio
-    async def test_execute_passes_arguments_to_handler(self):
+    async def test_execute_passes_arguments_to_handler(self, router):
         """Test execute passes arguments correctly to handler."""
-        router = MCPRouter()
         handler = MockToolHandler()
         router.register("list_trips", handler)
 
@@ -755,10 +716,8 @@ class TestMCPRouter:
 
         assert handler.last_args == args
 
-    @pytest.mark.asyncio
-    async def test_execute_from_json_valid(self):
+    async def test_execute_from_json_valid(self, router):
         """Test execute_from_json with valid JSON."""
-        router = MCPRouter()
         handler = MockToolHandler()
         router.register("list_trips", handler)
 
@@ -771,11 +730,9 @@ class TestMCPRouter:
         assert result.success is True
         assert handler.last_args == {"filter": "active"}
 
-    @pytest.mark.asyncio
-    async def test_execute_from_json_invalid_json(self):
+    async def test_execute_from_json_invalid_json(self, router):
         """Test execute_from_json with invalid JSON."""
-        router = MCPRouter()
-        router.register("list_trips", MockToolHandler())
+        router.register("list_trips", _ok_handler)
 
         result = await router.execute_from_json(
             "list_trips",
@@ -786,11 +743,9 @@ class TestMCPRouter:
         assert result.success is False
         assert "Invalid JSON" in result.error
 
-    @pytest.mark.asyncio
-    async def test_execute_from_json_non_object(self):
+    async def test_execute_from_json_non_object(self, router):
         """Test execute_from_json with non-object JSON."""
-        router = MCPRouter()
-        router.register("list_trips", MockToolHandler())
+        router.register("list_trips", _ok_handler)
 
         result = await router.execute_from_json(
             "list_trips",
@@ -801,6 +756,26 @@ class TestMCPRouter:
         assert result.success is False
         assert "must be a JSON object" in result.error
 
+    @pytest.mark.fast
+    @pytest.mark.parametrize("arguments_json", ['"text"', "  42", "-1.5", "true"])
+    async def test_execute_from_json_non_object_roots(self, router, arguments_json):
+        """Test scalar JSON roots are rejected as non-objects."""
+        router.register("list_trips", _ok_handler)
+
+        result = await router.execute_from_json("list_trips", arguments_json, "user-123")
+
+        assert result.success is False
+        assert "must be a JSON object" in result.error
+
+    async def test_execute_from_json_truncated_array_is_invalid_json(self, router):
+        """Test malformed JSON reports a decode error even when it starts like an array."""
+        router.register("list_trips", _ok_handler)
+
+        result = await router.execute_from_json("list_trips", "[1, 2", "user-123")
+
+        assert result.success is False
+        assert "Invalid JSON" in result.error
+
 
 # =============================================================================
 # Singleton Router Tests
@@ -810,12 +785,11 @@ class TestMCPRouter:
 class TestSingletonRouter:
     """Tests for singleton router instance."""
 
-    def setup_method(self):
-        """Reset singleton before each test."""
+    @pytest.fixture(autouse=True)
+    def reset_global_router(self):
+        """Reset the singleton before and after each test."""
         reset_mcp_router()
-
-    def teardown_method(self):
-        """Reset singleton after each test."""
+        yield
         reset_mcp_router()
 
     def test_get_mcp_router_creates_instance(self):
@@ -833,7 +807,7 @@ class TestSingletonRouter:
     def test_reset_mcp_router(self):
         """Test reset_mcp_router clears the singleton."""
         router1 = get_mcp_router()
-        router1.register("test", MockToolHandler())
+        router1.register("test", _ok_handler)
 
         reset_mcp_router()
         router2 = get_mcp_router()
@@ -895,107 +869,115 @@ class TestExceptions:
 # =============================================================================
 
 
+async def _list_trips_handler(args: dict[str, Any], user_id: str, db: Any = None) -> ToolResult:
+    """Simulated list_trips handler returning a single trip."""
+    return ToolResult(
+        success=True,
+        data={
+            "action": "list",
+            "trips": [
+                {
+                    "id": "trip-1",
+                    "name": "Hawaii",
+                    "status": "active",
+                }
+            ],
+            "count": 1,
+        },
+    )
+
+
+async def _create_trip_handler(args: dict[str, Any], user_id: str, db: Any = None) -> ToolResult:
+    """Simulated create_trip handler echoing the trip name."""
+    return ToolResult(
+        success=True,
+        data={
+            "trip_id": str(uuid.uuid4()),
+            "name": args["name"],
+            "message": f"Created trip '{args['name']}'",
+        },
+    )
+
+
+async def _details_handler(args: dict[str, Any], user_id: str, db: Any = None) -> ToolResult:
+    """Simulated get_trip_details handler."""
+    return ToolResult(success=True, data={"action": "details"})
+
+
+async def _pause_handler(args: dict[str, Any], user_id: str, db: Any = None) -> ToolResult:
+    """Simulated pause_trip handler."""
+    return ToolResult(success=True, data={"action": "pause"})
+
+
+@pytest.fixture
+def user_id() -> str:
+    """A fresh user id for one test."""
+    return str(uuid.uuid4())
+
+
+@pytest.fixture
+def trip_id() -> str:
+    """A fresh trip id for one test."""
+    return str(uuid.uuid4())
+
+
+@pytest.fixture(scope="class")
+def integration_router():
+    """One router with every handler registered, shared by a test class.
+
+    The handlers are stateless, so no test can observe another's calls.
+    """
+    router = MCPRouter()
+    router.register("list_trips", _list_trips_handler)
+    router.register("create_trip", _create_trip_handler)
+    router.register("get_trip_details", _details_handler)
+    router.register("pause_trip", _pause_handler)
+    return router
+
+
 class TestMCPRouterIntegration:
     """Integration tests for MCPRouter with realistic tool handlers."""
 
-    @pytest.mark.asyncio
-    async def test_full_tool_call_flow(self):
+    async def test_full_tool_call_flow(self, integration_router, user_id):
         """Test complete tool call flow from registration to execution."""
-        router = MCPRouter()
-
-        # Simulate a list_trips tool handler
-        async def list_trips_handler(args: dict[str, Any], user_id: str, db: Any = None) -> ToolResult:
-            return ToolResult(
-                success=True,
-                data={
-                    "trips": [
-                        {
-                            "id": "trip-1",
-                            "name": "Hawaii",
-                            "status": "active",
-                        }
-                    ],
-                    "count": 1,
-                },
-            )
-
-        router.register("list_trips", list_trips_handler)
-
         # Execute via JSON (simulating LLM tool call)
-        result = await router.execute_from_json(
+        result = await integration_router.execute_from_json(
             "list_trips",
             "{}",
-            str(uuid.uuid4()),
+            user_id,
         )
 
         assert result.success is True
         assert len(result.data["trips"]) == 1
         assert result.data["trips"][0]["name"] == "Hawaii"
 
-    @pytest.mark.asyncio
-    async def test_create_trip_validation_flow(self):
+    async def test_create_trip_validation_flow(self, integration_router, user_id):
         """Test create_trip validation and execution flow."""
-        router = MCPRouter()
-
-        async def create_trip_handler(args: dict[str, Any], user_id: str, db: Any = None) -> ToolResult:
-            return ToolResult(
-                success=True,
-                data={
-                    "trip_id": str(uuid.uuid4()),
-                    "name": args["name"],
-                    "message": f"Created trip '{args['name']}'",
-                },
-            )
-
-        router.register("create_trip", create_trip_handler)
-
         # Valid creation
-        valid_args = json.dumps(
-            {
-                "name": "Hawaii Spring 2026",
-                "origin_airport": "SFO",
-                "destination_code": "HNL",
-                "depart_date": "2026-03-15",
-                "return_date": "2026-03-22",
-            }
-        )
-
-        result = await router.execute_from_json(
+        result = await integration_router.execute_from_json(
             "create_trip",
-            valid_args,
-            str(uuid.uuid4()),
+            CREATE_TRIP_JSON,
+            user_id,
         )
 
         assert result.success is True
         assert result.data["name"] == "Hawaii Spring 2026"
 
-    @pytest.mark.asyncio
-    async def test_multiple_tools_registered(self):
+    async def test_multiple_tools_registered(self, integration_router, user_id, trip_id):
         """Test router with multiple tools registered."""
-        router = MCPRouter()
-
-        async def list_handler(args: dict[str, Any], user_id: str, db: Any = None) -> ToolResult:
-            return ToolResult(success=True, data={"action": "list"})
-
-        async def details_handler(args: dict[str, Any], user_id: str, db: Any = None) -> ToolResult:
-            return ToolResult(success=True, data={"action": "details"})
-
-        async def pause_handler(args: dict[str, Any], user_id: str, db: Any = None) -> ToolResult:
-            return ToolResult(success=True, data={"action": "pause"})
-
-        router.register("list_trips", list_handler)
-        router.register("get_trip_details", details_handler)
-        router.register("pause_trip", pause_handler)
-
-        assert len(router.get_registered_tools()) == 3
+        assert set(integration_router.get_registered_tools()) == {
+            "list_trips",
+            "create_trip",
+            "get_trip_details",
+            "pause_trip",
+        }
 
         # Execute each
-        result1 = await router.execute("list_trips", {}, "user-1")
+        result1 = await integration_router.execute("list_trips", {}, user_id)
         assert result1.data["action"] == "list"
 
-        valid_uuid = str(uuid.uuid4())
-        result2 = await router.execute("get_trip_details", {"trip_id": valid_uuid}, "user-1")
+        result2 = await integration_router.execute("get_trip_details", {"trip_id": trip_id}, user_id)
         assert result2.data["action"] == "details"
 
-        result3 = await router.execute("pause_trip", {"trip_id": valid_uuid}, "user-1")
+        result3 = await integration_router.execute("pause_trip", {"trip_id": trip_id}, user_id)
         assert result3.data["action"] == "pause"
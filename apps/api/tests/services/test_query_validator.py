@@ -8,8 +8,14 @@ Coverage targets:
 
 from __future__ import annotations
 
+import dataclasses
+import logging
+from unittest.mock import patch
+
+import pytest
 from app.services.query_validator import (
     QueryValidationResult,
+    _classify_query,
     _contains_travel_keywords,
     _is_greeting_or_simple,
     _matches_non_travel_pattern,
@@ -18,6 +24,24 @@ from app.services.query_validator import (
     validate_query,
 )
 
+# Parametrized case tables here are cut to one case each under --fast.
+pytestmark = pytest.mark.fast
+
+# Awkward inputs for the normalization invariants: control characters,
+# right-to-left text, case-folding edge cases, and long whitespace runs.
+NORMALIZE_EDGE_CASES = [
+    pytest.param("", id="empty"),
+    pytest.param("HELLO WORLD", id="uppercase"),
+    pytest.param("  hello  ", id="padded"),
+    pytest.param("hello world", id="internal-spacing"),
+    pytest.param("a\x00b", id="nul-byte"),
+    pytest.param("\t\n BOOK \r\n", id="mixed-whitespace"),
+    pytest.param(" " * 1000 + "Trip" + " " * 1000, id="long-whitespace-run"),
+    pytest.param("רחוב TRIP", id="rtl-text"),
+    pytest.param("İSTANBUL ΣΟΦΊΑ", id="unicode-case-folding"),
+    pytest.param("\u00a0FLIGHT\u2003", id="unicode-spaces"),
+]
+
 
 class TestNormalizeQuery:
     """Tests for _normalize_query helper."""
@@ -34,141 +58,146 @@ class TestNormalizeQuery:
         """Test that internal spacing is preserved."""
         assert _normalize_query("hello world") == "hello world"
 
+    @pytest.mark.parametrize("query", NORMALIZE_EDGE_CASES)
+    def test_invariants(self, query):
+        """Test normalization is idempotent, lowercase, and stripped."""
+        normalized = _normalize_query(query)
 
-class TestContainsTravelKeywords:
-    """Tests for _contains_travel_keywords helper."""
-
-    def test_detects_flight_keyword(self):
-        """Test detection of flight-related keywords."""
-        has_keywords, count = _contains_travel_keywords("book a flight to hawaii")
-        assert has_keywords is True
-        assert count >= 1
-
-    def test_detects_hotel_keyword(self):
-        """Test detection of hotel-related keywords."""
-        has_keywords, count = _contains_travel_keywords("find me a hotel")
-        assert has_keywords is True
-        assert count >= 1
-
-    def test_detects_trip_keyword(self):
-        """Test detection of trip-related keywords."""
-        has_keywords, count = _contains_travel_keywords("create a new trip")
-        assert has_keywords is True
-        assert count >= 1
-
-    def test_detects_multiple_keywords(self):
-        """Test detection of multiple travel keywords."""
-        has_keywords, count = _contains_travel_keywords(
-            "track flight prices for my vacation trip to hawaii"
-        )
-        assert has_keywords is True
-        assert count >= 3  # flight, prices, vacation, trip
+        assert _normalize_query(normalized) == normalized
+        assert normalized == normalized.lower()
+        assert normalized == normalized.strip()
 
-    def test_detects_airport_codes(self):
-        """Test detection of common airport codes."""
-        has_keywords, count = _contains_travel_keywords("fly from SFO to LAX")
-        assert has_keywords is True
 
-    def test_no_travel_keywords(self):
-        """Test query with no travel keywords."""
-        has_keywords, count = _contains_travel_keywords("what is the weather today")
-        assert has_keywords is False
-        assert count == 0
+class TestContainsTravelKeywords:
+    """Tests for _contains_travel_keywords helper."""
 
-    def test_case_insensitive(self):
-        """Test that keyword matching is case-insensitive."""
-        has_keywords, _ = _contains_travel_keywords("BOOK A FLIGHT")
-        assert has_keywords is True
+    @pytest.mark.parametrize(
+        ("query", "expect_hit", "min_count"),
+        [
+            pytest.param("book a flight to hawaii", True, 1, id="flight"),
+            pytest.param("find me a hotel", True, 1, id="hotel"),
+            pytest.param("create a new trip", True, 1, id="trip"),
+            # flight, prices, vacation, trip
+            pytest.param("track flight prices for my vacation trip to hawaii", True, 3, id="multiple"),
+            pytest.param("fly from SFO to LAX", True, 1, id="airport-codes"),
+            pytest.param("BOOK A FLIGHT", True, 1, id="case-insensitive"),
+            pytest.param("what is the weather today", False, 0, id="no-keywords"),
+        ],
+    )
+    def test_keyword_detection(self, query, expect_hit, min_count):
+        """Test travel keyword detection and counting."""
+        has_keywords, count = _contains_travel_keywords(_normalize_query(query))
+        assert has_keywords is expect_hit
+        assert count >= min_count
+        if not expect_hit:
+            assert count == 0
 
 
 class TestMatchesNonTravelPattern:
     """Tests for _matches_non_travel_pattern helper."""
 
-    def test_detects_drop_table(self):
-        """Test detection of SQL injection patterns."""
-        matches, _ = _matches_non_travel_pattern("drop table users")
-        assert matches is True
-
-    def test_detects_delete_database(self):
-        """Test detection of database deletion patterns."""
-        matches, _ = _matches_non_travel_pattern("delete database production")
-        assert matches is True
-
-    def test_detects_execute_command(self):
-        """Test detection of command execution patterns."""
-        matches, _ = _matches_non_travel_pattern("execute command rm -rf")
-        assert matches is True
-
-    def test_detects_shell_access(self):
-        """Test detection of shell access patterns."""
-        matches, _ = _matches_non_travel_pattern("give me shell access")
-        assert matches is True
-
-    def test_detects_hack_keyword(self):
-        """Test detection of hacking-related keywords."""
-        matches, _ = _matches_non_travel_pattern("hack into the system")
-        assert matches is True
-
-    def test_detects_password_dump(self):
-        """Test detection of password-related attacks."""
-        matches, _ = _matches_non_travel_pattern("password hash crack")
-        assert matches is True
-
-    def test_allows_normal_travel_query(self):
-        """Test that normal travel queries are not flagged."""
-        matches, _ = _matches_non_travel_pattern("book a flight to paris")
-        assert matches is False
-
-    def test_allows_trip_deletion(self):
-        """Test that legitimate trip deletion is not flagged."""
-        # This should be allowed - it's deleting a trip, not a database table
-        matches, _ = _matches_non_travel_pattern("delete my hawaii trip")
-        assert matches is False
+    @pytest.mark.parametrize(
+        ("query", "expect_match"),
+        [
+            pytest.param("drop table users", True, id="drop-table"),
+            pytest.param("delete database production", True, id="delete-database"),
+            pytest.param("execute command rm -rf", True, id="execute-command"),
+            pytest.param("give me shell access", True, id="shell-access"),
+            pytest.param("hack into the system", True, id="hack"),
+            pytest.param("password hash crack", True, id="password-dump"),
+            pytest.param("book a flight to paris", False, id="normal-travel-query"),
+            # Deleting a trip is legitimate, unlike deleting a database table
+            pytest.param("delete my hawaii trip", False, id="trip-deletion"),
+        ],
+    )
+    def test_pattern_matching(self, query, expect_match):
+        """Test non-travel patterns are flagged and travel queries are not."""
+        matches, _ = _matches_non_travel_pattern(query)
+        assert matches is expect_match
 
 
 class TestIsGreetingOrSimple:
     """Tests for _is_greeting_or_simple helper."""
 
-    def test_recognizes_hi(self):
-        """Test recognition of 'hi' greeting."""
-        assert _is_greeting_or_simple("hi") is True
-
-    def test_recognizes_hello(self):
-        """Test recognition of 'hello' greeting."""
-        assert _is_greeting_or_simple("hello!") is True
-
-    def test_recognizes_hey(self):
-        """Test recognition of 'hey' greeting."""
-        assert _is_greeting_or_simple("hey") is True
-
-    def test_recognizes_good_morning(self):
-        """Test recognition of 'good morning'."""
-        assert _is_greeting_or_simple("good morning") is True
-
-    def test_recognizes_thanks(self):
-        """Test recognition of thanks."""
-        assert _is_greeting_or_simple("thanks!") is True
-
-    def test_recognizes_thank_you(self):
-        """Test recognition of thank you."""
-        assert _is_greeting_or_simple("thank you") is True
-
-    def test_recognizes_help(self):
-        """Test recognition of help request."""
-        assert _is_greeting_or_simple("help") is True
-
-    def test_recognizes_bye(self):
-        """Test recognition of goodbye."""
-        assert _is_greeting_or_simple("bye") is True
-
-    def test_not_greeting(self):
-        """Test that non-greetings are not recognized."""
-        assert _is_greeting_or_simple("book a flight") is False
-
-    def test_greeting_with_extra_text(self):
-        """Test that greetings with extra text are not matched."""
-        # "hi how are you" is not a simple greeting
-        assert _is_greeting_or_simple("hi how are you") is False
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            pytest.param("hi", True, id="hi"),
+            pytest.param("hello!", True, id="hello"),
+            pytest.param("hey", True, id="hey"),
+            pytest.param("good morning", True, id="good-morning"),
+            pytest.param("thanks!", True, id="thanks"),
+            pytest.param("thank you", True, id="thank-you"),
+            pytest.param("help", True, id="help"),
+            pytest.param("bye", True, id="bye"),
+            pytest.param("book a flight", False, id="not-greeting"),
+            # "hi how are you" is not a simple greeting
+            pytest.param("hi how are you", False, id="greeting-with-extra-text"),
+        ],
+    )
+    def test_greeting(self, query, expected):
+        """Test recognition of greetings and simple acknowledgments."""
+        assert _is_greeting_or_simple(_normalize_query(query)) is expected
+
+    @pytest.mark.parametrize(
+        "phrase",
+        [
+            "hi",
+            "hello",
+            "hey",
+            "greetings",
+            "good morning",
+            "good afternoon",
+            "good evening",
+            "thanks",
+            "thank you",
+            "ok",
+            "okay",
+            "sure",
+            "yes",
+            "no",
+            "bye",
+            "goodbye",
+            "help",
+            "what can you do",
+            "how do you work?",
+        ],
+    )
+    def test_every_simple_phrase_is_recognized(self, phrase):
+        """Test each phrase covered by the simple-query patterns is recognized."""
+        assert _is_greeting_or_simple(phrase) is True
+
+
+# (query, min_confidence, max_confidence) - None leaves that bound unchecked.
+VALID_QUERIES = [
+    pytest.param("I want to track flight prices to Hawaii", 0.7, None, id="travel-keywords"),
+    pytest.param("Create a new trip to Paris for next month", None, None, id="trip-creation"),
+    pytest.param("Set a price alert when my trip drops below $1000", None, None, id="price-alert"),
+    pytest.param("Hello!", 1.0, 1.0, id="greeting"),
+    pytest.param("help", None, None, id="help-request"),
+    # Short ambiguous queries are allowed, but not with full confidence
+    pytest.param("yes please", None, 1.0, id="short-ambiguous"),
+    # Longer non-travel queries are currently allowed, with low confidence
+    pytest.param("What is the capital of France and how do I cook pasta?", None, 0.5, id="longer-non-travel"),
+    pytest.param("What's the code for San Francisco airport? I think it's SFO", None, None, id="airport-code"),
+    pytest.param("Show me all my trips", None, None, id="list-trips"),
+    pytest.param("Refresh prices for my vacation", None, None, id="refresh-prices"),
+    pytest.param("Book a flight to París 🇫🇷", None, None, id="unicode"),
+    pytest.param("I want to track flight prices " * 100, None, None, id="very-long"),
+    pytest.param("What's the price for SFO -> LAX?", None, None, id="special-characters"),
+    pytest.param("Track FLIGHT prices to HAWAII", None, None, id="mixed-case-keywords"),
+    # SQL-like words in a travel context are fine
+    pytest.param("Please delete my Seattle trip", None, None, id="sql-keyword-in-travel-context"),
+    # File-like words in a travel context are fine
+    pytest.param("Can you read my trip details", None, None, id="file-operation-in-travel-context"),
+]
+
+# (query, min_confidence) - None leaves the bound unchecked.
+INVALID_QUERIES = [
+    pytest.param("   ", None, id="whitespace-only"),
+    pytest.param("drop table users; --", 0.9, id="sql-injection"),
+    pytest.param("execute sql query to delete everything", None, id="command-execution"),
+]
 
 
 class TestValidateQuery:
@@ -180,77 +209,54 @@ class TestValidateQuery:
         assert result.is_valid is False
         assert "Empty" in result.reason
 
-    def test_whitespace_only_query(self):
-        """Test validation of whitespace-only query."""
-        result = validate_query("   ")
-        assert result.is_valid is False
-
-    def test_malicious_sql_injection(self):
-        """Test rejection of SQL injection attempts."""
-        result = validate_query("drop table users; --")
-        assert result.is_valid is False
-        assert result.confidence >= 0.9
-
-    def test_malicious_command_execution(self):
-        """Test rejection of command execution attempts."""
-        result = validate_query("execute sql query to delete everything")
-        assert result.is_valid is False
-
-    def test_valid_travel_query_with_keywords(self):
-        """Test acceptance of valid travel query."""
-        result = validate_query("I want to track flight prices to Hawaii")
+    @pytest.mark.parametrize(("query", "min_confidence", "max_confidence"), VALID_QUERIES)
+    def test_valid(self, query, min_confidence, max_confidence):
+        """Test in-scope queries are accepted within the expected confidence bounds."""
+        result = validate_query(query)
         assert result.is_valid is True
-        assert result.confidence >= 0.7
+        if min_confidence is not None:
+            assert result.confidence >= min_confidence
+        if max_confidence is not None:
+            assert result.confidence <= max_confidence
+
+    @pytest.mark.parametrize(("query", "min_confidence"), INVALID_QUERIES)
+    def test_invalid(self, query, min_confidence):
+        """Test empty and malicious queries are rejected."""
+        result = validate_query(query)
+        assert result.is_valid is False
+        if min_confidence is not None:
+            assert result.confidence >= min_confidence
 
-    def test_valid_trip_creation(self):
-        """Test acceptance of trip creation query."""
-        result = validate_query("Create a new trip to Paris for next month")
-        assert result.is_valid is True
+    def test_repeated_query_reuses_cached_result(self):
+        """Test identical queries are classified once and share the result."""
+        _classify_query.cache_clear()
 
-    def test_valid_price_alert(self):
-        """Test acceptance of price alert query."""
-        result = validate_query("Set a price alert when my trip drops below $1000")
-        assert result.is_valid is True
+        first = validate_query("book a flight to Hawaii")
+        second = validate_query("  Book a flight to Hawaii ")
 
-    def test_greeting_is_valid(self):
-        """Test that greetings are accepted."""
-        result = validate_query("Hello!")
-        assert result.is_valid is True
-        assert result.confidence == 1.0
+        assert second is first
+        assert _classify_query.cache_info().hits == 1
 
-    def test_help_request_is_valid(self):
-        """Test that help requests are accepted."""
-        result = validate_query("help")
-        assert result.is_valid is True
+    def test_query_is_normalized_once(self):
+        """Test the normalized query is threaded through every helper."""
+        _classify_query.cache_clear()
 
-    def test_short_ambiguous_query(self):
-        """Test that short ambiguous queries are allowed."""
-        result = validate_query("yes please")
-        assert result.is_valid is True
-        # But confidence should be lower
-        assert result.confidence <= 1.0
+        with patch(
+            "app.services.query_validator._normalize_query",
+            wraps=_normalize_query,
+        ) as mock_normalize:
+            validate_query("Track flight prices to Hawaii for my next vacation")
 
-    def test_longer_non_travel_query(self):
-        """Test handling of longer non-travel queries."""
-        result = validate_query("What is the capital of France and how do I cook pasta?")
-        # Currently we allow these but with low confidence
-        assert result.is_valid is True
-        assert result.confidence < 0.7
+        mock_normalize.assert_called_once()
 
-    def test_airport_code_query(self):
-        """Test that airport code queries are valid."""
-        result = validate_query("What's the code for San Francisco airport? I think it's SFO")
-        assert result.is_valid is True
+    def test_cached_rejection_is_still_logged(self, caplog):
+        """Test every rejected query is logged, even when served from cache."""
+        with caplog.at_level(logging.WARNING, logger="app.services.query_validator"):
+            validate_query("drop table users")
+            validate_query("drop table users")
 
-    def test_list_trips_query(self):
-        """Test that list trips query is valid."""
-        result = validate_query("Show me all my trips")
-        assert result.is_valid is True
-
-    def test_refresh_prices_query(self):
-        """Test that refresh prices query is valid."""
-        result = validate_query("Refresh prices for my vacation")
-        assert result.is_valid is True
+        rejected = [r for r in caplog.records if getattr(r, "event", None) == "query_validator.rejected"]
+        assert len(rejected) == 2
 
 
 class TestIsQueryInScope:
@@ -272,6 +278,12 @@ class TestIsQueryInScope:
 class TestQueryValidationResult:
     """Tests for QueryValidationResult dataclass."""
 
+    def test_is_frozen(self):
+        """Test results are immutable, since cached instances are shared."""
+        result = QueryValidationResult(is_valid=True)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.is_valid = False  # type: ignore[misc]
+
     def test_default_values(self):
         """Test default values for QueryValidationResult."""
         result = QueryValidationResult(is_valid=True)
@@ -289,41 +301,3 @@ class TestQueryValidationResult:
         assert result.is_valid is False
         assert result.reason == "Test reason"
         assert result.confidence == 0.5
-
-
-class TestEdgeCases:
-    """Tests for edge cases and boundary conditions."""
-
-    def test_unicode_characters(self):
-        """Test handling of unicode characters."""
-        result = validate_query("Book a flight to París 🇫🇷")
-        assert result.is_valid is True
-
-    def test_very_long_query(self):
-        """Test handling of very long queries."""
-        long_query = "I want to track flight prices " * 100
-        result = validate_query(long_query)
-        assert result.is_valid is True
-
-    def test_special_characters(self):
-        """Test handling of special characters."""
-        result = validate_query("What's the price for SFO -> LAX?")
-        assert result.is_valid is True
-
-    def test_mixed_case_keywords(self):
-        """Test that mixed case keywords are detected."""
-        result = validate_query("Track FLIGHT prices to HAWAII")
-        assert result.is_valid is True
-
-    def test_sql_keyword_in_travel_context(self):
-        """Test that SQL-like words in travel context are OK."""
-        # "delete my trip" should be allowed
-        result = validate_query("Please delete my Seattle trip")
-        assert result.is_valid is True
-
-    def test_file_operation_in_travel_context(self):
-        """Test that file-like words in travel context are OK."""
-        # This might trigger file patterns but should still be valid
-        # because it's clearly about a trip
-        result = validate_query("Can you read my trip details")
-        assert result.is_valid is True
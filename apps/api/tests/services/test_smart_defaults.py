@@ -1,7 +1,9 @@
 """Tests for smart_defaults service with 95%+ coverage."""
 
+import re
 import uuid
 from datetime import date
+from unittest.mock import AsyncMock
 
 import pytest
 import pytest_asyncio
@@ -10,7 +12,10 @@ from app.models.user import User
 from app.services.smart_defaults import (
     DEFAULT_ADULTS,
     DEFAULT_THRESHOLD_PERCENTAGE,
+    DURATION_PATTERNS,
     SmartDefaults,
+    _default_adults_stmt,
+    _partial_match_city,
     get_default_adults,
     infer_return_date,
     parse_trip_duration_text,
@@ -18,207 +23,104 @@ from app.services.smart_defaults import (
     suggest_airports,
 )
 
+INFER_RETURN_DATE_CASES = [
+    pytest.param("a week in Hawaii", date(2026, 3, 15), date(2026, 3, 22), id="a-week"),
+    pytest.param("one week vacation", date(2026, 6, 1), date(2026, 6, 8), id="one-week"),
+    pytest.param("1 week trip", date(2026, 1, 10), date(2026, 1, 17), id="1-week"),
+    pytest.param("2 weeks in Europe", date(2026, 5, 1), date(2026, 5, 15), id="2-weeks"),
+    pytest.param("3 weeks backpacking", date(2026, 5, 1), date(2026, 5, 22), id="3-weeks"),
+    pytest.param("a weekend in Vegas", date(2026, 4, 10), date(2026, 4, 13), id="weekend"),
+    pytest.param("the weekend getaway", date(2026, 4, 10), date(2026, 4, 13), id="the-weekend"),
+    pytest.param("long weekend trip", date(2026, 7, 3), date(2026, 7, 7), id="long-weekend"),
+    pytest.param("5 days in Paris", date(2026, 8, 1), date(2026, 8, 6), id="5-days"),
+    pytest.param("10 day adventure", date(2026, 8, 1), date(2026, 8, 11), id="10-day"),
+    pytest.param("a day trip", date(2026, 2, 14), date(2026, 2, 15), id="a-day"),
+    # N nights = N+1 day trip
+    pytest.param("3 nights in Rome", date(2026, 9, 15), date(2026, 9, 19), id="3-nights"),
+    pytest.param("5 night hotel stay", date(2026, 9, 15), date(2026, 9, 21), id="5-night"),
+    pytest.param("one night in the city", date(2026, 3, 20), date(2026, 3, 22), id="one-night"),
+    pytest.param("a fortnight abroad", date(2026, 11, 1), date(2026, 11, 15), id="fortnight"),
+    pytest.param("trip to Hawaii", date(2026, 5, 1), None, id="no-duration"),
+    pytest.param("vacation plans", date(2026, 5, 1), None, id="no-duration-2"),
+    pytest.param("A WEEK IN HAWAII", date(2026, 4, 1), date(2026, 4, 8), id="uppercase"),
+    pytest.param("Long Weekend Trip", date(2026, 4, 1), date(2026, 4, 5), id="title-case"),
+    pytest.param(
+        "Planning a week in Hawaii with the family for summer",
+        date(2026, 6, 10),
+        date(2026, 6, 17),
+        id="embedded-in-text",
+    ),
+    pytest.param("a week celebrating new year", date(2026, 12, 28), date(2027, 1, 4), id="year-boundary"),
+]
+
+SUGGEST_AIRPORTS_CASES = [
+    pytest.param("San Francisco", ["SFO", "OAK", "SJC"], id="san-francisco"),
+    pytest.param("SF", ["SFO", "OAK", "SJC"], id="sf"),
+    pytest.param("bay area", ["SFO", "OAK", "SJC"], id="bay-area"),
+    pytest.param("NYC", ["JFK", "EWR", "LGA"], id="nyc"),
+    pytest.param("New York City", ["JFK", "EWR", "LGA"], id="new-york-city"),
+    pytest.param("Los Angeles", ["LAX", "BUR", "SNA", "ONT", "LGB"], id="los-angeles"),
+    pytest.param("LA", ["LAX", "BUR", "SNA", "ONT", "LGB"], id="la"),
+    pytest.param("Maui", ["OGG"], id="maui"),
+    pytest.param("Kauai", ["LIH"], id="kauai"),
+    pytest.param("Paris", ["CDG", "ORY"], id="paris"),
+    pytest.param("Unknown City XYZ", [], id="unknown"),
+    pytest.param("SAN FRANCISCO", ["SFO", "OAK", "SJC"], id="uppercase"),
+    pytest.param("  San Francisco  ", ["SFO", "OAK", "SJC"], id="padded"),
+    pytest.param("san fran", ["SFO", "OAK", "SJC"], id="partial-match"),
+]
+
+# Regions whose lists are longer; only the headline airports are pinned.
+SUGGEST_AIRPORTS_INCLUDES_CASES = [
+    pytest.param("Hawaii", {"HNL", "OGG"}, id="hawaii"),
+    pytest.param("London", {"LHR", "LGW"}, id="london"),
+    pytest.param("Tokyo", {"NRT", "HND"}, id="tokyo"),
+]
+
+PARSE_DURATION_CASES = [
+    pytest.param("a week in hawaii", 7, id="a-week"),
+    pytest.param("one week", 7, id="one-week"),
+    pytest.param("1 week", 7, id="1-week"),
+    pytest.param("2 weeks", 14, id="2-weeks"),
+    pytest.param("3 weeks abroad", 21, id="3-weeks"),
+    pytest.param("5 days", 5, id="5-days"),
+    pytest.param("a day trip", 1, id="a-day"),
+    # Nights add 1 for the trip duration
+    pytest.param("3 nights", 4, id="3-nights"),
+    pytest.param("5 nights in Paris", 6, id="5-nights"),
+    pytest.param("one night", 2, id="one-night"),
+    pytest.param("a weekend", 3, id="weekend"),
+    pytest.param("long weekend", 4, id="long-weekend"),
+    pytest.param("a fortnight", 14, id="fortnight"),
+    pytest.param("vacation plans", None, id="no-duration"),
+    pytest.param("trip somewhere", None, id="no-duration-2"),
+]
+
 
 class TestInferReturnDate:
     """Tests for infer_return_date function."""
 
-    def test_a_week(self):
-        """Test 'a week' duration."""
-        depart = date(2026, 3, 15)
-        result = infer_return_date("a week in Hawaii", depart)
-        assert result == date(2026, 3, 22)
-
-    def test_one_week(self):
-        """Test 'one week' duration."""
-        depart = date(2026, 6, 1)
-        result = infer_return_date("one week vacation", depart)
-        assert result == date(2026, 6, 8)
-
-    def test_1_week(self):
-        """Test '1 week' duration."""
-        depart = date(2026, 1, 10)
-        result = infer_return_date("1 week trip", depart)
-        assert result == date(2026, 1, 17)
-
-    def test_multiple_weeks(self):
-        """Test 'N weeks' duration."""
-        depart = date(2026, 5, 1)
-        result = infer_return_date("2 weeks in Europe", depart)
-        assert result == date(2026, 5, 15)
-
-        result = infer_return_date("3 weeks backpacking", depart)
-        assert result == date(2026, 5, 22)
-
-    def test_weekend(self):
-        """Test 'weekend' duration (3 days)."""
-        depart = date(2026, 4, 10)
-        result = infer_return_date("a weekend in Vegas", depart)
-        assert result == date(2026, 4, 13)
-
-        result = infer_return_date("the weekend getaway", depart)
-        assert result == date(2026, 4, 13)
-
-    def test_long_weekend(self):
-        """Test 'long weekend' duration (4 days)."""
-        depart = date(2026, 7, 3)
-        result = infer_return_date("long weekend trip", depart)
-        assert result == date(2026, 7, 7)
-
-    def test_days(self):
-        """Test 'N days' duration."""
-        depart = date(2026, 8, 1)
-        result = infer_return_date("5 days in Paris", depart)
-        assert result == date(2026, 8, 6)
-
-        result = infer_return_date("10 day adventure", depart)
-        assert result == date(2026, 8, 11)
-
-    def test_a_day(self):
-        """Test 'a day' duration."""
-        depart = date(2026, 2, 14)
-        result = infer_return_date("a day trip", depart)
-        assert result == date(2026, 2, 15)
-
-    def test_nights(self):
-        """Test 'N nights' duration (N+1 days)."""
-        depart = date(2026, 9, 15)
-        # 3 nights = 4 day trip
-        result = infer_return_date("3 nights in Rome", depart)
-        assert result == date(2026, 9, 19)
-
-        # 5 night stay = 6 day trip
-        result = infer_return_date("5 night hotel stay", depart)
-        assert result == date(2026, 9, 21)
-
-    def test_one_night(self):
-        """Test 'one night' duration (2 days)."""
-        depart = date(2026, 3, 20)
-        result = infer_return_date("one night in the city", depart)
-        assert result == date(2026, 3, 22)
-
-    def test_fortnight(self):
-        """Test 'fortnight' duration (14 days)."""
-        depart = date(2026, 11, 1)
-        result = infer_return_date("a fortnight abroad", depart)
-        assert result == date(2026, 11, 15)
-
-    def test_no_duration(self):
-        """Test text without duration returns None."""
-        depart = date(2026, 5, 1)
-        result = infer_return_date("trip to Hawaii", depart)
-        assert result is None
-
-        result = infer_return_date("vacation plans", depart)
-        assert result is None
-
-    def test_case_insensitive(self):
-        """Test pattern matching is case insensitive."""
-        depart = date(2026, 4, 1)
-        result = infer_return_date("A WEEK IN HAWAII", depart)
-        assert result == date(2026, 4, 8)
-
-        result = infer_return_date("Long Weekend Trip", depart)
-        assert result == date(2026, 4, 5)
-
-    def test_embedded_in_text(self):
-        """Test duration extraction from longer text."""
-        depart = date(2026, 6, 10)
-        result = infer_return_date("Planning a week in Hawaii with the family for summer", depart)
-        assert result == date(2026, 6, 17)
-
-    def test_year_boundary(self):
-        """Test return date crossing year boundary."""
-        depart = date(2026, 12, 28)
-        result = infer_return_date("a week celebrating new year", depart)
-        assert result == date(2027, 1, 4)
+    @pytest.mark.fast
+    @pytest.mark.parametrize(("text", "depart", "expected"), INFER_RETURN_DATE_CASES)
+    def test_infer_return_date(self, text, depart, expected):
+        """Test the return date inferred from each description."""
+        assert infer_return_date(text, depart) == expected
 
 
 class TestSuggestAirports:
     """Tests for suggest_airports function."""
 
-    def test_san_francisco_full(self):
-        """Test full 'San Francisco' name."""
-        result = suggest_airports("San Francisco")
-        assert result == ["SFO", "OAK", "SJC"]
-
-    def test_sf_abbreviation(self):
-        """Test 'SF' abbreviation."""
-        result = suggest_airports("SF")
-        assert result == ["SFO", "OAK", "SJC"]
-
-    def test_bay_area(self):
-        """Test 'Bay Area' region."""
-        result = suggest_airports("bay area")
-        assert result == ["SFO", "OAK", "SJC"]
-
-    def test_nyc(self):
-        """Test NYC airports."""
-        result = suggest_airports("NYC")
-        assert result == ["JFK", "EWR", "LGA"]
-
-    def test_new_york_city(self):
-        """Test 'New York City' full name."""
-        result = suggest_airports("New York City")
-        assert result == ["JFK", "EWR", "LGA"]
-
-    def test_los_angeles(self):
-        """Test Los Angeles airports."""
-        result = suggest_airports("Los Angeles")
-        assert result == ["LAX", "BUR", "SNA", "ONT", "LGB"]
-
-    def test_la_abbreviation(self):
-        """Test 'LA' abbreviation."""
-        result = suggest_airports("LA")
-        assert result == ["LAX", "BUR", "SNA", "ONT", "LGB"]
-
-    def test_hawaii(self):
-        """Test Hawaii region returns multiple islands."""
-        result = suggest_airports("Hawaii")
-        assert "HNL" in result
-        assert "OGG" in result  # Maui
-
-    def test_specific_island(self):
-        """Test specific Hawaiian island."""
-        result = suggest_airports("Maui")
-        assert result == ["OGG"]
-
-        result = suggest_airports("Kauai")
-        assert result == ["LIH"]
-
-    def test_international_cities(self):
-        """Test international city airports."""
-        result = suggest_airports("London")
-        assert "LHR" in result
-        assert "LGW" in result
-
-        result = suggest_airports("Tokyo")
-        assert "NRT" in result
-        assert "HND" in result
-
-        result = suggest_airports("Paris")
-        assert result == ["CDG", "ORY"]
-
-    def test_unknown_city(self):
-        """Test unknown city returns empty list."""
-        result = suggest_airports("Unknown City XYZ")
-        assert result == []
-
-    def test_case_insensitive(self):
-        """Test case insensitivity."""
-        result1 = suggest_airports("SAN FRANCISCO")
-        result2 = suggest_airports("san francisco")
-        result3 = suggest_airports("San Francisco")
-        assert result1 == result2 == result3
-
-    def test_whitespace_handling(self):
-        """Test whitespace is trimmed."""
-        result = suggest_airports("  San Francisco  ")
-        assert result == ["SFO", "OAK", "SJC"]
+    @pytest.mark.fast
+    @pytest.mark.parametrize(("city", "expected"), SUGGEST_AIRPORTS_CASES)
+    def test_suggest_airports(self, city, expected):
+        """Test the airports suggested for each city name."""
+        assert suggest_airports(city) == expected
 
-    def test_partial_match(self):
-        """Test partial city name matching."""
-        result = suggest_airports("san fran")
-        assert result == ["SFO", "OAK", "SJC"]
+    @pytest.mark.fast
+    @pytest.mark.parametrize(("city", "airports"), SUGGEST_AIRPORTS_INCLUDES_CASES)
+    def test_suggest_airports_includes(self, city, airports):
+        """Test multi-airport regions include their main airports."""
+        assert airports <= set(suggest_airports(city))
 
     def test_returns_copy(self):
         """Test returned list is a copy (not the original)."""
@@ -228,6 +130,19 @@ class TestSuggestAirports:
         result2 = suggest_airports("San Francisco")
         assert "TEST" not in result2
 
+    def test_partial_match_is_cached(self):
+        """Test repeated partial lookups reuse the cached table scan."""
+        _partial_match_city.cache_clear()
+
+        assert suggest_airports("san fran") == ["SFO", "OAK", "SJC"]
+        assert suggest_airports("San Fran ") == ["SFO", "OAK", "SJC"]
+        assert suggest_airports("Unknown City XYZ") == []
+        assert suggest_airports("Unknown City XYZ") == []
+
+        info = _partial_match_city.cache_info()
+        assert info.hits == 2
+        assert info.misses == 2
+
 
 class TestRecommendThreshold:
     """Tests for recommend_threshold function."""
@@ -285,6 +200,25 @@ class TestRecommendThreshold:
         result = recommend_threshold(1000)
         assert isinstance(result, float)
 
+    def test_zero_percentage_with_int_price_returns_float(self):
+        """Test an all-integer calculation still returns a float."""
+        result = recommend_threshold(1234, percentage=0)
+        assert result == 1230.0
+        assert isinstance(result, float)
+
+
+@pytest_asyncio.fixture
+async def test_user(test_session):
+    """Create a test user inside the rolled-back test session."""
+    user = User(
+        google_sub="test_google_sub_123",
+        email="test@example.com",
+        name="Test User",
+    )
+    test_session.add(user)
+    await test_session.flush()
+    return user
+
 
 class TestGetDefaultAdults:
     """Tests for get_default_adults async function."""
@@ -294,19 +228,6 @@ class TestGetDefaultAdults:
         """Use the test session from conftest."""
         return test_session
 
-    @pytest_asyncio.fixture
-    async def test_user(self, db_session):
-        """Create a test user."""
-        user = User(
-            google_sub="test_google_sub_123",
-            email="test@example.com",
-            name="Test User",
-        )
-        db_session.add(user)
-        await db_session.flush()
-        await db_session.refresh(user)
-        return user
-
     @pytest.mark.anyio
     async def test_no_trips_returns_default(self, db_session, test_user):
         """Test returns DEFAULT_ADULTS when user has no trips."""
@@ -338,6 +259,31 @@ class TestGetDefaultAdults:
         result = await get_default_adults("not-a-uuid", db_session)
         assert result == DEFAULT_ADULTS
 
+    def test_query_built_once(self):
+        """Test the adults query is built once and bound per call."""
+        stmt = _default_adults_stmt()
+        assert _default_adults_stmt() is stmt
+        assert "user_id" in stmt.compile().params
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        "user_id",
+        [
+            "",
+            "550e8400-e29b-41d4-a716-44665544000g",
+            "550e8400-e29b-41d4-a716-446655440000\n",
+        ],
+        ids=["empty", "non-hex", "trailing-newline"],
+    )
+    async def test_malformed_user_id_skips_database(self, user_id):
+        """Test malformed ids return the default without touching the database."""
+        db = AsyncMock()
+
+        result = await get_default_adults(user_id, db)
+
+        assert result == DEFAULT_ADULTS
+        db.execute.assert_not_awaited()
+
     @pytest.mark.anyio
     async def test_nonexistent_user_returns_default(self, db_session):
         """Test non-existent user returns default."""
@@ -349,41 +295,57 @@ class TestGetDefaultAdults:
 class TestParseTripDurationText:
     """Tests for parse_trip_duration_text function."""
 
-    def test_week_returns_7(self):
-        """Test week durations return 7."""
-        assert parse_trip_duration_text("a week in hawaii") == 7
-        assert parse_trip_duration_text("one week") == 7
-        assert parse_trip_duration_text("1 week") == 7
+    @pytest.mark.fast
+    @pytest.mark.parametrize(("text", "expected"), PARSE_DURATION_CASES)
+    def test_parse_trip_duration_text(self, text, expected):
+        """Test the day count parsed from each text."""
+        assert parse_trip_duration_text(text) == expected
+
+
+# The two shapes that let a backtracking engine go exponential on a near-miss:
+# a repeated group whose body is itself quantified, e.g. "(\d+)+" or "(?:x+)*",
+# and a repeated alternation whose branches can overlap, e.g. "(a|aa)+".
+# An optional group ("(?:a|the)?") matches at most once and is not flagged.
+# Non-capturing/named group openers are rewritten to "(" first so their "?"
+# isn't mistaken for a quantifier.
+_GROUP_OPENER_RE = re.compile(r"\(\?(?::|P<\w+>)")
+_NESTED_QUANTIFIER_RE = re.compile(r"\([^()]*[*+?}][^()]*\)[*+?{]")
+_REPEATED_ALTERNATION_RE = re.compile(r"\([^()]*\|[^()]*\)[*+{]")
 
-    def test_multiple_weeks(self):
-        """Test multiple weeks."""
-        assert parse_trip_duration_text("2 weeks") == 14
-        assert parse_trip_duration_text("3 weeks abroad") == 21
 
-    def test_days(self):
-        """Test day durations."""
-        assert parse_trip_duration_text("5 days") == 5
-        assert parse_trip_duration_text("a day trip") == 1
+def _is_backtracking_prone(pattern: str) -> bool:
+    plain = _GROUP_OPENER_RE.sub("(", pattern)
+    return bool(_NESTED_QUANTIFIER_RE.search(plain) or _REPEATED_ALTERNATION_RE.search(plain))
 
-    def test_nights_plus_one(self):
-        """Test nights add 1 for trip duration."""
-        assert parse_trip_duration_text("3 nights") == 4
-        assert parse_trip_duration_text("5 nights in Paris") == 6
-        assert parse_trip_duration_text("one night") == 2
 
-    def test_weekend(self):
-        """Test weekend durations."""
-        assert parse_trip_duration_text("a weekend") == 3
-        assert parse_trip_duration_text("long weekend") == 4
+# (pattern, expected) - pins which shapes the detector recognizes
+BACKTRACKING_SHAPE_CASES = [
+    pytest.param(r"\b(\d+\s*)+days\b", True, id="nested-quantifier"),
+    pytest.param(r"(?:x+)*", True, id="non-capturing-nested-quantifier"),
+    pytest.param(r"(a|aa)+", True, id="repeated-overlapping-alternation"),
+    pytest.param(r"\b(?:a|the)?\s*weekend\b", False, id="optional-alternation"),
+    pytest.param(r"\b(\d+)\s*days?\b", False, id="quantified-capture-not-repeated"),
+]
 
-    def test_fortnight(self):
-        """Test fortnight is 14 days."""
-        assert parse_trip_duration_text("a fortnight") == 14
 
-    def test_no_duration(self):
-        """Test no duration returns None."""
-        assert parse_trip_duration_text("vacation plans") is None
-        assert parse_trip_duration_text("trip somewhere") is None
+class TestDurationPatternShape:
+    """Duration patterns must stay free of backtracking-prone shapes.
+
+    Without nested quantifiers or repeated overlapping alternations, a
+    backtracking regex engine matches in linear time.
+    """
+
+    @pytest.mark.fast
+    @pytest.mark.parametrize(("pattern", "expected"), BACKTRACKING_SHAPE_CASES)
+    def test_detector_recognizes_shape(self, pattern, expected):
+        """Test the shape detector flags exactly the backtracking-prone patterns."""
+        assert _is_backtracking_prone(pattern) is expected
+
+    @pytest.mark.fast
+    @pytest.mark.parametrize("pattern", [pattern for pattern, _ in DURATION_PATTERNS])
+    def test_duration_patterns_are_not_backtracking_prone(self, pattern):
+        """Test no duration pattern has a backtracking-prone shape."""
+        assert not _is_backtracking_prone(pattern)
 
 
 class TestSmartDefaultsClass:
@@ -424,16 +386,13 @@ class TestSmartDefaultsClass:
     @pytest.mark.anyio
     async def test_get_default_adults_with_db(self, test_session):
         """Test get_default_adults uses db when provided."""
-        # Create user and trip
+        # Create user and trip; ids are generated client-side, so one flush
+        # inserts both
         user = User(
             google_sub="class_test_user",
             email="class_test@example.com",
             name="Class Test",
         )
-        test_session.add(user)
-        await test_session.flush()
-        await test_session.refresh(user)
-
         trip = Trip(
             user_id=user.id,
             name="Test Trip",
@@ -443,7 +402,7 @@ class TestSmartDefaultsClass:
             return_date=date(2026, 3, 5),
             adults=3,
         )
-        test_session.add(trip)
+        test_session.add_all([user, trip])
         await test_session.flush()
 
         sd = SmartDefaults(db=test_session)
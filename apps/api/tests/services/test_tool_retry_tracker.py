@@ -10,6 +10,7 @@ Coverage targets:
 
 from __future__ import annotations
 
+import pytest
 from app.services.chat import MAX_TOOL_RETRIES, ToolRetryTracker
 
 
@@ -32,122 +33,60 @@ class TestToolRetryTrackerInit:
         assert len(tracker._counts) == 0
 
 
-class TestRecordCall:
-    """Tests for ToolRetryTracker.record_call method."""
-
-    def test_record_single_call(self):
-        """Test recording a single tool call."""
-        tracker = ToolRetryTracker()
-        tracker.record_call("list_trips")
-        assert tracker.get_count("list_trips") == 1
-
-    def test_record_multiple_calls_same_tool(self):
-        """Test recording multiple calls to the same tool."""
-        tracker = ToolRetryTracker()
-        tracker.record_call("list_trips")
-        tracker.record_call("list_trips")
-        tracker.record_call("list_trips")
-        assert tracker.get_count("list_trips") == 3
-
-    def test_record_calls_different_tools(self):
-        """Test recording calls to different tools."""
-        tracker = ToolRetryTracker()
-        tracker.record_call("list_trips")
-        tracker.record_call("get_trip_details")
-        tracker.record_call("list_trips")
-        assert tracker.get_count("list_trips") == 2
-        assert tracker.get_count("get_trip_details") == 1
-
-
-class TestIsExceeded:
-    """Tests for ToolRetryTracker.is_exceeded method."""
-
-    def test_not_exceeded_initially(self):
-        """Test that tool is not exceeded initially."""
-        tracker = ToolRetryTracker(max_retries=3)
-        assert tracker.is_exceeded("list_trips") is False
-
-    def test_not_exceeded_below_limit(self):
-        """Test that tool is not exceeded below limit."""
-        tracker = ToolRetryTracker(max_retries=3)
-        tracker.record_call("list_trips")
-        tracker.record_call("list_trips")
-        assert tracker.is_exceeded("list_trips") is False
-
-    def test_exceeded_at_limit(self):
-        """Test that tool is exceeded at limit."""
-        tracker = ToolRetryTracker(max_retries=3)
-        tracker.record_call("list_trips")
-        tracker.record_call("list_trips")
-        tracker.record_call("list_trips")
-        assert tracker.is_exceeded("list_trips") is True
-
-    def test_exceeded_above_limit(self):
-        """Test that tool remains exceeded above limit."""
-        tracker = ToolRetryTracker(max_retries=3)
-        for _ in range(5):
-            tracker.record_call("list_trips")
-        assert tracker.is_exceeded("list_trips") is True
-
-    def test_one_tool_exceeded_others_not(self):
-        """Test that exceeding one tool doesn't affect others."""
-        tracker = ToolRetryTracker(max_retries=2)
-        tracker.record_call("list_trips")
-        tracker.record_call("list_trips")
-        tracker.record_call("get_trip_details")
-        assert tracker.is_exceeded("list_trips") is True
-        assert tracker.is_exceeded("get_trip_details") is False
-
-
-class TestGetCount:
-    """Tests for ToolRetryTracker.get_count method."""
-
-    def test_get_count_unknown_tool(self):
-        """Test getting count for unknown tool returns 0."""
-        tracker = ToolRetryTracker()
-        assert tracker.get_count("unknown_tool") == 0
-
-    def test_get_count_tracked_tool(self):
-        """Test getting count for tracked tool."""
-        tracker = ToolRetryTracker()
-        tracker.record_call("list_trips")
-        tracker.record_call("list_trips")
-        assert tracker.get_count("list_trips") == 2
-
-
-class TestGetExceededTools:
-    """Tests for ToolRetryTracker.get_exceeded_tools method."""
-
-    def test_no_exceeded_tools_initially(self):
-        """Test that no tools are exceeded initially."""
-        tracker = ToolRetryTracker()
-        assert tracker.get_exceeded_tools() == []
-
-    def test_no_exceeded_tools_below_limit(self):
-        """Test that no tools are exceeded below limit."""
-        tracker = ToolRetryTracker(max_retries=3)
-        tracker.record_call("list_trips")
-        tracker.record_call("get_trip_details")
-        assert tracker.get_exceeded_tools() == []
-
-    def test_single_exceeded_tool(self):
-        """Test single exceeded tool is returned."""
-        tracker = ToolRetryTracker(max_retries=2)
-        tracker.record_call("list_trips")
-        tracker.record_call("list_trips")
-        assert tracker.get_exceeded_tools() == ["list_trips"]
-
-    def test_multiple_exceeded_tools(self):
-        """Test multiple exceeded tools are returned."""
-        tracker = ToolRetryTracker(max_retries=2)
-        tracker.record_call("list_trips")
-        tracker.record_call("list_trips")
-        tracker.record_call("get_trip_details")
-        tracker.record_call("get_trip_details")
-        exceeded = tracker.get_exceeded_tools()
-        assert len(exceeded) == 2
-        assert "list_trips" in exceeded
-        assert "get_trip_details" in exceeded
+# (max_retries, calls recorded in order, expected count per tool, expected
+# exceeded tools in the order they were first called)
+CALL_SEQUENCE_CASES = [
+    pytest.param(3, (), {"list_trips": 0, "unknown_tool": 0}, [], id="no-calls"),
+    pytest.param(3, ("list_trips",), {"list_trips": 1}, [], id="single-call"),
+    pytest.param(3, ("list_trips",) * 2, {"list_trips": 2}, [], id="below-limit"),
+    pytest.param(3, ("list_trips",) * 3, {"list_trips": 3}, ["list_trips"], id="at-limit"),
+    pytest.param(3, ("list_trips",) * 5, {"list_trips": 5}, ["list_trips"], id="above-limit"),
+    pytest.param(
+        3,
+        ("list_trips", "get_trip_details", "list_trips"),
+        {"list_trips": 2, "get_trip_details": 1},
+        [],
+        id="different-tools",
+    ),
+    pytest.param(
+        2,
+        ("list_trips", "list_trips", "get_trip_details"),
+        {"list_trips": 2, "get_trip_details": 1},
+        ["list_trips"],
+        id="one-tool-exceeded",
+    ),
+    pytest.param(
+        2,
+        ("list_trips", "list_trips", "get_trip_details", "get_trip_details"),
+        {"list_trips": 2, "get_trip_details": 2},
+        ["list_trips", "get_trip_details"],
+        id="multiple-exceeded",
+    ),
+    pytest.param(
+        2,
+        ("list_trips", "get_trip_details", "get_trip_details", "list_trips", "list_trips"),
+        {"list_trips": 3, "get_trip_details": 2},
+        ["list_trips", "get_trip_details"],
+        id="exceeded-in-first-call-order",
+    ),
+]
+
+
+class TestCallTracking:
+    """Tests for record_call, get_count, is_exceeded and get_exceeded_tools."""
+
+    @pytest.mark.fast
+    @pytest.mark.parametrize(("max_retries", "calls", "counts", "exceeded"), CALL_SEQUENCE_CASES)
+    def test_call_sequence(self, max_retries, calls, counts, exceeded):
+        """Test counts and limits after recording a sequence of calls."""
+        tracker = ToolRetryTracker(max_retries=max_retries)
+        for tool_name in calls:
+            tracker.record_call(tool_name)
+
+        for tool_name, count in counts.items():
+            assert tracker.get_count(tool_name) == count
+            assert tracker.is_exceeded(tool_name) is (tool_name in exceeded)
+        assert tracker.get_exceeded_tools() == exceeded
 
 
 class TestReset:
@@ -208,3 +147,11 @@ class TestIntegration:
         tracker = ToolRetryTracker(max_retries=0)
         # Tool is exceeded even before first call
         assert tracker.is_exceeded("list_trips") is True
+
+    def test_reads_do_not_create_entries(self):
+        """Test checking an unseen tool does not start tracking it."""
+        tracker = ToolRetryTracker(max_retries=0)
+        assert tracker.is_exceeded("list_trips") is True
+        assert tracker.get_count("list_trips") == 0
+        # Only tools that were actually called are reported
+        assert tracker.get_exceeded_tools() == []
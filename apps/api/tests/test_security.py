@@ -2,7 +2,9 @@
 
 from datetime import UTC, datetime, timedelta
 
+import app.core.security as security_module
 import jwt
+import pytest
 from app.core.config import settings
 from app.core.constants import JWTClaims, TokenType
 from app.core.security import (
@@ -14,10 +16,28 @@ from app.core.security import (
 )
 
 
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin the clock token creation reads so expiry claims are exact.
+
+    Frozen at the real current second (JWT ``exp`` has whole-second
+    precision) so ``jwt.decode`` still accepts the token as unexpired.
+    """
+    now = datetime.now(UTC).replace(microsecond=0)
+
+    class _FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now.astimezone(tz)
+
+    monkeypatch.setattr(security_module, "datetime", _FrozenDatetime)
+    return now
+
+
 class TestTokenCreation:
     """Test JWT token creation."""
 
-    def test_create_access_token(self):
+    def test_create_access_token(self, frozen_now):
         """Test access token creation with correct claims."""
         user_id = "123e4567-e89b-12d3-a456-426614174000"
         token = create_access_token(data={JWTClaims.SUBJECT: user_id})
@@ -29,12 +49,10 @@ class TestTokenCreation:
         assert payload[JWTClaims.TYPE] == TokenType.ACCESS.value
         assert JWTClaims.EXPIRATION in payload
 
-        # Verify expiration is approximately correct (within 1 minute)
         exp_time = datetime.fromtimestamp(payload[JWTClaims.EXPIRATION], tz=UTC)
-        expected_exp = datetime.now(UTC) + timedelta(minutes=settings.access_token_expire_minutes)
-        assert abs((exp_time - expected_exp).total_seconds()) < 60
+        assert exp_time == frozen_now + timedelta(minutes=settings.access_token_expire_minutes)
 
-    def test_create_refresh_token(self):
+    def test_create_refresh_token(self, frozen_now):
         """Test refresh token creation with correct claims."""
         user_id = "123e4567-e89b-12d3-a456-426614174000"
         token = create_refresh_token(data={JWTClaims.SUBJECT: user_id})
@@ -46,10 +64,8 @@ class TestTokenCreation:
         assert payload[JWTClaims.TYPE] == TokenType.REFRESH.value
         assert JWTClaims.EXPIRATION in payload
 
-        # Verify expiration is approximately correct (within 1 minute)
         exp_time = datetime.fromtimestamp(payload[JWTClaims.EXPIRATION], tz=UTC)
-        expected_exp = datetime.now(UTC) + timedelta(days=settings.refresh_token_expire_days)
-        assert abs((exp_time - expected_exp).total_seconds()) < 60
+        assert exp_time == frozen_now + timedelta(days=settings.refresh_token_expire_days)
 
     def test_token_immutability(self):
         """Test that original data dict is not modified."""
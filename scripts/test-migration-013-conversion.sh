@@ -5,7 +5,7 @@
 # which only exercises 013's skip path (columns already VARCHAR). This script
 # rebuilds the create_all-era shape the migration actually exists for — native
 # enum types whose labels and stored data are the StrEnum member NAMES, as
-# verified on prod — at revision 012, then runs `upgrade head` and asserts the
+# verified on prod — at revision 012, then upgrades to 013 and asserts the
 # columns became VARCHAR, the data was normalized (including the one mapping
 # where lower(name) != value: ONE_STOP -> '1-stop'), and the types are gone.
 set -euo pipefail
@@ -97,7 +97,9 @@ INSERT INTO notification_rules (id, trip_id, threshold_type, threshold_value)
           '00000000-0000-0000-0000-000000000002', 'TRIP_TOTAL', 100.00);
 SQL
 
-uv run alembic upgrade head
+# Pin the target rather than `head` so later revisions don't move the
+# version_num assertion below.
+uv run alembic upgrade 013_enum_cols_to_varchar
 
 fail=0
 check() {